@@ -105,6 +105,11 @@ const MemoryUsageBar: React.FC<{
               <b>kernel:</b> {asGBorMB(kernel.memory)}
             </span>
           )}
+          {kernel?.shared_memory && (
+            <span>
+              <b>kernel virtual files:</b> {asGBorMB(kernel.shared_memory)}
+            </span>
+          )}
         </div>
       }
     >
@@ -0,0 +1,39 @@
+/* Copyright 2024 Marimo. All rights reserved. */
+import { expect, describe, it } from "vitest";
+import { applyOutputDeltas, stackOutputItems } from "../outputDeltas";
+
+describe("applyOutputDeltas", () => {
+  it("appends, replaces and truncates items", () => {
+    const items = applyOutputDeltas(
+      ["stale"],
+      [
+        { kind: "truncate", index: 0 },
+        { kind: "append", index: 0, data: "a" },
+        { kind: "append", index: 1, data: "b" },
+        { kind: "append", index: 2, data: "c" },
+        { kind: "replace", index: 1, data: "B" },
+      ],
+    );
+    expect(items).toEqual(["a", "B", "c"]);
+    const truncated = applyOutputDeltas(items, [
+      { kind: "truncate", index: 1 },
+    ]);
+    expect(truncated).toEqual(["a"]);
+  });
+
+  it("does not mutate the items", () => {
+    const items = ["a"];
+    applyOutputDeltas(items, [{ kind: "append", index: 1, data: "b" }]);
+    expect(items).toEqual(["a"]);
+  });
+});
+
+describe("stackOutputItems", () => {
+  it("stacks items like mo.vstack", () => {
+    const output = stackOutputItems(["<b>a</b>", "b"], 1);
+    expect(output.mimetype).toBe("text/html");
+    expect(output.data).toBe(
+      "<div style='display: flex;flex: 1;flex-direction: column;justify-content: flex-start;align-items: normal;flex-wrap: nowrap;gap: 0.5rem'><div><b>a</b></div><div>b</div></div>",
+    );
+  });
+});
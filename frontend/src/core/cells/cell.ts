@@ -6,6 +6,7 @@ import { collapseConsoleOutputs } from "./collapseConsoleOutputs";
 import { parseOutline } from "../dom/outline";
 import { type Seconds, Time } from "@/utils/time";
 import { invariant } from "@/utils/invariant";
+import { applyOutputDeltas, stackOutputItems } from "./outputDeltas";
 
 export function transitionCell(
   cell: CellRuntimeState,
@@ -68,7 +69,20 @@ export function transitionCell(
       logNever(message.status);
   }
 
-  nextCell.output = message.output ?? nextCell.output;
+  if (message.output_delta) {
+    // Only the changed items of an imperatively built output are sent
+    nextCell.outputItems = applyOutputDeltas(
+      nextCell.outputItems ?? [],
+      message.output_delta,
+    );
+    nextCell.output = stackOutputItems(
+      nextCell.outputItems,
+      message.timestamp,
+    );
+  } else if (message.output) {
+    nextCell.outputItems = null;
+    nextCell.output = message.output;
+  }
   nextCell.staleInputs = message.stale_inputs ?? nextCell.staleInputs;
   nextCell.status = message.status ?? nextCell.status;
 
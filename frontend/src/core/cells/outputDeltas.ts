@@ -0,0 +1,51 @@
+/* Copyright 2024 Marimo. All rights reserved. */
+import { logNever } from "@/utils/assertNever";
+import type { OutputDelta, OutputMessage } from "../kernel/messages";
+
+// Matches the markup of mo.vstack(items) in the kernel
+const STACK_STYLE =
+  "display: flex;flex: 1;flex-direction: column;justify-content: flex-start;align-items: normal;flex-wrap: nowrap;gap: 0.5rem";
+
+/**
+ * Apply deltas to the items of an output built imperatively
+ * (mo.output.append(), progress bars, ...), without mutating them.
+ */
+export function applyOutputDeltas(
+  items: readonly string[],
+  deltas: readonly OutputDelta[],
+): string[] {
+  const next = [...items];
+  for (const delta of deltas) {
+    switch (delta.kind) {
+      case "append":
+        next.length = Math.min(next.length, delta.index);
+        next.push(delta.data ?? "");
+        break;
+      case "replace":
+        next[delta.index] = delta.data ?? "";
+        break;
+      case "truncate":
+        next.length = Math.min(next.length, delta.index);
+        break;
+      default:
+        logNever(delta.kind);
+    }
+  }
+  return next;
+}
+
+/**
+ * The output of a cell built from deltas.
+ */
+export function stackOutputItems(
+  items: readonly string[],
+  timestamp: number,
+): OutputMessage {
+  const children = items.map((item) => `<div>${item}</div>`).join("");
+  return {
+    channel: "output",
+    mimetype: "text/html",
+    data: `<div style='${STACK_STYLE}'>${children}</div>`,
+    timestamp,
+  };
+}
@@ -80,6 +80,8 @@ export interface CellData {
 export interface CellRuntimeState {
   /** a message encoding the cell's output */
   output: OutputMessage | null;
+  /** items of an output built from deltas (mo.output.append(), ...) */
+  outputItems?: string[] | null;
   /** TOC outline */
   outline: Outline | null;
   /** messages encoding the cell's console outputs. */
@@ -27,6 +27,10 @@ export const KnownQueryParams = {
    * Kiosk mode. If the editor is running in kiosk mode
    */
   kiosk: "kiosk",
+  /**
+   * Whether the kernel should send websocket messages as binary frames
+   */
+  binary: "binary",
   /**
    * VSCode mode. If the editor is running inside VSCode
    */
@@ -130,6 +130,7 @@ export class IslandsPyodideBridge implements RunRequests, EditRequests {
   sendCopy = throwNotImplemented;
   sendRunScratchpad = throwNotImplemented;
   sendStdin = throwNotImplemented;
+  readConsoleHistory = throwNotImplemented;
   sendInterrupt = throwNotImplemented;
   sendShutdown = throwNotImplemented;
   sendFormat = throwNotImplemented;
@@ -22,6 +22,7 @@ export type DataSourceConnection = schemas["DataSourceConnection"];
 export type OutputChannel = schemas["CellChannel"];
 export type MarimoError = schemas["Error"];
 export type OutputMessage = schemas["CellOutput"];
+export type OutputDelta = schemas["OutputDelta"];
 export type CompletionOption = schemas["CompletionResult"]["options"][0];
 export type CompletionResultMessage = OperationMessageData<"completion-result">;
 export type HumanReadableStatus = schemas["HumanReadableStatus"];
@@ -136,6 +136,13 @@ export function createNetworkRequests(): EditRequests & RunRequests {
         })
         .then(handleResponseReturnNull);
     },
+    readConsoleHistory: (request) => {
+      return marimoClient
+        .POST("/api/kernel/console_history", {
+          body: request,
+        })
+        .then(handleResponse);
+    },
     sendInstallMissingPackages: (request) => {
       return marimoClient
         .POST("/api/kernel/install_missing_packages", {
@@ -47,6 +47,7 @@ export function createStaticRequests(): EditRequests & RunRequests {
     saveAppConfig: throwNotInEditMode,
     saveCellConfig: throwNotInEditMode,
     sendStdin: throwNotInEditMode,
+    readConsoleHistory: throwNotInEditMode,
     readCode: throwNotInEditMode,
     readSnippets: throwNotInEditMode,
     previewDatasetColumn: throwNotInEditMode,
@@ -28,6 +28,7 @@ export function createErrorToastingRequests(
     saveAppConfig: "Failed to save app config",
     saveCellConfig: "Failed to save cell config",
     sendStdin: "Failed to send stdin",
+    readConsoleHistory: "Failed to fetch console history",
     readCode: "Failed to read code",
     readSnippets: "Failed to fetch snippets",
     previewDatasetColumn: "Failed to fetch data sources",
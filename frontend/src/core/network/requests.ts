@@ -33,6 +33,7 @@ export const {
   sendSave,
   sendCopy,
   sendStdin,
+  readConsoleHistory,
   sendFormat,
   sendInterrupt,
   sendShutdown,
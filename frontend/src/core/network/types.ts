@@ -61,6 +61,8 @@ export type SaveAppConfigurationRequest =
   schemas["SaveAppConfigurationRequest"];
 export type SaveNotebookRequest = schemas["SaveNotebookRequest"];
 export type CopyNotebookRequest = schemas["CopyNotebookRequest"];
+export type ConsoleHistoryRequest = schemas["ConsoleHistoryRequest"];
+export type ConsoleHistoryResponse = schemas["ConsoleHistoryResponse"];
 export type SaveUserConfigurationRequest =
   schemas["SaveUserConfigurationRequest"];
 export interface SetCellConfigRequest {
@@ -102,6 +104,9 @@ export interface EditRequests {
   sendSave: (request: SaveNotebookRequest) => Promise<null>;
   sendCopy: (request: CopyNotebookRequest) => Promise<null>;
   sendStdin: (request: StdinRequest) => Promise<null>;
+  readConsoleHistory: (
+    request: ConsoleHistoryRequest,
+  ) => Promise<ConsoleHistoryResponse>;
   sendRun: (request: RunRequest) => Promise<null>;
   sendRunScratchpad: (request: RunScratchpadRequest) => Promise<null>;
   sendInterrupt: () => Promise<null>;
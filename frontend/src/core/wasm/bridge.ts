@@ -234,6 +234,11 @@ export class PyodideBridge implements RunRequests, EditRequests {
     return null;
   };
 
+  readConsoleHistory: EditRequests["readConsoleHistory"] = async () => {
+    // Consoles are not bounded in WASM, so there is no history to read
+    return { outputs: [], total: 0 };
+  };
+
   sendRun: EditRequests["sendRun"] = async (request) => {
     await this.rpc.proxy.request.loadPackages(request.codes.join("\n"));
 
@@ -66,4 +66,19 @@ describe("createWsUrl", () => {
     );
     expect(url.searchParams.get(KnownQueryParams.sessionId)).toBe(sessionId);
   });
+
+  it("should request binary frames when asked to", () => {
+    Object.defineProperty(document, "baseURI", {
+      value: "http://marimo.app/",
+      writable: true,
+    });
+    Object.defineProperty(window, "location", {
+      value: { search: "" },
+      writable: true,
+    });
+
+    const result = createWsUrl("1234", { binary: true });
+    const url = new URL(result, document.baseURI);
+    expect(url.searchParams.get(KnownQueryParams.binary)).toBe("true");
+  });
 });
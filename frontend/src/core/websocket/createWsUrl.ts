@@ -2,9 +2,17 @@
 import { Strings } from "@/utils/strings";
 import { KnownQueryParams } from "../constants";
 
-export function createWsUrl(sessionId: string): string {
+export function createWsUrl(
+  sessionId: string,
+  opts: { binary?: boolean } = {},
+): string {
   const searchParams = new URLSearchParams(window.location.search);
   searchParams.set(KnownQueryParams.sessionId, sessionId);
+  if (opts.binary) {
+    // Receive messages as UTF-8 encoded binary frames, which the server
+    // can forward from the kernel without re-encoding.
+    searchParams.set(KnownQueryParams.binary, "true");
+  }
   return resolveToWsUrl(`ws?${searchParams.toString()}`);
 }
 
@@ -46,6 +46,20 @@ import { reloadSafe } from "@/utils/reload-safe";
 import { useRunsActions } from "../cells/runs";
 import { useDataSourceActions } from "../datasets/data-source-connections";
 
+const textDecoder = new TextDecoder();
+
+/**
+ * Messages arrive as text, or as UTF-8 encoded JSON in binary mode.
+ */
+function decodeMessage(
+  data: JsonString<OperationMessage> | ArrayBuffer,
+): JsonString<OperationMessage> {
+  if (typeof data === "string") {
+    return data;
+  }
+  return textDecoder.decode(data) as JsonString<OperationMessage>;
+}
+
 /**
  * WebSocket that connects to the Marimo kernel and handles incoming messages.
  */
@@ -74,8 +88,10 @@ export function useMarimoWebSocket(opts: {
   const setKioskMode = useSetAtom(kioskModeAtom);
   const setCapabilities = useSetAtom(capabilitiesAtom);
 
-  const handleMessage = (e: MessageEvent<JsonString<OperationMessage>>) => {
-    const msg = jsonParseWithSpecialChar(e.data);
+  const handleMessage = (
+    e: MessageEvent<JsonString<OperationMessage> | ArrayBuffer>,
+  ) => {
+    const msg = jsonParseWithSpecialChar(decodeMessage(e.data));
     switch (msg.op) {
       case "reload":
         reloadSafe();
@@ -241,7 +257,8 @@ export function useMarimoWebSocket(opts: {
     /**
      * Unique URL for this session.
      */
-    url: createWsUrl(sessionId),
+    url: createWsUrl(sessionId, { binary: true }),
+    binaryType: "arraybuffer",
 
     /**
      * Open callback. Set the connection status to open.
@@ -10,6 +10,10 @@ import { Logger } from "@/utils/Logger";
 interface UseWebSocketOptions {
   url: string;
   static: boolean;
+  /**
+   * How binary messages are exposed to `onMessage`.
+   */
+  binaryType?: BinaryType;
   onOpen?: (event: WebSocketEventMap["open"]) => void;
   onMessage?: (event: WebSocketEventMap["message"]) => void;
   onClose?: (event: WebSocketEventMap["close"]) => void;
@@ -22,7 +26,8 @@ interface UseWebSocketOptions {
  * We use the WebSocket from partysocket, which is a wrapper around the native WebSocket API with reconnect logic.
  */
 export function useWebSocket(options: UseWebSocketOptions) {
-  const { onOpen, onMessage, onClose, onError, ...rest } = options;
+  const { onOpen, onMessage, onClose, onError, binaryType, ...rest } =
+    options;
 
   // eslint-disable-next-line react/hook-use-state
   const [ws] = useState<IReconnectingWebSocket>(() => {
@@ -40,6 +45,10 @@ export function useWebSocket(options: UseWebSocketOptions) {
             connectionTimeout: 10_000,
           });
 
+    if (binaryType) {
+      socket.binaryType = binaryType;
+    }
+
     onOpen && socket.addEventListener("open", onOpen);
     onClose && socket.addEventListener("close", onClose);
     onError && socket.addEventListener("error", onError);
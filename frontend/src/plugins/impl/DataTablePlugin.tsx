@@ -93,6 +93,7 @@ type Functions = {
     filters?: ConditionType[];
     page_number: number;
     page_size: number;
+    format?: "default" | "arrow";
   }) => Promise<{
     data: TableData<T>;
     total_rows: number;
@@ -167,6 +168,7 @@ export const DataTablePlugin = createPlugin<S>("marimo-table")
           filters: z.array(ConditionSchema).optional(),
           page_number: z.number(),
           page_size: z.number(),
+          format: z.enum(["default", "arrow"]).optional(),
         }),
       )
       .output(
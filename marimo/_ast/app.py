@@ -167,11 +167,13 @@ class AppKernelRunnerRegistry:
         return len(self._runners)
 
     def get_runner(self, app: App) -> AppKernelRunner:
-        app_runners = self._runners.setdefault(threading.get_ident(), {})
-        runner = app_runners.get(app, None)
+        tid = threading.get_ident()
+        runner = self._runners.get(tid, {}).get(app, None)
         if runner is None:
             runner = AppKernelRunner(InternalApp(app))
-            app_runners[app] = runner
+            # Creating the runner can collect other apps, whose destructors
+            # remove this thread's mapping if it is empty; look it up again.
+            self._runners.setdefault(tid, {})[app] = runner
         return runner
 
     def remove_runner(self, app: App) -> None:
@@ -132,6 +132,13 @@ class CellOutput:
     output: Any = None
 
 
+@dataclasses.dataclass
+class CellRunStats:
+    # Approximate bytes copied for the inputs of the last run (strict
+    # execution only)
+    bytes_copied: int = 0
+
+
 @dataclasses.dataclass
 class ParsedSQLStatements:
     parsed: Optional[list[str]] = None
@@ -174,6 +181,8 @@ class CellImpl:
     _stale: CellStaleState = dataclasses.field(default_factory=CellStaleState)
     # cells can optionally hold a reference to their output
     _output: CellOutput = dataclasses.field(default_factory=CellOutput)
+    # statistics of the last run
+    _run_stats: CellRunStats = dataclasses.field(default_factory=CellRunStats)
     # parsed sql statements
     _sqls: ParsedSQLStatements = dataclasses.field(
         default_factory=ParsedSQLStatements
@@ -377,6 +386,14 @@ class CellImpl:
     def output(self) -> Any:
         return self._output.output
 
+    def set_bytes_copied(self, nbytes: int) -> None:
+        self._run_stats.bytes_copied = nbytes
+
+    @property
+    def bytes_copied(self) -> int:
+        """Approximate bytes copied for the inputs of the last run."""
+        return self._run_stats.bytes_copied
+
 
 @dataclasses.dataclass
 class Cell:
@@ -567,6 +567,23 @@ Example:
     type=int,
     help=("Seconds to wait before closing a session on websocket disconnect."),
 )
+@click.option(
+    "--kernel-pool-size",
+    default=0,
+    show_default=True,
+    type=int,
+    help=(
+        "Number of kernels to keep pre-initialized, with the notebook "
+        "already run, so that new sessions start instantly."
+    ),
+)
+@click.option(
+    "--kernel-pool-ttl",
+    default=None,
+    show_default=True,
+    type=int,
+    help="Seconds after which an unused pre-initialized kernel is replaced.",
+)
 @click.option(
     "--watch",
     is_flag=True,
@@ -620,6 +637,8 @@ def run(
     token_password: Optional[str],
     include_code: bool,
     session_ttl: int,
+    kernel_pool_size: int,
+    kernel_pool_ttl: Optional[int],
     watch: bool,
     base_url: str,
     allow_origins: tuple[str, ...],
@@ -669,6 +688,8 @@ def run(
         mode=SessionMode.RUN,
         include_code=include_code,
         ttl_seconds=session_ttl,
+        kernel_pool_size=kernel_pool_size,
+        kernel_pool_ttl_seconds=kernel_pool_ttl,
         watch=watch,
         base_url=base_url,
         allow_origins=allow_origins,
@@ -152,6 +152,8 @@ def _generate_server_api_schema() -> dict[str, Any]:
         home.WorkspaceFilesRequest,
         home.WorkspaceFilesResponse,
         models.BaseResponse,
+        models.ConsoleHistoryRequest,
+        models.ConsoleHistoryResponse,
         models.FormatRequest,
         models.FormatResponse,
         models.InstantiateRequest,
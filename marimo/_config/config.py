@@ -81,7 +81,7 @@ class KeymapConfig(TypedDict):
 
 
 OnCellChangeType = Literal["lazy", "autorun"]
-ExecutionType = Literal["relaxed", "strict"]
+ExecutionType = Literal["relaxed", "strict", "process"]
 
 
 @mddoc
@@ -262,7 +262,25 @@ class SnippetsConfig(TypedDict):
 @mddoc
 @dataclass
 class MarimoConfig(TypedDict):
-    """Configuration for the marimo editor"""
+    """Configuration for the marimo editor
+
+    **Experimental keys.**
+
+    Keys of `experimental` are subject to change.
+
+    - `execution_type`: `"relaxed"` (the default), `"strict"`, or
+      `"process"`; if `process`, pure cells are run in a pool of worker
+      processes, with their definitions copied back. Cells that define
+      functions, classes or modules, or that mutate their references, run
+      in the kernel.
+    - `max_workers`: the number of independent cells that may run
+      concurrently on threads; the default of 1 runs cells serially.
+      Only applies to the `"relaxed"` execution type.
+    - `share_initial_state`: if `True`, results of cells that don't depend
+      on UI elements are shared among sessions of an app in run mode; each
+      session binds read-only views of the shared objects, and cells whose
+      results could only be deep copied run in every session.
+    """
 
     completion: CompletionConfig
     display: DisplayConfig
@@ -6,7 +6,7 @@ from __future__ import annotations
 import time
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Dict, Sequence, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
 
 from marimo._messaging.errors import Error
 from marimo._messaging.mimetypes import KnownMimeType
@@ -62,3 +62,43 @@ class CellOutput:
         return CellOutput(
             channel=CellChannel.STDIN, mimetype="text/plain", data=data
         )
+
+
+@dataclass
+class OutputDelta:
+    """A change to the items of a cell's accumulated output.
+
+    An output built imperatively (`mo.output.append()`, progress bars, ...)
+    is a vertical stack of items. Instead of re-sending the whole stack on
+    every change, the kernel sends deltas, which consumers apply to their
+    copy of the items (see `apply_output_deltas`):
+
+    append   - `data` is the new last item, at `index`
+    replace  - `data` replaces the item at `index`
+    truncate - items from `index` onwards are removed
+
+    A full output replaces the stack, and leaves no items.
+    """
+
+    kind: Literal["append", "replace", "truncate"]
+    index: int
+    # HTML of the item, for append and replace
+    data: Optional[str] = None
+
+
+def apply_output_deltas(
+    items: Optional[List[str]], deltas: Sequence[OutputDelta]
+) -> List[str]:
+    """Apply deltas to the items of an accumulated output."""
+    items = items if items is not None else []
+    for delta in deltas:
+        if delta.kind == "append":
+            assert delta.data is not None
+            del items[delta.index :]
+            items.append(delta.data)
+        elif delta.kind == "replace":
+            assert delta.data is not None
+            items[delta.index] = delta.data
+        elif delta.kind == "truncate":
+            del items[delta.index :]
+    return items
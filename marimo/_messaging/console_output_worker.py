@@ -55,20 +55,15 @@ def _can_merge_outputs(first: ConsoleMsg, second: ConsoleMsg) -> bool:
 
 def _add_output_to_buffer(
     console_output: ConsoleMsg,
-    outputs_buffered_per_cell: dict[CellId_t, list[ConsoleMsg]],
+    outputs_buffered_per_cell: dict[CellId_t, list[list[ConsoleMsg]]],
 ) -> None:
-    cell_id = console_output.cell_id
-    buffer = (
-        outputs_buffered_per_cell[cell_id]
-        if cell_id in outputs_buffered_per_cell
-        else None
-    )
-    if buffer and _can_merge_outputs(buffer[-1], console_output):
-        buffer[-1].data += console_output.data
-    elif buffer:
-        buffer.append(console_output)
+    # Mergeable messages are grouped into runs and joined when flushed;
+    # concatenating their data as they arrive is quadratic.
+    buffer = outputs_buffered_per_cell.setdefault(console_output.cell_id, [])
+    if buffer and _can_merge_outputs(buffer[-1][-1], console_output):
+        buffer[-1].append(console_output)
     else:
-        outputs_buffered_per_cell[cell_id] = [console_output]
+        buffer.append([console_output])
 
 
 def buffered_writer(
@@ -92,7 +87,7 @@ def buffered_writer(
     # when the timer expires, all buffered outputs are flushed
     timer: Optional[float] = None
 
-    outputs_buffered_per_cell: dict[CellId_t, list[ConsoleMsg]] = {}
+    outputs_buffered_per_cell: dict[CellId_t, list[list[ConsoleMsg]]] = {}
     while True:
         with cv:
             # We wait for messages until the timer (if any) expires
@@ -117,13 +112,13 @@ def buffered_writer(
 
         # the timer has expired: flush the outputs
         for cell_id, buffer in outputs_buffered_per_cell.items():
-            for output in buffer:
+            for run in buffer:
                 _write_console_output(
                     stream,
-                    output.stream,
+                    run[0].stream,
                     cell_id,
-                    output.data,
-                    output.mimetype,
+                    "".join(output.data for output in run),
+                    run[0].mimetype,
                 )
         outputs_buffered_per_cell = {}
         timer = None
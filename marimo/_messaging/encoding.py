@@ -0,0 +1,27 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+from marimo import _loggers
+from marimo._plugins.core.json_encoder import WebComponentEncoder
+
+LOGGER = _loggers.marimo_logger()
+
+
+def encode_message(op: str, data: Any) -> Optional[bytes]:
+    """Encode a message as the UTF-8 JSON read by the frontend.
+
+    Returns None if the message can't be encoded.
+    """
+    try:
+        return json.dumps(
+            {"op": op, "data": data},
+            cls=WebComponentEncoder,
+        ).encode("utf-8")
+    except TypeError as e:
+        # This is a deserialization error
+        LOGGER.error("Failed to send message to frontend: %s", str(e))
+        LOGGER.error("Message: %s", data)
+        return None
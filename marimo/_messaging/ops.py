@@ -35,7 +35,11 @@ from marimo._data.models import (
     DataTableSource,
 )
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.cell_output import (
+    CellChannel,
+    CellOutput,
+    OutputDelta,
+)
 from marimo._messaging.completion_option import CompletionOption
 from marimo._messaging.context import RUN_ID_CTX, RunId_t
 from marimo._messaging.errors import (
@@ -115,6 +119,8 @@ class CellOp(Op):
     A CellOp's data has some optional fields:
 
     output       - a CellOutput
+    output_delta - changes to the items of an output built imperatively,
+                   a list of OutputDeltas (see OutputDelta)
     console      - a CellOutput (console msg to append), or a list of
                    CellOutputs
     status       - execution status
@@ -131,6 +137,7 @@ class CellOp(Op):
     name: ClassVar[str] = "cell-op"
     cell_id: CellId_t
     output: Optional[CellOutput] = None
+    output_delta: Optional[List[OutputDelta]] = None
     console: Optional[Union[CellOutput, List[CellOutput]]] = None
     status: Optional[RuntimeStateType] = None
     stale_inputs: Optional[bool] = None
@@ -222,6 +229,23 @@ class CellOp(Op):
             status=status,
         ).broadcast(stream=stream)
 
+    @staticmethod
+    def broadcast_output_delta(
+        deltas: List[OutputDelta],
+        cell_id: Optional[CellId_t],
+        stream: Stream | None = None,
+    ) -> None:
+        for delta in deltas:
+            if delta.data is not None:
+                _, delta.data = CellOp.maybe_truncate_output(
+                    "text/html", delta.data
+                )
+        cell_id = (
+            cell_id if cell_id is not None else get_context().stream.cell_id
+        )
+        assert cell_id is not None
+        CellOp(cell_id=cell_id, output_delta=deltas).broadcast(stream=stream)
+
     @staticmethod
     def broadcast_empty_output(
         cell_id: Optional[CellId_t],
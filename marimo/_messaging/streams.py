@@ -14,11 +14,13 @@ from typing import (
     Iterator,
     Optional,
     Protocol,
+    cast,
 )
 
 from marimo import _loggers
 from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.console_output_worker import ConsoleMsg, buffered_writer
+from marimo._messaging.encoding import encode_message
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._messaging.types import (
     KernelMessage,
@@ -79,6 +81,11 @@ class PipeProtocol(Protocol):
         pass
 
 
+class BytesPipeProtocol(PipeProtocol, Protocol):
+    def send_bytes(self, buf: bytes) -> None:
+        pass
+
+
 class QueuePipe:
     def __init__(self, queue: queue.Queue[KernelMessage]):
         self._queue = queue
@@ -99,9 +106,14 @@ class ThreadSafeStream(Stream):
         input_queue: QueueType[str],
         redirect_console: bool,
         cell_id: Optional[CellId_t] = None,
+        binary: bool = False,
     ):
         self.pipe = pipe
         self.cell_id = cell_id
+        # Send messages as encoded frames instead of pickled tuples, so that
+        # the server can forward them to the frontend without re-encoding;
+        # requires a pipe with `send_bytes`.
+        self.binary = binary
         self.redirect_console = redirect_console
         # A single stream is shared by the kernel and the code completion
         # worker. The lock should almost always be uncontended.
@@ -121,6 +133,9 @@ class ThreadSafeStream(Stream):
         self.input_queue = input_queue
 
     def write(self, op: str, data: dict[Any, Any]) -> None:
+        if self.binary:
+            self._write_bytes(op, data)
+            return
         with self.stream_lock:
             try:
                 self.pipe.send((op, data))
@@ -129,6 +144,18 @@ class ThreadSafeStream(Stream):
                 # server process shutting down
                 LOGGER.debug("Error when writing (op: %s) to pipe: %s", op, e)
 
+    def _write_bytes(self, op: str, data: dict[Any, Any]) -> None:
+        pipe = cast(BytesPipeProtocol, self.pipe)
+        # Encode outside the lock; only the send must be serialized.
+        buffer = encode_message(op, data)
+        if buffer is None:
+            return
+        with self.stream_lock:
+            try:
+                pipe.send_bytes(buffer)
+            except OSError as e:
+                LOGGER.debug("Error when writing (op: %s) to pipe: %s", op, e)
+
     def stop(self) -> None:
         """Teardown resources created by the stream."""
         # Sending `None` through the queue signals the console thread to exit.
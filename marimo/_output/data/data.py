@@ -83,6 +83,18 @@ def json(data: Union[str, bytes, io.BytesIO]) -> VirtualFile:
     return any_data(data, ext="json")  # type: ignore
 
 
+def arrow(data: bytes) -> VirtualFile:
+    """Create a virtual file for an Arrow IPC stream.
+
+    Args:
+        data: Arrow IPC stream in bytes
+
+    Returns:
+        A `VirtualFile` object.
+    """
+    return any_data(data, ext="arrow")
+
+
 def js(data: str) -> VirtualFile:
     """Create a virtual file for JavaScript data.
 
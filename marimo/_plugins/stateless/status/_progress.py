@@ -96,7 +96,7 @@ class _Progress(Html):
     @debounce(0.15)
     def debounced_flush(self) -> None:
         """Flush the output to the UI."""
-        output.flush()
+        output.refresh(self)
 
     def clear(self) -> None:
         if self.closed:
@@ -107,7 +107,7 @@ class _Progress(Html):
         output.remove(self)
 
     def close(self) -> None:
-        output.flush()  # Flush one last time before closing
+        output.refresh(self)  # Flush one last time before closing
         self.closed = True
 
     def _get_text(self) -> str:
@@ -59,6 +59,10 @@ class UIElementRegistry:
             self._register_bindings(object_id)
         return self._bindings[object_id]
 
+    def constructed_by(self, cell_id: CellId_t) -> bool:
+        """Whether any registered UI element was created by `cell_id`"""
+        return cell_id in self._constructing_cells.values()
+
     def _has_parent_id(
         self, child: UIElement[Any, Any], parent_id: UIElementId
     ) -> bool:
@@ -73,7 +73,8 @@ def get_handler_for_dataframe(
     if DependencyManager.polars.imported():
         import polars as pl
 
-        if isinstance(df, pl.DataFrame):
+        # Polars expressions apply to LazyFrames as well
+        if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
             return PolarsTransformHandler()
 
     if DependencyManager.ibis.imported():
@@ -269,7 +269,7 @@ class PolarsTransformHandler(TransformHandler["pl.DataFrame"]):
         # Iterate over all conditions and build the filter expression
         for condition in transform.where:
             column = col(str(condition.column_id))
-            dtype = df.schema[str(condition.column_id)]
+            dtype = df.collect_schema()[str(condition.column_id)]
             value = condition.value
             value_str = str(value)
 
@@ -1,7 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-import functools
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -13,6 +13,7 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
 )
 
@@ -20,7 +21,10 @@ from narwhals.typing import IntoDataFrame
 
 import marimo._output.data.data as mo_data
 from marimo import _loggers
-from marimo._data.models import NonNestedLiteral
+from marimo._data.models import (
+    ColumnSummary as DataColumnSummary,
+    NonNestedLiteral,
+)
 from marimo._output.mime import MIME
 from marimo._output.rich_help import mddoc
 from marimo._plugins.core.web_component import JSONType
@@ -48,6 +52,7 @@ from marimo._plugins.validators import (
     validate_page_size,
 )
 from marimo._runtime.functions import EmptyArgs, Function
+from marimo._utils.memory import estimate_nbytes
 from marimo._utils.narwhals_utils import unwrap_narwhals_dataframe
 
 LOGGER = _loggers.marimo_logger()
@@ -89,6 +94,9 @@ class SearchTableArgs:
     sort: Optional[SortArgs] = None
     filters: Optional[List[Condition]] = None
     limit: Optional[int] = None
+    # "arrow" sends pages as typed Arrow IPC streams; tables that can't be
+    # represented in Arrow fall back to the default format
+    format: Literal["default", "arrow"] = "default"
 
 
 @dataclass(frozen=True)
@@ -103,6 +111,51 @@ class SortArgs:
     descending: bool
 
 
+_SearchKey = Tuple[
+    Optional[Tuple[Condition, ...]], Optional[str], Optional[SortArgs]
+]
+
+
+class _SearchCache:
+    """LRU of a table's filtered and sorted results, within a byte budget.
+
+    The most recent result is always kept, even if it alone exceeds the
+    budget, since it backs the current page, summaries and selection.
+    Results are charged their shallow size: the Python objects they hold
+    (e.g., the strings of pandas object columns) are shared with the
+    table's data, and a deep estimate would be O(rows) on every search.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self._entries: OrderedDict[
+            _SearchKey, Tuple[TableManager[Any], int]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _SearchKey) -> Optional[TableManager[Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: _SearchKey, manager: TableManager[Any]) -> None:
+        nbytes = estimate_nbytes(
+            unwrap_narwhals_dataframe(manager.data), deep=False
+        )
+        self._entries[key] = (manager, nbytes)
+        self.total_bytes += nbytes
+        while len(self._entries) > 1 and self.total_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted
+
+
 @mddoc
 class table(
     UIElement[
@@ -305,6 +358,11 @@ class table(
         # Holds the data after user searching from original data
         # (searching operations include query, sort, filter, etc.)
         self._searched_manager = self._manager
+        # Recent searches, owned by this element so they are released
+        # with it
+        self._search_cache = _SearchCache(
+            TableManager.DEFAULT_SEARCH_CACHE_MAX_BYTES
+        )
         # Holds the data after user selecting from the component
         self._selected_manager: Optional[TableManager[Any]] = None
 
@@ -481,8 +539,9 @@ class table(
         """Get statistical summaries for each column in the table.
 
         Calculates summaries like null counts, min/max values, unique counts, etc.
-        for each column. Summaries are only calculated if the total number of rows
-        is below the column summary row limit.
+        for each column, in one pass over the data where the table supports it.
+        Above the column summary row limit, statistics are approximate, or
+        disabled if the table can't approximate them.
 
         Args:
             args (EmptyArgs): Empty arguments object (unused).
@@ -504,38 +563,55 @@ class table(
 
         total_rows = self._searched_manager.get_num_rows(force=True) or 0
 
-        # Avoid expensive column summaries calculation by setting a upper limit
-        # if we are above the limit, we hide the column summaries
-        if total_rows > self._column_summary_row_limit:
-            return ColumnSummaries(
-                data=None,
-                summaries=[],
-                is_disabled=True,
-            )
+        # Above the limit, statistics are approximate (e.g. estimated
+        # unique counts); tables that can't approximate them are disabled
+        approximate = total_rows > self._column_summary_row_limit
 
         # Get column summaries if not chart-only mode
         summaries: List[ColumnSummary] = []
         if self._show_column_summaries != "chart":
-            for column in self._manager.get_column_names():
-                try:
-                    summary = self._searched_manager.get_summary(column)
-                    summaries.append(
-                        ColumnSummary(
-                            column=column,
-                            nulls=summary.nulls,
-                            min=summary.min,
-                            max=summary.max,
-                            unique=summary.unique,
-                            true=summary.true,
-                            false=summary.false,
-                        )
-                    )
-                except BaseException:
-                    # Catch-all: some libraries like Polars have bugs and raise
-                    # BaseExceptions, which shouldn't crash the kernel
-                    LOGGER.warning(
-                        "Failed to get summary for column %s", column
+            columns = self._manager.get_column_names()
+            try:
+                column_summaries = self._searched_manager.get_summaries(
+                    columns, approximate=approximate
+                )
+            except NotImplementedError:
+                return ColumnSummaries(
+                    data=None,
+                    summaries=[],
+                    is_disabled=True,
+                )
+            except BaseException:
+                # Catch-all: some libraries like Polars have bugs and raise
+                # BaseExceptions, which shouldn't crash the kernel. Retry
+                # column by column so that one column doesn't hide the rest
+                LOGGER.debug("Failed to summarize columns together")
+                column_summaries = (
+                    {}
+                    if approximate
+                    else self._get_summaries_by_column(columns)
+                )
+            for column in columns:
+                if column not in column_summaries:
+                    continue
+                summary = column_summaries[column]
+                summaries.append(
+                    ColumnSummary(
+                        column=column,
+                        nulls=summary.nulls,
+                        min=summary.min,
+                        max=summary.max,
+                        unique=summary.unique,
+                        true=summary.true,
+                        false=summary.false,
                     )
+                )
+        elif approximate:
+            return ColumnSummaries(
+                data=None,
+                summaries=[],
+                is_disabled=True,
+            )
 
         # If we are above the limit to show charts,
         # or if we are in stats-only mode,
@@ -553,15 +629,49 @@ class table(
             is_disabled=False,
         )
 
-    @functools.lru_cache(maxsize=1)  # noqa: B019
+    def _get_summaries_by_column(
+        self, columns: List[str]
+    ) -> Dict[str, DataColumnSummary]:
+        summaries: Dict[str, DataColumnSummary] = {}
+        for column in columns:
+            try:
+                summaries[column] = self._searched_manager.get_summary(column)
+            except BaseException:
+                LOGGER.warning("Failed to get summary for column %s", column)
+        return summaries
+
     def _apply_filters_query_sort(
         self,
-        filters: Optional[List[Condition]],
+        filters: Optional[Tuple[Condition, ...]],
+        query: Optional[str],
+        sort: Optional[SortArgs],
+    ) -> TableManager[Any]:
+        key: _SearchKey = (filters, query, sort)
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. filters on a list of values
+            return self._compute_filters_query_sort(filters, query, sort)
+
+        result = self._search_cache.get(key)
+        if result is None:
+            result = self._compute_filters_query_sort(filters, query, sort)
+            self._search_cache.put(key, result)
+        return result
+
+    def _compute_filters_query_sort(
+        self,
+        filters: Optional[Tuple[Condition, ...]],
         query: Optional[str],
         sort: Optional[SortArgs],
     ) -> TableManager[Any]:
         result = self._manager
 
+        # Search first, so that the search index of the original data
+        # is reused across queries
+        if query:
+            result = result.search(query)
+
         if filters:
             data = unwrap_narwhals_dataframe(result.data)
             handler = get_handler_for_dataframe(data)
@@ -569,15 +679,12 @@ class table(
                 data,
                 FilterRowsTransform(
                     type=TransformType.FILTER_ROWS,
-                    where=filters,
+                    where=list(filters),
                     operation="keep_rows",
                 ),
             )
             result = get_table_manager(data)
 
-        if query:
-            result = result.search(query)
-
         if sort and sort.by in result.get_column_names():
             result = result.sort_values(sort.by, sort.descending)
 
@@ -597,6 +704,7 @@ class table(
                 - sort: Optional sorting configuration
                 - filters: Optional list of filter conditions
                 - limit: Optional row limit
+                - format: Encoding of the page, "default" or "arrow"
 
         Returns:
             SearchTableResponse: Response containing:
@@ -614,6 +722,14 @@ class table(
                 and len(column_names) > self._max_columns
             ):
                 data = data.select_columns(column_names[: self._max_columns])
+            if args.format == "arrow":
+                try:
+                    return mo_data.arrow(
+                        data.to_arrow_ipc(self._format_mapping)
+                    ).url
+                except Exception as e:
+                    # e.g. object columns with mixed types
+                    LOGGER.debug("Failed to encode page as Arrow: %s", e)
             return data.to_data(self._format_mapping)
 
         # If no query or sort, return nothing
@@ -625,7 +741,7 @@ class table(
                 total_rows=self._manager.get_num_rows(force=True) or 0,
             )
 
-        # Apply filters, query, and functools.sort using the cached method
+        # Apply filters, query, and sort, reusing recent results
         result = self._apply_filters_query_sort(
             tuple(args.filters) if args.filters else None,
             args.query,
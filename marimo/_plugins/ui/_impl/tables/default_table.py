@@ -1,6 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+from functools import cached_property
 from typing import (
     Any,
     Dict,
@@ -21,6 +22,9 @@ from marimo._plugins.ui._impl.tables.format import (
     format_column,
     format_row,
 )
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    SEARCH_INDEX_SEPARATOR,
+)
 from marimo._plugins.ui._impl.tables.pandas_table import (
     PandasTableManagerFactory,
 )
@@ -168,16 +172,24 @@ class DefaultTableManager(TableManager[JsonTableData]):
             )
         return DefaultTableManager(self.data[offset : offset + count])
 
+    @cached_property
+    def _search_index(self) -> List[str]:
+        """The lowercased text of each row, built on the first search."""
+        if isinstance(self.data, dict) and self.is_column_oriented:
+            columns = [cast(List[Any], value) for value in self.data.values()]
+            return [
+                SEARCH_INDEX_SEPARATOR.join(str(v) for v in row).lower()
+                for row in zip(*columns)
+            ]
+        return [
+            SEARCH_INDEX_SEPARATOR.join(str(v) for v in row.values()).lower()
+            for row in self._normalize_data(self.data)
+        ]
+
     def search(self, query: str) -> DefaultTableManager:
         query = query.lower()
+        mask: List[bool] = [query in text for text in self._search_index]
         if isinstance(self.data, dict) and self.is_column_oriented:
-            mask: List[bool] = [
-                any(
-                    query in str(cast(List[Any], self.data[key])[row]).lower()
-                    for key in self.data.keys()
-                )
-                for row in range(self.get_num_rows() or 0)
-            ]
             results = {
                 key: [
                     cast(List[Any], value)[i]
@@ -190,8 +202,8 @@ class DefaultTableManager(TableManager[JsonTableData]):
         return DefaultTableManager(
             [
                 row
-                for row in self._normalize_data(self.data)
-                if any(query in str(v).lower() for v in row.values())
+                for row, match in zip(self._normalize_data(self.data), mask)
+                if match
             ]
         )
 
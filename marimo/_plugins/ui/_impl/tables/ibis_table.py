@@ -24,6 +24,7 @@ from marimo._plugins.ui._impl.tables.table_manager import (
     TableManagerFactory,
 )
 from marimo._utils.memoize import memoize_last_value
+from marimo._utils.narwhals_utils import dataframe_to_arrow_ipc
 
 
 class IbisTableManagerFactory(TableManagerFactory):
@@ -46,6 +47,15 @@ class IbisTableManagerFactory(TableManagerFactory):
             def to_json(self) -> bytes:
                 return self._as_table_manager().to_json()
 
+            def to_arrow_ipc(
+                self, format_mapping: Optional[FormatMapping] = None
+            ) -> bytes:
+                if format_mapping or not DependencyManager.pyarrow.has():
+                    return self._as_table_manager().to_arrow_ipc(
+                        format_mapping
+                    )
+                return dataframe_to_arrow_ipc(self.data.to_pyarrow())
+
             def supports_download(self) -> bool:
                 return False
 
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import json
+import threading
 from functools import cached_property
-from typing import Any, Optional, Tuple, Union, cast
+from typing import Any, Callable, Optional, Tuple, Union, cast
 
 import narwhals.stable.v1 as nw
 from narwhals.stable.v1.typing import IntoFrameT
 
+from marimo import _loggers
 from marimo._data.models import ColumnSummary, ExternalDataType
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._impl.tables.format import (
     FormatMapping,
     format_value,
@@ -21,12 +24,74 @@ from marimo._plugins.ui._impl.tables.table_manager import (
 )
 from marimo._utils.narwhals_utils import (
     can_narwhalify,
+    dataframe_to_arrow_ipc,
     dataframe_to_csv,
     is_narwhals_integer_type,
     is_narwhals_string_type,
     is_narwhals_temporal_type,
     unwrap_py_scalar,
 )
+from marimo._utils.platform import is_pyodide
+
+LOGGER = _loggers.marimo_logger()
+
+# Temporary column used to page and select rows of LazyFrames
+_ROW_NUMBER = "__marimo_row_number"
+# Separates the values of a row in the search index. With multiline
+# regexes, anchors then match at the start and end of each value.
+SEARCH_INDEX_SEPARATOR = "\n"
+# Width of a value cast to a string in the search index, for estimating its
+# size before building it
+SEARCH_INDEX_CAST_WIDTH = 24
+# Aliases of the statistics computed by `get_summaries`
+_TOTAL = "__marimo_total"
+_STAT_PREFIX = "__marimo_stat_"
+
+
+class SearchIndex:
+    """The search index of a table, built on a background thread.
+
+    Building the index scans the whole table, so searches don't wait for
+    it: until it is built, they scan each column instead. The build is
+    started after the first such scan, so that the two don't compete.
+    """
+
+    def __init__(self, build: Callable[[], Optional[nw.Series[Any]]]):
+        self._build = build
+        self._index: Optional[nw.Series[Any]] = None
+        self._started = False
+        self._done = threading.Event()
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        if is_pyodide():
+            # No threads
+            self._run()
+            return
+        threading.Thread(
+            target=self._run, name="marimo-search-index", daemon=True
+        ).start()
+
+    def _run(self) -> None:
+        try:
+            self._index = self._build()
+        except Exception as e:
+            LOGGER.debug("Failed to build search index: %s", e)
+        finally:
+            self._done.set()
+
+    def get(self) -> Optional[nw.Series[Any]]:
+        """The index, or None if it isn't built (yet)."""
+        return self._index if self._done.is_set() else None
+
+    def wait(
+        self, timeout: Optional[float] = None
+    ) -> Optional[nw.Series[Any]]:
+        self.start()
+        self._done.wait(timeout)
+        return self.get()
 
 
 class NarwhalsTableManager(
@@ -59,6 +124,15 @@ class NarwhalsTableManager(
         _data = self.apply_formatting(format_mapping).as_frame()
         return dataframe_to_csv(_data).encode("utf-8")
 
+    def to_arrow_ipc(
+        self,
+        format_mapping: Optional[FormatMapping] = None,
+    ) -> bytes:
+        if not DependencyManager.pyarrow.has():
+            raise NotImplementedError("pyarrow is required for Arrow IPC")
+        _data = self.apply_formatting(format_mapping).as_frame()
+        return dataframe_to_arrow_ipc(_data)
+
     def to_json(self) -> bytes:
         csv_str = self.to_csv().decode("utf-8")
         import csv
@@ -88,13 +162,19 @@ class NarwhalsTableManager(
         return True
 
     def select_rows(self, indices: list[int]) -> TableManager[Any]:
-        df = self.as_frame()
+        df = self.data
         # Prefer the index column for selections
-        if INDEX_COLUMN_NAME in df.columns:
+        if INDEX_COLUMN_NAME in self.nw_schema.names():
             # Drop the index column before returning
             return self.with_new_data(
                 df.filter(nw.col(INDEX_COLUMN_NAME).is_in(indices))
             )
+        if isinstance(df, nw.LazyFrame):
+            return self.with_new_data(
+                df.with_row_index(_ROW_NUMBER)
+                .filter(nw.col(_ROW_NUMBER).is_in(indices))
+                .drop(_ROW_NUMBER)
+            )
         return self.with_new_data(df[indices])
 
     def select_columns(self, columns: list[str]) -> TableManager[Any]:
@@ -114,7 +194,8 @@ class NarwhalsTableManager(
 
     @cached_property
     def nw_schema(self) -> nw.Schema:
-        return cast(nw.Schema, self.data.schema)
+        # Resolves a LazyFrame's schema without running the query
+        return cast(nw.Schema, self.data.collect_schema())
 
     def get_field_type(
         self, column_name: str
@@ -141,17 +222,29 @@ class NarwhalsTableManager(
             raise ValueError("Count must be a positive integer")
         if offset < 0:
             raise ValueError("Offset must be a non-negative integer")
+        if isinstance(self.data, nw.LazyFrame):
+            # LazyFrames can't be sliced; filter on the row number instead
+            # so that only the page is collected
+            if offset == 0:
+                return self.with_new_data(self.data.head(count))
+            return self.with_new_data(
+                self.data.with_row_index(_ROW_NUMBER)
+                .filter(
+                    (nw.col(_ROW_NUMBER) >= offset)
+                    & (nw.col(_ROW_NUMBER) < offset + count)
+                )
+                .drop(_ROW_NUMBER)
+            )
         return self.with_new_data(self.data[offset : offset + count])
 
-    def search(self, query: str) -> TableManager[Any]:
-        query = query.lower()
-
-        expressions: list[Any] = []
+    def _searchable_columns(self) -> list[nw.Expr]:
+        """The searchable columns, as strings."""
+        columns: list[nw.Expr] = []
         for column, dtype in self.nw_schema.items():
             if column == INDEX_COLUMN_NAME:
                 continue
             if dtype == nw.String:
-                expressions.append(nw.col(column).str.contains(f"(?i){query}"))
+                columns.append(nw.col(column))
             elif dtype == nw.List(nw.String):
                 # TODO: Narwhals doesn't support list.contains
                 # expressions.append(
@@ -164,10 +257,84 @@ class NarwhalsTableManager(
                 or dtype == nw.Duration
                 or dtype == nw.Boolean
             ):
-                expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
-                )
+                columns.append(nw.col(column).cast(nw.String))
+        return columns
+
+    def _search_index_nbytes(self, data: nw.DataFrame[Any]) -> int:
+        """Estimated size of the search index of an eager frame."""
+        strings: list[str] = []
+        row_width = 0
+        for column, dtype in self.nw_schema.items():
+            if column == INDEX_COLUMN_NAME:
+                continue
+            if dtype == nw.String:
+                strings.append(column)
+                row_width += len(SEARCH_INDEX_SEPARATOR)
+            elif (
+                dtype.is_numeric()
+                or is_narwhals_temporal_type(dtype)
+                or dtype == nw.Duration
+                or dtype == nw.Boolean
+            ):
+                row_width += SEARCH_INDEX_CAST_WIDTH
+        nbytes = len(data) * row_width
+        if strings:
+            lengths = data.select(
+                nw.col(column).str.len_chars().sum() for column in strings
+            )
+            nbytes += sum(int(n or 0) for n in lengths.row(0))
+        return nbytes
+
+    def _build_search_index(self) -> Optional[nw.Series[Any]]:
+        """The lowercased text of each row, one line per value.
+
+        Not built for tables whose index would exceed
+        `DEFAULT_SEARCH_INDEX_MAX_BYTES`.
+        """
+        data = self.data
+        assert isinstance(data, nw.DataFrame)
+        columns = self._searchable_columns()
+        if not columns:
+            return None
+        if (
+            self._search_index_nbytes(data)
+            > self.DEFAULT_SEARCH_INDEX_MAX_BYTES
+        ):
+            return None
+        return data.select(
+            nw.concat_str(
+                columns, separator=SEARCH_INDEX_SEPARATOR, ignore_nulls=True
+            )
+            .str.to_lowercase()
+            .alias("index")
+        )["index"]
 
+    @cached_property
+    def _search_index(self) -> Optional[SearchIndex]:
+        """Search index, so that a query scans a single string column
+        instead of casting and scanning every column.
+
+        Built after the first search and reused by later ones; not built
+        for lazy frames.
+        """
+        if isinstance(self.data, nw.LazyFrame):
+            return None
+        return SearchIndex(self._build_search_index)
+
+    def search(self, query: str) -> TableManager[Any]:
+        query = query.lower()
+
+        search_index = self._search_index
+        index = search_index.get() if search_index else None
+        if index is not None:
+            return NarwhalsTableManager(
+                self.data.filter(index.str.contains(f"(?m){query}"))
+            )
+
+        expressions = [
+            column.str.contains(f"(?i){query}")
+            for column in self._searchable_columns()
+        ]
         if not expressions:
             return NarwhalsTableManager(self.data.filter(nw.lit(False)))
 
@@ -176,114 +343,79 @@ class NarwhalsTableManager(
             or_expr = or_expr | expr
 
         filtered = self.data.filter(or_expr)
+        if search_index is not None:
+            search_index.start()
         return NarwhalsTableManager(filtered)
 
     def get_summary(self, column: str) -> ColumnSummary:
-        summary = self._get_summary_internal(column)
-        for key, value in summary.__dict__.items():
-            if value is not None:
-                summary.__dict__[key] = unwrap_py_scalar(value)
-        return summary
-
-    def _get_summary_internal(self, column: str) -> ColumnSummary:
-        # If column is not in the dataframe, return an empty summary
-        if column not in self.nw_schema:
-            return ColumnSummary()
-        col = self.data[column]
-        total = len(col)
-        if is_narwhals_string_type(col.dtype):
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-                unique=col.n_unique(),
-            )
-        if col.dtype == nw.Boolean:
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-                true=cast(int, col.sum()),
-                false=cast(int, total - col.sum()),
-            )
-        if col.dtype == nw.Date:
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-                min=col.min(),
-                max=col.max(),
-                mean=col.mean(),
-                # Quantile not supported on date type
-                # median=col.quantile(0.5, interpolation="nearest"),
-            )
-        if is_narwhals_temporal_type(col.dtype):
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-                min=col.min(),
-                max=col.max(),
-                mean=col.mean(),
-                median=col.quantile(0.5, interpolation="nearest"),
-                p5=col.quantile(0.05, interpolation="nearest"),
-                p25=col.quantile(0.25, interpolation="nearest"),
-                p75=col.quantile(0.75, interpolation="nearest"),
-                p95=col.quantile(0.95, interpolation="nearest"),
-            )
-        if col.dtype == nw.Duration and isinstance(col.dtype, nw.Duration):
-            unit_map = {
-                "ms": (col.dt.total_milliseconds, "ms"),
-                "ns": (col.dt.total_nanoseconds, "ns"),
-                "us": (col.dt.total_microseconds, "μs"),
-                "s": (col.dt.total_seconds, "s"),
-            }
-            method, unit = unit_map[col.dtype.time_unit]
-            res = method()
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-                min=str(res.min()) + unit,
-                max=str(res.max()) + unit,
-                mean=str(res.mean()) + unit,
-            )
-        if (
-            col.dtype == nw.List
-            or col.dtype == nw.Struct
-            or col.dtype == nw.Object
-            or col.dtype == nw.Array
-        ):
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-            )
-        if col.dtype == nw.Unknown:
-            return ColumnSummary(
-                total=total,
-                nulls=col.null_count(),
-            )
-        return ColumnSummary(
-            total=total,
-            nulls=col.null_count(),
-            unique=(
-                col.n_unique() if is_narwhals_integer_type(col.dtype) else None
-            ),
-            min=col.min(),
-            max=col.max(),
-            mean=col.mean(),
-            median=col.quantile(0.5, interpolation="nearest"),
-            std=col.std(),
-            p5=col.quantile(0.05, interpolation="nearest"),
-            p25=col.quantile(0.25, interpolation="nearest"),
-            p75=col.quantile(0.75, interpolation="nearest"),
-            p95=col.quantile(0.95, interpolation="nearest"),
+        return self.get_summaries([column])[column]
+
+    def get_summaries(
+        self, columns: list[str], approximate: bool = False
+    ) -> dict[str, ColumnSummary]:
+        # The statistics of all columns are computed in a single select,
+        # so the data is scanned once rather than once per statistic
+        schema = self.nw_schema
+        summarized = [column for column in columns if column in schema]
+        exprs: list[nw.Expr] = [nw.len().alias(_TOTAL)]
+        fields: dict[str, list[tuple[str, str, str]]] = {}
+        for i, column in enumerate(summarized):
+            fields[column] = []
+            for field, expr, suffix in _summary_exprs(
+                column, schema[column], approximate
+            ):
+                alias = f"{_STAT_PREFIX}{i}_{field}"
+                exprs.append(expr.alias(alias))
+                fields[column].append((field, alias, suffix))
+
+        frame = self.data.select(exprs)
+        if isinstance(frame, nw.LazyFrame):
+            frame = frame.collect()
+        row = frame.rows(named=True)[0]
+        total = int(unwrap_py_scalar(row[_TOTAL]))
+
+        unique_counts = (
+            self._approx_unique_counts(summarized) if approximate else {}
         )
+        summaries: dict[str, ColumnSummary] = {}
+        for column in columns:
+            if column not in fields:
+                # Not in the dataframe
+                summaries[column] = ColumnSummary()
+                continue
+            summary = ColumnSummary(total=total)
+            for field, alias, suffix in fields[column]:
+                value = unwrap_py_scalar(row[alias])
+                setattr(
+                    summary, field, f"{value}{suffix}" if suffix else value
+                )
+            if summary.true is not None:
+                summary.false = total - summary.true
+            if column in unique_counts:
+                summary.unique = unique_counts[column]
+            summaries[column] = summary
+        return summaries
+
+    def _approx_unique_counts(self, columns: list[str]) -> dict[str, int]:
+        """Estimated unique counts, used when summaries are approximate.
+
+        Narwhals has no estimator, so unique counts are left out by default.
+        """
+        del columns
+        return {}
 
     def get_num_rows(self, force: bool = True) -> Optional[int]:
-        # If force is true, collect the data and get the number of rows
+        # When lazy, we don't know the number of rows without running
+        # a count query
+        if isinstance(self.data, nw.LazyFrame):
+            if not force:
+                return None
+            return int(self.data.select(nw.len()).collect().item())
+
+        # If force is true, get the number of rows from the frame
         if force:
             return self.as_frame().shape[0]
 
-        # When lazy, we don't know the number of rows
-        if isinstance(self.data, nw.LazyFrame):
-            return None
-
         # Otherwise, we can get the number of rows from the shape
         try:
             return self.data.shape[0]
@@ -301,13 +433,19 @@ class NarwhalsTableManager(
         return column_names
 
     def get_unique_column_values(self, column: str) -> list[str | int | float]:
+        def unique(expr: nw.Expr) -> list[str | int | float]:
+            frame = self.data.select(expr.unique())
+            if isinstance(frame, nw.LazyFrame):
+                frame = frame.collect()
+            return frame[column].to_list()
+
         try:
-            return self.data[column].unique().to_list()
+            return unique(nw.col(column))
         except BaseException:
             # Catch-all: some libraries like Polars have bugs and raise
             # BaseExceptions, which shouldn't crash the kernel
             # If an exception occurs, try converting to strings first
-            return self.data[column].cast(nw.String).unique().to_list()
+            return unique(nw.col(column).cast(nw.String))
 
     def get_sample_values(self, column: str) -> list[str | int | float]:
         # Sample 3 values from the column
@@ -326,18 +464,16 @@ class NarwhalsTableManager(
                     return value
                 return str(value)
 
-            if self.data[column].dtype == nw.Datetime:
+            head = self.data.select(column).head(SAMPLE_SIZE)
+            if isinstance(head, nw.LazyFrame):
+                head = head.collect()
+            if head[column].dtype == nw.Datetime:
                 # Drop timezone info for datetime columns
                 # It's ok to drop timezone since these are just sample values
                 # and not used for any calculations
-                values = (
-                    self.data[column]
-                    .dt.replace_time_zone(None)
-                    .head(SAMPLE_SIZE)
-                    .to_list()
-                )
+                values = head[column].dt.replace_time_zone(None).to_list()
             else:
-                values = self.data[column].head(SAMPLE_SIZE).to_list()
+                values = head[column].to_list()
             # Serialize values to primitives
             return [to_primitive(v) for v in values]
         except BaseException:
@@ -365,3 +501,90 @@ class NarwhalsTableManager(
         if rows is None:
             return f"{df_type}: {columns:,} columns"
         return f"{df_type}: {rows:,} rows x {columns:,} columns"
+
+
+def _summary_exprs(
+    column: str, dtype: Any, approximate: bool
+) -> list[tuple[str, nw.Expr, str]]:
+    """The statistics summarizing a column.
+
+    Returns (ColumnSummary field, expression, unit suffix) triples.
+    """
+    col = nw.col(column)
+    nulls = ("nulls", col.null_count(), "")
+    if is_narwhals_string_type(dtype):
+        if approximate:
+            return [nulls]
+        return [nulls, ("unique", col.n_unique(), "")]
+    if dtype == nw.Boolean:
+        # `false` is derived from the total. `sum` is annotated with
+        # narwhals' main Expr, though it returns a stable v1 one.
+        return [nulls, ("true", cast(nw.Expr, col.sum()), "")]
+    if dtype == nw.Date:
+        # Quantile not supported on date type
+        return [
+            nulls,
+            ("min", col.min(), ""),
+            ("max", col.max(), ""),
+            ("mean", col.mean(), ""),
+        ]
+    if is_narwhals_temporal_type(dtype):
+        return [
+            nulls,
+            ("min", col.min(), ""),
+            ("max", col.max(), ""),
+            ("mean", col.mean(), ""),
+            *_quantile_exprs(col, approximate),
+        ]
+    if dtype == nw.Duration and isinstance(dtype, nw.Duration):
+        unit_map = {
+            "ms": (col.dt.total_milliseconds, "ms"),
+            "ns": (col.dt.total_nanoseconds, "ns"),
+            "us": (col.dt.total_microseconds, "μs"),
+            "s": (col.dt.total_seconds, "s"),
+        }
+        method, unit = unit_map[dtype.time_unit]
+        res = method()
+        return [
+            nulls,
+            ("min", res.min(), unit),
+            ("max", res.max(), unit),
+            ("mean", res.mean(), unit),
+        ]
+    if (
+        dtype == nw.List
+        or dtype == nw.Struct
+        or dtype == nw.Object
+        or dtype == nw.Array
+        or dtype == nw.Unknown
+    ):
+        return [nulls]
+    stats = [nulls]
+    if is_narwhals_integer_type(dtype) and not approximate:
+        stats.append(("unique", col.n_unique(), ""))
+    return [
+        *stats,
+        ("min", col.min(), ""),
+        ("max", col.max(), ""),
+        ("mean", col.mean(), ""),
+        ("std", col.std(), ""),
+        *_quantile_exprs(col, approximate),
+    ]
+
+
+def _quantile_exprs(
+    col: nw.Expr, approximate: bool
+) -> list[tuple[str, nw.Expr, str]]:
+    # Quantiles sort the column, which dominates the cost of summaries
+    if approximate:
+        return []
+    return [
+        (field, col.quantile(quantile, interpolation="nearest"), "")
+        for field, quantile in (
+            ("median", 0.5),
+            ("p5", 0.05),
+            ("p25", 0.25),
+            ("p75", 0.75),
+            ("p95", 0.95),
+        )
+    ]
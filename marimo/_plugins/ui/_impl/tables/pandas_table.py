@@ -7,6 +7,7 @@ from typing import Any, Optional, Tuple
 import narwhals.stable.v1 as nw
 
 from marimo._data.models import ExternalDataType
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._impl.tables.format import (
     FormatMapping,
     format_value,
@@ -17,6 +18,7 @@ from marimo._plugins.ui._impl.tables.table_manager import (
     TableManager,
     TableManagerFactory,
 )
+from marimo._utils.narwhals_utils import dataframe_to_arrow_ipc
 
 
 class PandasTableManagerFactory(TableManagerFactory):
@@ -65,6 +67,23 @@ class PandasTableManagerFactory(TableManagerFactory):
                     "utf-8"
                 )
 
+            # We override narwhals's to_arrow_ipc to keep the row headers
+            def to_arrow_ipc(
+                self, format_mapping: Optional[FormatMapping] = None
+            ) -> bytes:
+                if not DependencyManager.pyarrow.has():
+                    raise NotImplementedError(
+                        "pyarrow is required for Arrow IPC"
+                    )
+                import pyarrow as pa  # type: ignore[import-not-found,unused-ignore]
+
+                has_headers = len(self.get_row_headers()) > 0
+                table = pa.Table.from_pandas(
+                    self.apply_formatting(format_mapping)._original_data,
+                    preserve_index=has_headers,
+                )
+                return dataframe_to_arrow_ipc(table)
+
             def apply_formatting(
                 self, format_mapping: Optional[FormatMapping]
             ) -> PandasTableManager:
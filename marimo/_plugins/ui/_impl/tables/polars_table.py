@@ -1,6 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import io
 from functools import cached_property
 from typing import Any, Optional, Tuple, Union
 
@@ -13,7 +14,12 @@ from marimo._plugins.ui._impl.tables.format import (
     FormatMapping,
     format_value,
 )
-from marimo._plugins.ui._impl.tables.narwhals_table import NarwhalsTableManager
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    SEARCH_INDEX_CAST_WIDTH,
+    SEARCH_INDEX_SEPARATOR,
+    NarwhalsTableManager,
+)
+from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
 from marimo._plugins.ui._impl.tables.table_manager import (
     FieldType,
     TableManager,
@@ -51,7 +57,8 @@ class PolarsTableManagerFactory(TableManagerFactory):
 
             @cached_property
             def schema(self) -> dict[str, pl.DataType]:
-                return self._original_data.schema
+                # Resolves a LazyFrame's schema without running the query
+                return self._original_data.collect_schema()
 
             # We override narwhals's to_csv to handle polars
             # nested data types.
@@ -108,6 +115,15 @@ class PolarsTableManagerFactory(TableManagerFactory):
             def to_json(self) -> bytes:
                 return self.collect().write_json().encode("utf-8")
 
+            # Polars writes Arrow natively, without pyarrow
+            def to_arrow_ipc(
+                self, format_mapping: Optional[FormatMapping] = None
+            ) -> bytes:
+                _data = self.apply_formatting(format_mapping).collect()
+                buffer = io.BytesIO()
+                _data.write_ipc_stream(buffer)
+                return buffer.getvalue()
+
             def apply_formatting(
                 self, format_mapping: Optional[FormatMapping]
             ) -> PolarsTableManager:
@@ -130,13 +146,106 @@ class PolarsTableManagerFactory(TableManagerFactory):
 
             @staticmethod
             def is_type(value: Any) -> bool:
-                return isinstance(value, pl.DataFrame)
+                return isinstance(value, (pl.DataFrame, pl.LazyFrame))
+
+            # LazyFrames stay lazy: pages and counts are pushed down into
+            # the query, so only `count` rows are ever materialized
+            def take(self, count: int, offset: int) -> PolarsTableManager:
+                if count < 0:
+                    raise ValueError("Count must be a positive integer")
+                if offset < 0:
+                    raise ValueError("Offset must be a non-negative integer")
+                return PolarsTableManager(
+                    self._original_data.slice(offset, count)
+                )
+
+            def get_num_rows(self, force: bool = True) -> Optional[int]:
+                native = self._original_data
+                if isinstance(native, pl.LazyFrame):
+                    if not force:
+                        return None
+                    return int(native.select(pl.len()).collect().item())
+                return native.height
+
+            def _approx_unique_counts(
+                self, columns: list[str]
+            ) -> dict[str, int]:
+                # HyperLogLog estimates, for the columns whose exact
+                # summaries have unique counts
+                counted = [
+                    column
+                    for column in columns
+                    if self.schema[column] == pl.String
+                    or self.schema[column].is_integer()
+                ]
+                if not counted:
+                    return {}
+                frame = self._original_data.select(
+                    pl.col(column).approx_n_unique() for column in counted
+                )
+                if isinstance(frame, pl.LazyFrame):
+                    frame = frame.collect()
+                return {
+                    column: int(count)
+                    for column, count in frame.row(0, named=True).items()
+                }
+
+            def _build_search_index(self) -> Optional[nw.Series[Any]]:
+                native = self._original_data
+                assert isinstance(native, pl.DataFrame)
+                columns: list[pl.Expr] = []
+                strings: list[str] = []
+                row_width = 0
+                for column, dtype in self.schema.items():
+                    if column == INDEX_COLUMN_NAME:
+                        continue
+                    if dtype == pl.String:
+                        columns.append(pl.col(column))
+                        strings.append(column)
+                        row_width += len(SEARCH_INDEX_SEPARATOR)
+                    elif (
+                        dtype.is_numeric()
+                        or dtype.is_temporal()
+                        or dtype == pl.Boolean
+                    ):
+                        columns.append(pl.col(column).cast(pl.String))
+                        row_width += SEARCH_INDEX_CAST_WIDTH
+                if not columns:
+                    return None
+                # The size of string buffers is known without a scan
+                nbytes = native.height * row_width + int(
+                    native.select(strings).estimated_size()
+                )
+                if nbytes > self.DEFAULT_SEARCH_INDEX_MAX_BYTES:
+                    return None
+                index = native.select(
+                    pl.concat_str(
+                        columns,
+                        separator=SEARCH_INDEX_SEPARATOR,
+                        ignore_nulls=True,
+                    ).str.to_lowercase()
+                ).to_series()
+                return nw.from_native(index, series_only=True)
 
             def search(self, query: str) -> PolarsTableManager:
                 query = query.lower()
 
+                search_index = self._search_index
+                index = search_index.get() if search_index else None
+                if index is not None:
+                    native = self._original_data
+                    assert isinstance(native, pl.DataFrame)
+                    mask = index.to_native().str.contains(f"(?m){query}")
+                    # Lists match on whole elements, so they aren't indexed
+                    for column, dtype in self.schema.items():
+                        if dtype == pl.List(pl.Utf8):
+                            mask = mask | native[column].list.contains(query)
+                    return PolarsTableManager(native.filter(mask))
+
                 expressions: list[pl.Expr] = []
                 for column, dtype in self.schema.items():
+                    if column == INDEX_COLUMN_NAME:
+                        continue
                     if dtype == pl.String:
                         expressions.append(
                             pl.col(column).str.contains(f"(?i){query}")
@@ -162,6 +271,8 @@ class PolarsTableManagerFactory(TableManagerFactory):
                     or_expr = or_expr | expr
 
                 filtered = self._original_data.filter(or_expr)
+                if search_index is not None:
+                    search_index.start()
                 return PolarsTableManager(filtered)
 
             # We override the default implementation to use polars's
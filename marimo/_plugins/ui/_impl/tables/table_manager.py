@@ -33,6 +33,12 @@ class TableManager(abc.ABC, Generic[T]):
     # Upper limit for column summaries to avoid hanging up the kernel
     # Note: Keep this value in sync with DataTablePlugin's banner text
     DEFAULT_SUMMARY_STATS_ROW_LIMIT = 1_000_000
+    # Upper limit in bytes for the search index, which holds the text of
+    # every row in memory; larger tables are searched column by column
+    DEFAULT_SEARCH_INDEX_MAX_BYTES = 500_000_000
+    # Memory budget for the filtered and sorted results that a table
+    # keeps, so that toggling between sorts or searches is instant
+    DEFAULT_SEARCH_CACHE_MAX_BYTES = 256_000_000
 
     type: str = ""
 
@@ -87,6 +93,20 @@ class TableManager(abc.ABC, Generic[T]):
     def to_json(self) -> bytes:
         pass
 
+    def to_arrow_ipc(
+        self,
+        format_mapping: Optional[FormatMapping] = None,
+    ) -> bytes:
+        """
+        Serialize the table as an Arrow IPC stream.
+
+        Unlike CSV, this keeps the column types and avoids a text
+        round-trip. Raises `NotImplementedError` if the table can't be
+        represented in Arrow.
+        """
+        del format_mapping
+        raise NotImplementedError("Arrow IPC serialization not supported")
+
     @abc.abstractmethod
     def select_rows(self, indices: list[int]) -> TableManager[Any]:
         pass
@@ -132,6 +152,21 @@ class TableManager(abc.ABC, Generic[T]):
     def get_summary(self, column: str) -> ColumnSummary:
         pass
 
+    def get_summaries(
+        self, columns: list[str], approximate: bool = False
+    ) -> dict[str, ColumnSummary]:
+        """
+        Summarize several columns at once.
+
+        With `approximate`, expensive statistics such as unique counts and
+        quantiles may be estimated or left out, so that large tables can be
+        summarized. Raises `NotImplementedError` if approximate summaries
+        are not supported.
+        """
+        if approximate:
+            raise NotImplementedError("Approximate summaries not supported")
+        return {column: self.get_summary(column) for column in columns}
+
     @abc.abstractmethod
     def get_num_rows(self, force: bool = True) -> Optional[int]:
         # This can be expensive to compute,
@@ -61,6 +61,9 @@ class ExecutionContext:
     local_cell_id: Optional[CellId_t] = None
     # output object set imperatively
     output: Optional[list[Html]] = None
+    # Number of output items sent to consumers as OutputDeltas, or None if
+    # consumers hold a full output instead
+    output_sent: Optional[int] = None
 
 
 @dataclass
@@ -2,18 +2,23 @@
 from __future__ import annotations
 
 import inspect
+import sys
 import weakref
-from copy import copy
+from copy import copy, deepcopy
 from typing import (
     Any,
     Callable,
     Generic,
+    Optional,
     Type,
     TypeVar,
     Union,
     cast,
 )
 
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._utils.memory import estimate_nbytes
+
 T = TypeVar("T")
 Ref = Union[weakref.ReferenceType[T], Callable[[], T]]
 
@@ -170,3 +175,151 @@ def shallow_copy(base: T) -> T:
     if isinstance(base, _Copy):
         return cast(T, shadow_wrap(ShallowCopy, copy(unwrap_copy(base))))
     return cast(T, shadow_wrap(ShallowCopy, copy(base)))
+
+
+def clone(
+    value: T, memo: Optional[dict[int, Any]] = None, read_only: bool = False
+) -> tuple[T, int]:
+    """
+    Copies a value for strict execution, sharing the data that a cell can't
+    mutate through the copy. Returns the copy and the approximate number of
+    bytes copied.
+
+    - numpy arrays are shared as read-only views;
+    - pyarrow arrays and tables are immutable, and shared;
+    - polars frames are cloned, which shares their buffers copy-on-write;
+    - pandas objects are shallow copies if copy-on-write is enabled
+      (`pd.options.mode.copy_on_write = True`), deep copies otherwise;
+    - lists, dicts, sets and tuples are rebuilt around cloned items;
+    - anything else is deep copied.
+
+    `memo` is shared with `deepcopy`, so objects referenced by several
+    values are copied once.
+
+    If `read_only`, no data is copied: pandas objects without copy-on-write
+    are shallow copies whose buffers are made read-only, and values that
+    would be deep copied raise a `CloneError`.
+    """
+    if memo is None:
+        memo = {}
+    copied = [0]
+
+    def remember(value: Any, result: Any) -> Any:
+        memo[id(value)] = result
+        # Keep the original alive while the memo refers to its id, as
+        # deepcopy does
+        memo.setdefault(id(memo), []).append(value)
+        return result
+
+    def recurse(value: Any) -> Any:
+        if id(value) in memo:
+            return memo[id(value)]
+        if isinstance(value, (bytes, str, int, float, complex, type(None))):
+            return value
+
+        cls = type(value)
+        # Mutable containers are memoized before their items, so that
+        # they can contain themselves
+        if cls is list:
+            items: list[Any] = remember(value, [])
+            items.extend(recurse(item) for item in value)
+            copied[0] += sys.getsizeof(items)
+            return items
+        if cls is dict:
+            entries: dict[Any, Any] = remember(value, {})
+            for k, v in value.items():
+                entries[recurse(k)] = recurse(v)
+            copied[0] += sys.getsizeof(entries)
+            return entries
+        if cls in (tuple, set, frozenset):
+            cloned = [recurse(item) for item in value]
+            if id(value) in memo:
+                # Reached again through its own items
+                return memo[id(value)]
+            if cls is not set and all(a is b for a, b in zip(cloned, value)):
+                return remember(value, value)
+            result = cls(cloned)
+            copied[0] += sys.getsizeof(result)
+            return remember(value, result)
+
+        result = _clone_data(value, copied, read_only)
+        if result is None:
+            if read_only:
+                raise CloneError(
+                    f"{cls.__name__} can't be shared without a deep copy"
+                )
+            result = deepcopy(value, memo)
+            copied[0] += _nbytes(result)
+        return remember(value, result)
+
+    return cast(T, recurse(value)), copied[0]
+
+
+def _clone_data(value: Any, copied: list[int], read_only: bool) -> Any:
+    """Clones dataframes and arrays, or returns None for other values."""
+    if DependencyManager.numpy.imported():
+        import numpy as np
+
+        if type(value) is np.ndarray and not value.dtype.hasobject:
+            view = value.view()
+            view.flags.writeable = False
+            return view
+
+    if DependencyManager.pyarrow.imported():
+        import pyarrow as pa
+
+        if isinstance(
+            value, (pa.Array, pa.ChunkedArray, pa.RecordBatch, pa.Table)
+        ):
+            return value
+
+    if DependencyManager.polars.imported():
+        import polars as pl
+
+        if isinstance(value, (pl.DataFrame, pl.Series, pl.LazyFrame)):
+            return value.clone()
+
+    if DependencyManager.pandas.imported():
+        import pandas as pd
+
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            if _pandas_copy_on_write(pd):
+                return value.copy(deep=False)
+            if read_only:
+                return _pandas_read_only(value)
+            result = value.copy(deep=True)
+            copied[0] += _nbytes(result)
+            return result
+
+    return None
+
+
+def _pandas_read_only(value: Any) -> Any:
+    """Shallow copy of a pandas object that can't write to its buffers."""
+    import numpy as np
+
+    result = value.copy(deep=False)
+    for block in result._mgr.blocks:
+        if not isinstance(block.values, np.ndarray):
+            # e.g., categoricals and other extension arrays
+            raise CloneError(
+                f"{type(block.values).__name__} columns can't be made "
+                "read-only"
+            )
+        block.values.flags.writeable = False
+    return result
+
+
+def _pandas_copy_on_write(pd: Any) -> bool:
+    try:
+        return pd.options.mode.copy_on_write is True
+    except AttributeError:
+        # Copy-on-write is the only mode from pandas 3
+        return int(pd.__version__.split(".")[0]) >= 3
+
+
+def _nbytes(value: Any) -> int:
+    try:
+        return estimate_nbytes(value)
+    except Exception:
+        return sys.getsizeof(value)
@@ -1,9 +1,20 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import itertools
 import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 from marimo import _loggers
 from marimo._ast.cell import (
@@ -11,7 +22,7 @@ from marimo._ast.cell import (
 )
 from marimo._ast.compiler import code_key
 from marimo._ast.variables import is_mangled_local
-from marimo._ast.visitor import ImportData, Name, VariableData
+from marimo._ast.visitor import ImportData, Language, Name, VariableData
 from marimo._runtime.executor import execute_cell, execute_cell_async
 from marimo._types.ids import CellId_t
 
@@ -29,6 +40,266 @@ EdgeWithVar = Tuple[CellId_t, List[str], CellId_t]
 
 LOGGER = _loggers.marimo_logger()
 
+# Upper bound on the number of cell ids held by memoized closures
+CLOSURE_CACHE_MAX_SIZE = 500_000
+
+
+class TopologicalOrder:
+    """A topological order of a graph's cells, maintained as edges are added.
+
+    Uses the Pearce-Kelly algorithm: an edge that agrees with the order
+    can't close a cycle and costs O(1), and an edge against it only
+    reorders the cells between its endpoints. The order is invalid while
+    the graph has cycles.
+    """
+
+    def __init__(self) -> None:
+        self.index: dict[CellId_t, int] = {}
+        self.valid = True
+        self._first = 0
+        self._next = 0
+
+    def add_node(self, cell_id: CellId_t, first: bool = False) -> None:
+        """Add a cell without edges, last or, if `first`, first in order.
+
+        Cells that won't have parents should be added first, so that their
+        edges agree with the order.
+        """
+        if first:
+            self._first -= 1
+            self.index[cell_id] = self._first
+        else:
+            self.index[cell_id] = self._next
+            self._next += 1
+
+    def remove_node(self, cell_id: CellId_t) -> None:
+        # Removing a node keeps the order of the others valid
+        del self.index[cell_id]
+
+    def add_edge(
+        self,
+        children: dict[CellId_t, set[CellId_t]],
+        parents: dict[CellId_t, set[CellId_t]],
+        parent: CellId_t,
+        child: CellId_t,
+    ) -> bool:
+        """Reorder cells for a new edge (parent, child), before it is added.
+
+        Returns False if the edge closes a cycle, which invalidates the
+        order, or if the order is already invalid.
+        """
+        if not self.valid:
+            return False
+        lower, upper = self.index[child], self.index[parent]
+        if lower > upper:
+            return True
+
+        # Cells reachable from child that precede parent
+        forward: list[CellId_t] = []
+        stack = [child]
+        seen = {child}
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for cid in children[node]:
+                if cid == parent:
+                    self.valid = False
+                    return False
+                if cid not in seen and self.index[cid] < upper:
+                    seen.add(cid)
+                    stack.append(cid)
+
+        # Cells that reach parent and follow child
+        backward: list[CellId_t] = []
+        stack = [parent]
+        seen = {parent}
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for cid in parents[node]:
+                if cid not in seen and self.index[cid] > lower:
+                    seen.add(cid)
+                    stack.append(cid)
+
+        # Move the ancestors of parent before the descendants of child,
+        # reusing their positions
+        nodes = sorted(backward, key=self.index.__getitem__) + sorted(
+            forward, key=self.index.__getitem__
+        )
+        positions = sorted(self.index[cid] for cid in nodes)
+        for cid, position in zip(nodes, positions):
+            self.index[cid] = position
+        return True
+
+    def rebuild(self, graph: DirectedGraph) -> None:
+        """Recompute the order from scratch, e.g. after a cycle is broken."""
+        order = topological_sort(graph, graph.cells.keys())
+        self.valid = len(order) == len(graph.cells)
+        if self.valid:
+            self.index = {cid: i for i, cid in enumerate(order)}
+            self._first = 0
+            self._next = len(order)
+
+
+class ClosureCache:
+    """Memoized ancestors and descendants of cells.
+
+    The graph clears the cache whenever cells are registered or deleted.
+    If the memoized closures exceed `max_size` cell ids in total, the
+    cache is cleared.
+    """
+
+    def __init__(self, max_size: int = CLOSURE_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._closures: dict[tuple[CellId_t, bool], frozenset[CellId_t]] = {}
+        self._size = 0
+
+    def get(
+        self, graph: DirectedGraph, cell_id: CellId_t, children: bool
+    ) -> frozenset[CellId_t]:
+        """The descendants (or ancestors) of `cell_id`, excluding itself."""
+        key = (cell_id, children)
+        closure = self._closures.get(key)
+        if closure is None:
+            closure = frozenset(_reachable(graph, cell_id, children))
+            if self._size + len(closure) > self.max_size:
+                self.clear()
+            self._closures[key] = closure
+            self._size += len(closure)
+        return closure
+
+    def clear(self) -> None:
+        self._closures.clear()
+        self._size = 0
+
+
+def _reachable(
+    graph: DirectedGraph, cell_id: CellId_t, children: bool
+) -> set[CellId_t]:
+    relatives = graph.children if children else graph.parents
+    reached: set[CellId_t] = set()
+    queue = deque([cell_id])
+    while queue:
+        for cid in relatives[queue.popleft()]:
+            if cid not in reached:
+                reached.add(cid)
+                queue.append(cid)
+    reached.discard(cell_id)
+    return reached
+
+
+# For each declaration of a name: the declaration, the defined names it
+# requires, and the private (cell-local) names it requires
+ReferenceEdges = Tuple[
+    Tuple[VariableData, frozenset[Name], frozenset[Name]], ...
+]
+
+
+class ReferenceCache:
+    """Memoized block-level references of defined names.
+
+    Caches, per name, the names each of its declarations requires, and
+    the closure of these references (the result of
+    `get_transitive_references({name})` without a predicate). Entries are
+    invalidated by `invalidate` when cells defining names are registered
+    or deleted, dropping only the names whose references may change.
+    """
+
+    def __init__(self) -> None:
+        self._edges: dict[Name, ReferenceEdges] = {}
+        self._closures: dict[Name, frozenset[Name]] = {}
+        # name -> names whose declarations require it
+        self._referrers: dict[Name, set[Name]] = {}
+        # name -> names whose memoized closure traversed it
+        self._members: dict[Name, set[Name]] = {}
+
+    def edges(self, graph: DirectedGraph, name: Name) -> ReferenceEdges:
+        """The references of each declaration of `name` in `graph`."""
+        edges = self._edges.get(name)
+        if edges is None:
+            edges = tuple(
+                (
+                    datum,
+                    frozenset(datum.required_refs & graph.definitions.keys()),
+                    frozenset(
+                        ref
+                        for ref in datum.required_refs
+                        if ref not in graph.definitions
+                        and is_mangled_local(ref, cell_id)
+                    ),
+                )
+                for cell_id in graph.definitions.get(name, ())
+                for datum in graph.cells[cell_id].variable_data.get(name, ())
+            )
+            for datum, _, _ in edges:
+                for ref in datum.required_refs:
+                    self._referrers.setdefault(ref, set()).add(name)
+            self._edges[name] = edges
+        return edges
+
+    def closure(self, graph: DirectedGraph, name: Name) -> frozenset[Name]:
+        """The transitive references of `name`, including itself."""
+        closure = self._closures.get(name)
+        if closure is None:
+            traversed = {name}
+            closure = frozenset(
+                _transitive_references(
+                    graph, {name}, lambda *_: True, traversed
+                )
+            )
+            for member in traversed:
+                self._members.setdefault(member, set()).add(name)
+            self._closures[name] = closure
+        return closure
+
+    def invalidate(self, names: set[Name]) -> None:
+        """Drop entries that depend on the definitions of `names`."""
+        stale = set(names)
+        for name in names:
+            stale.update(self._referrers.get(name, ()))
+        for name in stale:
+            for datum, _, _ in self._edges.pop(name, ()):
+                for ref in datum.required_refs:
+                    referrers = self._referrers.get(ref)
+                    if referrers is not None:
+                        referrers.discard(name)
+            for root in self._members.pop(name, ()):
+                self._closures.pop(root, None)
+
+    def clear(self) -> None:
+        self._edges.clear()
+        self._closures.clear()
+        self._referrers.clear()
+        self._members.clear()
+
+
+def _transitive_references(
+    graph: DirectedGraph,
+    refs: set[Name],
+    predicate: Callable[[Name, VariableData], bool],
+    traversed: set[Name],
+) -> set[Name]:
+    """Names reachable from `refs` through declarations satisfying
+    `predicate`, including the defined names in `refs`; defined names
+    visited are added to `traversed`."""
+    processed: set[Name] = set()
+    queue = [ref for ref in refs if ref in graph.definitions]
+    while queue:
+        name = queue.pop()
+        if name in processed:
+            continue
+        processed.add(name)
+        traversed.add(name)
+        for datum, defined, private in graph.reference_cache.edges(
+            graph, name
+        ):
+            if predicate(name, datum):
+                # Private variables referenced by public functions have to
+                # be included.
+                processed.update(private)
+                queue.extend(defined - processed)
+    return processed
+
 
 # TODO(akshayka): Add method disable_cell, enable_cell which handle
 # state transitions on cells
@@ -56,9 +327,34 @@ class DirectedGraph:
     # A mapping from defs to the cells that define them
     definitions: dict[Name, set[CellId_t]] = field(default_factory=dict)
 
+    # A mapping from names to the cells that refer to them, by the language
+    # of the referring cell
+    references: dict[Language, dict[Name, set[CellId_t]]] = field(
+        default_factory=lambda: {"python": {}, "sql": {}}
+    )
+
     # The set of cycles in the graph
     cycles: set[tuple[Edge, ...]] = field(default_factory=set)
 
+    # Used to skip the search for cycles when adding most edges
+    order: TopologicalOrder = field(default_factory=TopologicalOrder)
+
+    # Registration order of the cells, used to break ties when sorting
+    registration_index: dict[CellId_t, int] = field(default_factory=dict)
+    _registrations: Iterator[int] = field(
+        default_factory=itertools.count, repr=False, compare=False
+    )
+
+    # Ancestors and descendants of cells, valid until the graph changes
+    closures: ClosureCache = field(
+        default_factory=ClosureCache, repr=False, compare=False
+    )
+
+    # Block-level references of defined names, updated as cells change
+    reference_cache: ReferenceCache = field(
+        default_factory=ReferenceCache, repr=False, compare=False
+    )
+
     # This lock must be acquired during methods that mutate the graph; it's
     # only needed because a graph is shared between the kernel and the code
     # completion service. It should almost always be uncontended.
@@ -85,36 +381,48 @@ class DirectedGraph:
 
         The variable can be either a Python variable or a SQL variable (table).
         """
-        children = set()
-        for cid, cell in self.cells.items():
-            if name not in cell.refs:
-                continue
-            elif language == "sql" and cell.language == "python":
-                # SQL variables don't leak to Python cells, but
-                # Python variables do leak to SQL cells
-                continue
-            children.add(cid)
-
+        children = set(self.references["sql"].get(name, ()))
+        # SQL variables don't leak to Python cells, but
+        # Python variables do leak to SQL cells
+        if language != "sql":
+            children.update(self.references["python"].get(name, ()))
         return children
 
     def get_path(self, source: CellId_t, dst: CellId_t) -> list[Edge]:
-        """Get a path from `source` to `dst`, if any."""
+        """Get a shortest path from `source` to `dst`, if any."""
         if source == dst:
             return []
 
-        queue: list[tuple[CellId_t, list[Edge]]] = [(source, [])]
-        found = set()
+        predecessors = {source: source}
+        queue = deque([source])
         while queue:
-            node, path = queue.pop(0)
-            found.add(node)
+            node = queue.popleft()
             for cid in self.children[node]:
-                if cid not in found:
-                    next_path = path + [(node, cid)]
-                    if cid == dst:
-                        return next_path
-                    queue.append((cid, next_path))
+                if cid in predecessors:
+                    continue
+                predecessors[cid] = node
+                if cid == dst:
+                    path: list[Edge] = []
+                    while cid != source:
+                        path.append((predecessors[cid], cid))
+                        cid = predecessors[cid]
+                    return path[::-1]
+                queue.append(cid)
         return []
 
+    def _add_edge(self, parent: CellId_t, child: CellId_t) -> None:
+        """Add the edge (parent, child), recording the cycle it closes."""
+        if child in self.children[parent]:
+            return
+        if not self.order.add_edge(self.children, self.parents, parent, child):
+            # If there is a path from child to parent, the new edge forms
+            # a cycle
+            path = self.get_path(child, parent)
+            if path:
+                self.cycles.add(tuple([(parent, child)] + path))
+        self.children[parent].add(child)
+        self.parents[child].add(parent)
+
     def register_cell(self, cell_id: CellId_t, cell: CellImpl) -> None:
         """Add a cell to the graph.
 
@@ -126,20 +434,25 @@ class DirectedGraph:
         with self.lock:
             LOGGER.debug("Acquired graph lock.")
             assert cell_id not in self.cells
+            self.closures.clear()
+            self.reference_cache.invalidate(cell.defs)
             self.cells[cell_id] = cell
-            # Children are the set of cells that refer to a name defined in
-            # `cell`
-            children: set[CellId_t] = set()
-            # Cells that define the same name as this one
-            siblings: set[CellId_t] = set()
-            # Parents are the set of cells that define a name referred to by
-            # `cell`
-            parents: set[CellId_t] = set()
+            self.registration_index[cell_id] = next(self._registrations)
+            self.order.add_node(
+                cell_id,
+                first=not any(name in self.definitions for name in cell.refs),
+            )
+            references = self.references[cell.language]
+            for name in cell.refs:
+                references.setdefault(name, set()).add(cell_id)
 
-            # Populate children, siblings, and parents
-            self.children[cell_id] = children
-            self.siblings[cell_id] = siblings
-            self.parents[cell_id] = parents
+            # Children are the cells that refer to a name defined in `cell`,
+            # siblings are the cells that define the same name as this one,
+            # and parents are the cells that define a name referred to by
+            # `cell`
+            self.children[cell_id] = set()
+            self.siblings[cell_id] = siblings = set()
+            self.parents[cell_id] = set()
             for name, variable_data in cell.variable_data.items():
                 self.definitions.setdefault(name, set()).add(cell_id)
                 for sibling in self.definitions[name]:
@@ -154,17 +467,8 @@ class DirectedGraph:
                     name,
                     language=variable_data[-1].language,
                 ) - set((cell_id,))
-                # we will add an edge (cell_id, v) for each v in
-                # referring_cells; if there is a path from v to cell_id, then
-                # the new edge will form a cycle
-                for v in referring_cells:
-                    path = self.get_path(v, cell_id)
-                    if path:
-                        self.cycles.add(tuple([(cell_id, v)] + path))
-
-                children.update(referring_cells)
                 for child in referring_cells:
-                    self.parents[child].add(cell_id)
+                    self._add_edge(cell_id, child)
 
             for name in cell.refs:
                 other_ids_defining_name = (
@@ -182,27 +486,42 @@ class DirectedGraph:
                     if language == "sql" and cell.language == "python":
                         # SQL table/db def -> Python ref is not an edge
                         continue
-                    parents.add(other_id)
-                    # we are adding an edge (other_id, cell_id). If there
-                    # is a path from cell_id to other_id, then the new
-                    # edge forms a cycle
-                    path = self.get_path(cell_id, other_id)
-                    if path:
-                        self.cycles.add(tuple([(other_id, cell_id)] + path))
-                    self.children[other_id].add(cell_id)
+                    self._add_edge(other_id, cell_id)
         LOGGER.debug("Registered cell %s and released graph lock", cell_id)
-        if self.is_any_ancestor_stale(cell_id):
+        # A single pass over the ancestors, stopping once both are found
+        any_stale = any_disabled = False
+        for cid in self._iter_ancestors(cell_id):
+            ancestor = self.cells[cid]
+            any_stale = any_stale or ancestor.stale
+            any_disabled = any_disabled or ancestor.config.disabled
+            if any_stale and any_disabled:
+                break
+        if any_stale:
             self.set_stale(set([cell_id]))
 
-        if self.is_any_ancestor_disabled(cell_id):
+        if any_disabled:
             cell.set_runtime_state(status="disabled-transitively")
 
+    def _iter_ancestors(self, cell_id: CellId_t) -> Iterator[CellId_t]:
+        seen = set([cell_id])
+        queue = deque([cell_id])
+        while queue:
+            for parent in self.parents[queue.popleft()]:
+                if parent not in seen:
+                    seen.add(parent)
+                    queue.append(parent)
+                    yield parent
+
     def is_any_ancestor_stale(self, cell_id: CellId_t) -> bool:
-        return any(self.cells[cid].stale for cid in self.ancestors(cell_id))
+        return any(
+            self.cells[cid].stale
+            for cid in self.closures.get(self, cell_id, children=False)
+        )
 
     def is_any_ancestor_disabled(self, cell_id: CellId_t) -> bool:
         return any(
-            self.cells[cid].config.disabled for cid in self.ancestors(cell_id)
+            self.cells[cid].config.disabled
+            for cid in self.closures.get(self, cell_id, children=False)
         )
 
     def disable_cell(self, cell_id: CellId_t) -> None:
@@ -258,8 +577,18 @@ class DirectedGraph:
             if cell_id not in self.cells:
                 raise ValueError(f"Cell {cell_id} not found")
 
+            self.closures.clear()
+            cell = self.cells[cell_id]
+            self.reference_cache.invalidate(cell.defs)
+            references = self.references[cell.language]
+            for name in cell.refs:
+                referring_cells = references[name]
+                referring_cells.remove(cell_id)
+                if not referring_cells:
+                    del references[name]
+
             # Removing this cell from its defs' definer sets
-            for name in self.cells[cell_id].defs:
+            for name in cell.defs:
                 name_defs = self.definitions[name]
                 name_defs.remove(cell_id)
                 if not name_defs:
@@ -280,20 +609,20 @@ class DirectedGraph:
             children = self.children[cell_id]
 
             # Purge this cell from the graph.
+            for child in children:
+                self.parents[child].discard(cell_id)
+            for parent in self.parents[cell_id]:
+                self.children[parent].discard(cell_id)
+            for sibling in self.siblings[cell_id]:
+                self.siblings[sibling].discard(cell_id)
             del self.cells[cell_id]
             del self.children[cell_id]
             del self.parents[cell_id]
             del self.siblings[cell_id]
-
-            for elems in self.parents.values():
-                if cell_id in elems:
-                    elems.remove(cell_id)
-            for elems in self.children.values():
-                if cell_id in elems:
-                    elems.remove(cell_id)
-            for elems in self.siblings.values():
-                if cell_id in elems:
-                    elems.remove(cell_id)
+            del self.registration_index[cell_id]
+            self.order.remove_node(cell_id)
+            if not self.order.valid and not self.cycles:
+                self.order.rebuild(self)
         LOGGER.debug("Deleted cell %s and Released graph lock.", cell_id)
         return children
 
@@ -303,19 +632,7 @@ class DirectedGraph:
         cell = self.cells[cell_id]
         if cell.config.disabled:
             return True
-        seen: set[CellId_t] = set()
-        queue = [cell_id]
-        while queue:
-            cid = queue.pop()
-            seen.add(cid)
-            for parent_id in self.parents[cid]:
-                if parent_id in seen:
-                    continue
-                elif self.cells[parent_id].config.disabled:
-                    return True
-                else:
-                    queue.append(parent_id)
-        return False
+        return self.is_any_ancestor_disabled(cell_id)
 
     def get_imports(
         self, cell_id: Optional[CellId_t] = None
@@ -345,12 +662,10 @@ class DirectedGraph:
         return names
 
     def descendants(self, cell_id: CellId_t) -> set[CellId_t]:
-        return transitive_closure(self, set([cell_id]), inclusive=False)
+        return set(self.closures.get(self, cell_id, children=True))
 
     def ancestors(self, cell_id: CellId_t) -> set[CellId_t]:
-        return transitive_closure(
-            self, set([cell_id]), children=False, inclusive=False
-        )
+        return set(self.closures.get(self, cell_id, children=False))
 
     def set_stale(
         self, cell_ids: set[CellId_t], prune_imports: bool = False
@@ -376,37 +691,16 @@ class DirectedGraph:
 
         If predicate, only references satisfying predicate(ref) are included
         """
-        # TODO: Consider caching on the graph level and updating on register /
-        # delete
-        processed = set()
-        queue = set(refs & self.definitions.keys())
-        predicate = predicate or (lambda *_: True)
-
-        while queue:
-            # Should ideally be one cell per ref, but for completion, stay
-            # agnostic to potenital cycles.
-            cells = set().union(*[self.definitions[ref] for ref in queue])
-            for cell_id in cells:
-                data = self.cells[cell_id].variable_data
-                variables = set(data.keys())
-                # intersection of variables and queue
-                newly_processed = variables & queue
-                processed.update(newly_processed)
-                queue.difference_update(newly_processed)
-                for variable in newly_processed:
-                    # variables can be defined multiple times in a single
-                    # cell ...
-                    for datum in data[variable]:
-                        if predicate(variable, datum):
-                            to_process = datum.required_refs - processed
-                            queue.update(to_process & self.definitions.keys())
-                            # Private variables referenced by public functions
-                            # have to be included.
-                            for maybe_private in (
-                                to_process - self.definitions.keys()
-                            ):
-                                if is_mangled_local(maybe_private, cell_id):
-                                    processed.add(maybe_private)
+        if predicate is None:
+            processed: set[Name] = set().union(
+                *[
+                    self.reference_cache.closure(self, ref)
+                    for ref in refs
+                    if ref in self.definitions
+                ]
+            )
+        else:
+            processed = _transitive_references(self, refs, predicate, set())
 
         if inclusive:
             return processed | refs
@@ -435,27 +729,34 @@ def transitive_closure(
     If predicate, only cells satisfying predicate(cell) are included; applied
         after the relatives are computed
     """
-    seen = set()
+    if relatives is None:
+        # Reuse the memoized closure of each cell
+        reached: set[CellId_t] = set().union(
+            *[graph.closures.get(graph, cid, children) for cid in cell_ids]
+        )
+        if inclusive:
+            reached.update(cell_ids)
+        else:
+            reached.difference_update(cell_ids)
+        if predicate is None:
+            return reached
+        return set(cid for cid in reached if predicate(graph.cells[cid]))
+
+    seen = set(cell_ids)
     cells = set()
-    queue = list(cell_ids)
+    queue = deque(cell_ids)
     predicate = predicate or (lambda _: True)
 
-    def _relatives(cid: CellId_t) -> set[CellId_t]:
-        if relatives is None:
-            return graph.children[cid] if children else graph.parents[cid]
-
-        return relatives(graph, cid, children)
-
     while queue:
-        cid = queue.pop(0)
-        seen.add(cid)
+        cid = queue.popleft()
         cell = graph.cells[cid]
         if inclusive and predicate(cell):
             cells.add(cid)
         elif cid not in cell_ids and predicate(cell):
             cells.add(cid)
-        for relative in _relatives(cid):
+        for relative in relatives(graph, cid, children):
             if relative not in seen:
+                seen.add(relative)
                 queue.append(relative)
     return cells
 
@@ -498,9 +799,7 @@ def topological_sort(
 
     parents, children = induced_subgraph(graph, cell_ids)
     # Use registration order as tiebreaker
-    top_down_keys = {
-        key: index for index, key in enumerate(graph.cells.keys())
-    }
+    top_down_keys = graph.registration_index
 
     # Initialize heap with roots (nodes with no parents)
     heap: list[tuple[int, CellId_t]] = []
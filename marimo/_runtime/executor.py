@@ -1,18 +1,32 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import ast
+import asyncio
+import contextlib
+import importlib
 import inspect
+import io
+import marshal
+import multiprocessing
+import pickle
 import re
+import sys
+import threading
+import traceback
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Optional, Type
 
 from marimo._ast.cell import CellImpl, _is_coroutine
 from marimo._ast.variables import is_mangled_local, unmangle_local
+from marimo._loggers import marimo_logger
 from marimo._runtime.copy import (
     CloneError,
     ShallowCopy,
     ZeroCopy,
+    clone,
     shallow_copy,
 )
 from marimo._runtime.exceptions import (
@@ -30,6 +44,11 @@ from marimo._runtime.primitives import (
 if TYPE_CHECKING:
     from marimo._runtime.dataflow import DirectedGraph
 
+LOGGER = marimo_logger()
+
+# Strict execution warns in the console of a cell when it copies more than
+# this many bytes of the cell's inputs
+STRICT_COPY_WARNING_BYTES = 100_000_000
 
 EXECUTION_TYPES: dict[str, Type[Executor]] = {}
 
@@ -148,6 +167,14 @@ class DefaultExecutor(Executor):
 
 @register_execution_type("strict")
 class StrictExecutor(Executor):
+    """Runs cells against copies of their refs, so that cells can't mutate
+    each other's definitions.
+
+    Copies share what they can with the original values (see
+    `marimo._runtime.copy.clone`): arrays are read-only views, and
+    dataframes are copy-on-write where the library supports it.
+    """
+
     @staticmethod
     async def execute_cell_async(
         cell: CellImpl, glbls: dict[str, Any], graph: DirectedGraph
@@ -209,6 +236,9 @@ class StrictExecutor(Executor):
             if key in glbls
         }
 
+        # Shared across refs, so that values they share are copied once
+        memo: dict[int, Any] = {}
+        nbytes = 0
         for ref in refs:
             if ref in glbls:
                 if (
@@ -226,7 +256,8 @@ class StrictExecutor(Executor):
                     lcls[ref] = shallow_copy(glbls[ref])
                 else:
                     try:
-                        lcls[ref] = deepcopy(glbls[ref])
+                        lcls[ref], copied = clone(glbls[ref], memo)
+                        nbytes += copied
                     except TypeError as e:
                         raise CloneError(
                             f"Could not clone reference `{ref}` of type "
@@ -244,6 +275,18 @@ class StrictExecutor(Executor):
                     )
                 raise MarimoMissingRefError(ref)
 
+        cell.set_bytes_copied(nbytes)
+        LOGGER.debug(
+            "Copied %d bytes of inputs for cell %s", nbytes, cell.cell_id
+        )
+        if nbytes > STRICT_COPY_WARNING_BYTES:
+            # Written to the console of the cell that is about to run
+            sys.stderr.write(
+                f"Strict execution copied ~{nbytes / 1e6:,.0f} MB of this "
+                "cell's inputs. To share large values instead, wrap them "
+                "in a `zero_copy` call, or enable pandas copy-on-write.\n"
+            )
+
         # NOTE: Execution expects the globals dictionary by memory reference,
         # so we need to clear it and update it with the sanitized locals,
         # returning a backup of the original globals for later restoration.
@@ -284,3 +327,311 @@ class StrictExecutor(Executor):
         for df in lcls:
             if is_mangled_local(df, cell.cell_id):
                 glbls[df] = lcls[df]
+
+
+# Lazily created, shared by all kernels in this process.
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+# Methods that mutate their receiver in place
+_MUTATING_METHODS = frozenset(
+    {
+        "add",
+        "append",
+        "clear",
+        "discard",
+        "extend",
+        "fill",
+        "insert",
+        "itemset",
+        "pop",
+        "popitem",
+        "put",
+        "remove",
+        "resize",
+        "reverse",
+        "setdefault",
+        "setflags",
+        "sort",
+        "update",
+    }
+)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            # The kernel is multithreaded, so forking is unsafe.
+            _PROCESS_POOL = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _PROCESS_POOL
+
+
+def _root_name(node: ast.expr) -> Optional[str]:
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def _process_ineligibility(
+    cell: CellImpl, glbls: dict[str, Any]
+) -> Optional[str]:
+    """Why a cell can't run in a worker process, or None if it can.
+
+    Decided before the cell runs, so that a cell is never run twice: a
+    cell must not be a coroutine, must not use marimo, must not define
+    values that can't be sent back (functions, classes, modules), and must
+    not mutate its refs in place.
+    """
+    if cell.body is None or cell.last_expr is None:
+        return "empty cell"
+    if _is_coroutine(cell.body) or _is_coroutine(cell.last_expr):
+        return "coroutine"
+
+    for ref in cell.refs:
+        value = glbls.get(ref)
+        if (
+            inspect.ismodule(value)
+            and value.__name__.split(".")[0] == "marimo"
+        ):
+            # UI elements, outputs, etc. need the kernel's context
+            return "uses marimo"
+
+    for name in cell.defs:
+        for data in cell.variable_data.get(name, []):
+            if data.kind in ("function", "class", "import"):
+                return f"defines {data.kind} `{name}`"
+
+    # cell.mod doesn't include the last expression
+    for node in ast.walk(ast.parse(cell.code)):
+        if isinstance(node, (ast.Attribute, ast.Subscript)) and isinstance(
+            node.ctx, (ast.Store, ast.Del)
+        ):
+            root = _root_name(node)
+            if root in cell.refs:
+                return f"mutates `{root}`"
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in _MUTATING_METHODS
+        ):
+            root = _root_name(node.func.value)
+            if root in cell.refs and not inspect.ismodule(glbls.get(root)):
+                return f"mutates `{root}`"
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(
+            node.value, (ast.Lambda, ast.GeneratorExp)
+        ):
+            return "defines a lambda or generator"
+    return None
+
+
+class _RemoteTraceback(Exception):
+    """Carries the traceback of an exception raised in a worker."""
+
+    def __init__(self, tb: str) -> None:
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+@dataclass
+class _ProcessResult:
+    output: Any = None
+    defs: dict[str, Any] = field(default_factory=dict)
+    stdout: str = ""
+    stderr: str = ""
+    error: Optional[BaseException] = None
+    traceback: str = ""
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _ensure_picklable(description: str, value: Any) -> None:
+    try:
+        _dumps(value)
+    except Exception as e:
+        raise pickle.PicklingError(
+            f"{description} of type {type(value).__name__} could not be "
+            "sent back from the worker process; run this cell with another "
+            "execution type."
+        ) from e
+
+
+def _execute_in_subprocess(
+    body: bytes,
+    last_expr: bytes,
+    refs: dict[str, bytes],
+    modules: dict[str, str],
+    defs: list[str],
+) -> Optional[bytes]:
+    """Run a cell's code objects against pickled refs in a worker process.
+
+    Returns a pickled `_ProcessResult`, or None if the refs could not be
+    loaded, in which case the cell has not run and should be run in the
+    kernel instead.
+    """
+    try:
+        glbls: dict[str, Any] = {
+            name: pickle.loads(value) for name, value in refs.items()
+        }
+        for name, module_name in modules.items():
+            glbls[name] = importlib.import_module(module_name)
+    except Exception:
+        return None
+
+    result = _ProcessResult()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        try:
+            exec(marshal.loads(body), glbls)
+            result.output = eval(marshal.loads(last_expr), glbls)
+            result.defs = {df: glbls[df] for df in defs if df in glbls}
+            _ensure_picklable("the output", result.output)
+            for name, value in result.defs.items():
+                _ensure_picklable(f"`{name}`", value)
+        except BaseException as e:
+            result = _ProcessResult(error=e, traceback=traceback.format_exc())
+    result.stdout = stdout.getvalue()
+    result.stderr = stderr.getvalue()
+
+    try:
+        return _dumps(result)
+    except Exception:
+        # the exception itself doesn't pickle
+        result.error = RuntimeError(repr(result.error))
+        return _dumps(result)
+
+
+@register_execution_type("process")
+class ProcessExecutor(Executor):
+    """Runs pure, CPU-bound cells in a pool of worker processes.
+
+    The cell's refs are pickled and shipped to a worker along with its
+    compiled code; its defs are merged back into the kernel globals, and
+    its stdout and stderr are written to the cell's console.
+
+    Whether a cell can run in a worker is decided before it runs (see
+    `_process_ineligibility`); cells that can't run with the default
+    executor in the kernel. A cell never runs twice: if its defs can't be
+    sent back, the cell fails. Only the cell's defs are merged back: in
+    place mutations of refs that the static check misses (e.g., through a
+    module function like `heapq.heapify`) and other side effects, such as
+    changes to module state, do not reach the kernel.
+    """
+
+    @staticmethod
+    def _submit(
+        cell: CellImpl, glbls: dict[str, Any]
+    ) -> Optional[Future[Optional[bytes]]]:
+        reason = _process_ineligibility(cell, glbls)
+        if reason is not None:
+            LOGGER.debug("Running cell %s in kernel: %s", cell.cell_id, reason)
+            return None
+        assert cell.body is not None
+        assert cell.last_expr is not None
+
+        refs: dict[str, bytes] = {}
+        modules: dict[str, str] = {}
+        for ref in cell.refs:
+            if ref not in glbls:
+                # builtins resolve in the worker; missing names raise there
+                continue
+            value = glbls[ref]
+            if inspect.ismodule(value):
+                modules[ref] = value.__name__
+                continue
+            try:
+                refs[ref] = _dumps(value)
+            except Exception as e:
+                LOGGER.debug(
+                    "Running cell %s in kernel, `%s` not picklable: %s",
+                    cell.cell_id,
+                    ref,
+                    e,
+                )
+                return None
+
+        return _get_process_pool().submit(
+            _execute_in_subprocess,
+            marshal.dumps(cell.body),
+            marshal.dumps(cell.last_expr),
+            refs,
+            modules,
+            sorted(cell.defs),
+        )
+
+    @staticmethod
+    def _merge(
+        cell: CellImpl,
+        glbls: dict[str, Any],
+        graph: DirectedGraph,
+        payload: bytes,
+    ) -> Any:
+        result: _ProcessResult = pickle.loads(payload)
+        if result.stdout:
+            sys.stdout.write(result.stdout)
+        if result.stderr:
+            sys.stderr.write(result.stderr)
+        if result.error is not None:
+            result.error.__cause__ = _RemoteTraceback(result.traceback)
+            if isinstance(result.error, NameError):
+                raise_name_error(graph, result.error)
+            raise MarimoRuntimeException from result.error
+
+        for df in cell.defs:
+            if df in result.defs:
+                glbls[df] = result.defs[df]
+            elif df in glbls:
+                # not defined by this run, so the old value is stale
+                del glbls[df]
+        return result.output
+
+    @staticmethod
+    async def execute_cell_async(
+        cell: CellImpl, glbls: dict[str, Any], graph: DirectedGraph
+    ) -> Any:
+        future = ProcessExecutor._submit(cell, glbls)
+        if future is None:
+            return await DefaultExecutor.execute_cell_async(cell, glbls, graph)
+        try:
+            payload = await asyncio.wrap_future(future)
+        except (BaseException, Exception) as e:
+            # the worker failed, e.g. the pool broke or the run was cancelled
+            raise MarimoRuntimeException from e
+        if payload is None:
+            LOGGER.debug(
+                "Running cell %s in kernel, could not load it in a worker "
+                "process",
+                cell.cell_id,
+            )
+            return await DefaultExecutor.execute_cell_async(cell, glbls, graph)
+        return ProcessExecutor._merge(cell, glbls, graph, payload)
+
+    @staticmethod
+    def execute_cell(
+        cell: CellImpl, glbls: dict[str, Any], graph: DirectedGraph
+    ) -> Any:
+        future = ProcessExecutor._submit(cell, glbls)
+        if future is None:
+            return DefaultExecutor.execute_cell(cell, glbls, graph)
+        try:
+            payload = future.result()
+        except (BaseException, Exception) as e:
+            future.cancel()
+            raise MarimoRuntimeException from e
+        if payload is None:
+            LOGGER.debug(
+                "Running cell %s in kernel, could not load it in a worker "
+                "process",
+                cell.cell_id,
+            )
+            return DefaultExecutor.execute_cell(cell, glbls, graph)
+        return ProcessExecutor._merge(cell, glbls, graph, payload)
@@ -1,16 +1,62 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from marimo._messaging.cell_output import CellChannel
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from marimo._messaging.cell_output import CellChannel, OutputDelta
 from marimo._messaging.ops import CellOp
 from marimo._messaging.tracebacks import write_traceback
 from marimo._output import formatting
 from marimo._output.rich_help import mddoc
-from marimo._plugins.stateless.flex import vstack
 from marimo._runtime.context import get_context
 from marimo._runtime.context.types import ContextNotInitializedError
 from marimo._types.ids import CellId_t
 
+if TYPE_CHECKING:
+    from marimo._runtime.context.types import ExecutionContext
+
+
+def write_items(
+    execution_context: ExecutionContext,
+    replaced: Sequence[int] = (),
+    truncate: Optional[int] = None,
+) -> None:
+    """Send changes to the accumulated output of a cell.
+
+    Only the changed items are sent, as deltas against the items that were
+    sent before (see `OutputDelta`), so building an output of n items costs
+    O(n) bytes instead of O(n^2).
+
+    Args:
+        execution_context: context of the running cell
+        replaced: indices of items that changed in place
+        truncate: index from which items were removed or reordered
+    """
+    items = execution_context.output or []
+    deltas: list[OutputDelta] = []
+    sent = execution_context.output_sent
+    if sent is None:
+        # Consumers hold a full output (or an output of a previous run)
+        deltas.append(OutputDelta(kind="truncate", index=0))
+        sent = 0
+    if truncate is not None and truncate < sent:
+        deltas.append(OutputDelta(kind="truncate", index=truncate))
+        sent = truncate
+    for idx in replaced:
+        if idx < sent:
+            deltas.append(
+                OutputDelta(kind="replace", index=idx, data=items[idx].text)
+            )
+    for idx in range(sent, len(items)):
+        deltas.append(
+            OutputDelta(kind="append", index=idx, data=items[idx].text)
+        )
+    execution_context.output_sent = len(items)
+    if deltas:
+        CellOp.broadcast_output_delta(
+            deltas, cell_id=execution_context.cell_id
+        )
+
 
 def write_internal(cell_id: CellId_t, value: object) -> None:
     output = formatting.try_format(value)
@@ -47,6 +93,7 @@ def replace(value: object) -> None:
         ctx.execution_context.output = None
     else:
         ctx.execution_context.output = [formatting.as_html(value)]
+    ctx.execution_context.output_sent = None
     write_internal(cell_id=ctx.execution_context.cell_id, value=value)
 
 
@@ -78,10 +125,7 @@ def replace_at_index(value: object, idx: int) -> None:
         ctx.execution_context.output.append(formatting.as_html(value))
     else:
         ctx.execution_context.output[idx] = formatting.as_html(value)
-    write_internal(
-        cell_id=ctx.execution_context.cell_id,
-        value=vstack(ctx.execution_context.output),
-    )
+    write_items(ctx.execution_context, replaced=[idx])
 
 
 @mddoc
@@ -107,10 +151,7 @@ def append(value: object) -> None:
         ctx.execution_context.output = [formatting.as_html(value)]
     else:
         ctx.execution_context.output.append(formatting.as_html(value))
-    write_internal(
-        cell_id=ctx.execution_context.cell_id,
-        value=vstack(ctx.execution_context.output),
-    )
+    write_items(ctx.execution_context)
 
 
 @mddoc
@@ -130,10 +171,31 @@ def flush() -> None:
         return
 
     if ctx.execution_context.output is not None:
-        value = vstack(ctx.execution_context.output)
+        write_items(
+            ctx.execution_context,
+            replaced=range(len(ctx.execution_context.output)),
+        )
     else:
-        value = None
-    write_internal(cell_id=ctx.execution_context.cell_id, value=value)
+        ctx.execution_context.output_sent = None
+        write_internal(cell_id=ctx.execution_context.cell_id, value=None)
+
+
+def refresh(value: object) -> None:
+    """Internal function to re-render an object in a cell's output."""
+    try:
+        ctx = get_context()
+    except ContextNotInitializedError:
+        return
+
+    if ctx.execution_context is None or ctx.execution_context.output is None:
+        return
+    replaced = [
+        idx
+        for idx, item in enumerate(ctx.execution_context.output)
+        if item is value
+    ]
+    if replaced:
+        write_items(ctx.execution_context, replaced=replaced)
 
 
 def remove(value: object) -> None:
@@ -145,8 +207,15 @@ def remove(value: object) -> None:
 
     if ctx.execution_context is None or ctx.execution_context.output is None:
         return
-    output = [
-        item for item in ctx.execution_context.output if item is not value
-    ]
-    ctx.execution_context.output = output if output else None
-    flush()
+    previous = ctx.execution_context.output
+    output = [item for item in previous if item is not value]
+    if not output:
+        ctx.execution_context.output = None
+        flush()
+        return
+    first_removed = next(
+        (idx for idx, item in enumerate(previous) if item is value),
+        len(previous),
+    )
+    ctx.execution_context.output = output
+    write_items(ctx.execution_context, truncate=first_removed)
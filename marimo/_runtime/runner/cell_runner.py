@@ -8,6 +8,12 @@ import io
 import signal
 import threading
 import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 
@@ -48,6 +54,7 @@ if TYPE_CHECKING:
     )
     from marimo._runtime.runner.hooks_pre_execution import PreExecutionHookType
     from marimo._runtime.runner.hooks_preparation import PreparationHookType
+    from marimo._runtime.shared_state import SharedApp
     from marimo._runtime.state import State
 
 
@@ -89,6 +96,16 @@ class Runner:
             [CellId_t], contextlib._GeneratorContextManager[ExecutionContext]
         ]
         | None = None,
+        worker_execution_context: Callable[
+            [CellId_t], contextlib._GeneratorContextManager[ExecutionContext]
+        ]
+        | None = None,
+        interrupt_context: Callable[
+            [CellId_t], contextlib.AbstractContextManager[Any]
+        ]
+        | None = None,
+        max_workers: int = 1,
+        shared_state: SharedApp | None = None,
         preparation_hooks: Sequence[PreparationHookType] | None = None,
         pre_execution_hooks: Sequence[PreExecutionHookType] | None = None,
         post_execution_hooks: Sequence[PostExecutionHookType] | None = None,
@@ -100,6 +117,16 @@ class Runner:
 
         # injected context and hooks
         self.execution_context = execution_context
+        # context installed on worker threads when running cells in parallel;
+        # must be created on the kernel thread and entered on the worker
+        self.worker_execution_context = worker_execution_context
+        # context installed on the kernel thread while it waits on worker
+        # threads, so that the kernel's interrupt handler sees a running cell
+        self.interrupt_context = interrupt_context
+        # number of cells that may run concurrently; 1 means serial execution
+        self.max_workers = max_workers
+        # results of UI-independent cells, shared across run-mode sessions
+        self.shared_state = shared_state
         self.preparation_hooks: Sequence[Callable[["Runner"], Any]] = (
             preparation_hooks or []
         )
@@ -137,6 +164,9 @@ class Runner:
         self.interrupted = False
         # mapping from cell_id to exception it raised
         self.exceptions: dict[CellId_t, ErrorObjects] = {}
+        # guards the state above, which cells running on worker threads
+        # update concurrently
+        self._lock = threading.RLock()
 
         # each cell's position in the run queue
         self._run_position = {
@@ -220,19 +250,25 @@ class Runner:
 
     def cancel(self, cell_id: CellId_t) -> None:
         """Mark a cell (and its descendants) as cancelled."""
-        self.cells_cancelled[cell_id] = set(
-            cid
-            for cid in dataflow.transitive_closure(self.graph, set([cell_id]))
-            if cid in self.cells_to_run
-        )
-        for cid in self.cells_cancelled[cell_id]:
+        with self._lock:
+            cancelled = set(
+                cid
+                for cid in dataflow.transitive_closure(
+                    self.graph, set([cell_id])
+                )
+                if cid in self.cells_to_run
+            )
+            self.cells_cancelled[cell_id] = cancelled
+        for cid in cancelled:
             self.graph.cells[cid].set_run_result_status("cancelled")
 
     def cancelled(self, cell_id: CellId_t) -> bool:
         """Return whether a cell has been cancelled."""
-        return any(
-            cell_id in cancelled for cancelled in self.cells_cancelled.values()
-        )
+        with self._lock:
+            return any(
+                cell_id in cancelled
+                for cancelled in self.cells_cancelled.values()
+            )
 
     def pending(self) -> bool:
         """Whether there are more cells to run."""
@@ -315,11 +351,32 @@ class Runner:
 
     def pop_cell(self) -> CellId_t:
         """Get the next cell to run."""
-        return self.cells_to_run.pop(0)
+        with self._lock:
+            return self.cells_to_run.pop(0)
 
     async def run(self, cell_id: CellId_t) -> RunResult:
         """Run a cell."""
+        cell = self.graph.cells[cell_id]
+        if self.shared_state is None or not self.shared_state.is_candidate(
+            cell, self.graph
+        ):
+            return await self._execute(cell_id)
+
+        with self.shared_state.claim(cell) as claim:
+            if claim.cell is not None:
+                # Another session already ran this cell; bind its results
+                # instead of running it again.
+                LOGGER.debug("Binding shared definitions of %s", cell_id)
+                defs, output = claim.cell.view()
+                self.glbls.update(defs)
+                return RunResult(output=output, exception=None)
+            run_result = await self._execute(cell_id)
+            claim.record(
+                cell, self.glbls, run_result.output, run_result.success()
+            )
+            return run_result
 
+    async def _execute(self, cell_id: CellId_t) -> RunResult:
         cell = self.graph.cells[cell_id]
         try:
             if cell.is_coroutine():
@@ -425,7 +482,8 @@ class Runner:
 
             # Handle other special runtime errors.
             elif isinstance(unwrapped_exception, ModuleNotFoundError):
-                self.missing_packages = True
+                with self._lock:
+                    self.missing_packages = True
 
             elif isinstance(unwrapped_exception, MarimoStopError):
                 output = unwrapped_exception.output
@@ -474,7 +532,8 @@ class Runner:
             # Mark as interrupted if the cell raised a MarimoInterrupt
             # Set here since failed async can also trigger an Interrupt.
             if isinstance(run_result.exception, MarimoInterrupt):
-                self.interrupted = True
+                with self._lock:
+                    self.interrupted = True
 
             # if a debugger is active, force it to skip past marimo code.
             try:
@@ -501,7 +560,8 @@ class Runner:
                 )
 
         if run_result.exception is not None:
-            self.exceptions[cell_id] = run_result.exception
+            with self._lock:
+                self.exceptions[cell_id] = run_result.exception
 
         return run_result
 
@@ -520,49 +580,201 @@ class Runner:
                 blamed_cell = var_cell_id
         return ref, blamed_cell
 
-    async def run_all(self) -> None:
-        LOGGER.debug("Running preparation hooks")
-        for prep_hook in self.preparation_hooks:
-            prep_hook(self)
+    def _skip_if_unrunnable(self, cell_id: CellId_t) -> bool:
+        """Update run result status for cells that won't run.
+
+        Returns `True` if the cell should be skipped.
+        """
+        cell = self.graph.cells[cell_id]
+        # Hack: frontend sets status to queued on run, so we also have to
+        # set runtime_state to get FE to transition.
+        if self.cancelled(cell_id):
+            LOGGER.debug("%s cancelled", cell_id)
+            cell.set_run_result_status("cancelled")
+            cell.set_runtime_state("idle")
+            return True
+        if cell.config.disabled:
+            LOGGER.debug("%s disabled", cell_id)
+            cell.set_run_result_status("disabled")
+            cell.set_runtime_state("idle")
+            return True
+        if self.graph.is_disabled(cell_id):
+            LOGGER.debug("%s disabled transitively", cell_id)
+            cell.set_run_result_status("disabled")
+            cell.set_runtime_state("disabled-transitively")
+            return True
+        return False
+
+    def _run_pre_execution_hooks(self, cell_id: CellId_t) -> None:
+        LOGGER.debug("Running pre_execution hooks")
+        cell = self.graph.cells[cell_id]
+        for pre_hook in self.pre_execution_hooks:
+            pre_hook(cell, self)
+
+    def _run_post_execution_hooks(
+        self, cell_id: CellId_t, run_result: RunResult
+    ) -> None:
+        LOGGER.debug("Running post_execution hooks")
+        cell = self.graph.cells[cell_id]
+        for post_hook in self.post_execution_hooks:
+            post_hook(cell, self, run_result)
+
+    async def _run_cell(self, cell_id: CellId_t) -> None:
+        """Run a cell on the kernel thread, with its hooks."""
+        self._run_pre_execution_hooks(cell_id)
+        LOGGER.debug("Running cell %s", cell_id)
+        if self.execution_context is not None:
+            with self.execution_context(cell_id) as exc_ctx:
+                run_result = await self.run(cell_id)
+                run_result.accumulated_output = exc_ctx.output
+        else:
+            run_result = await self.run(cell_id)
+        self._run_post_execution_hooks(cell_id, run_result)
+
+    def _run_in_worker(
+        self,
+        cell_id: CellId_t,
+        worker_context: contextlib._GeneratorContextManager[ExecutionContext],
+    ) -> RunResult:
+        """Run a (non-coroutine) cell on a worker thread.
 
+        Hooks are not run here; they are run on the kernel thread.
+        """
+        LOGGER.debug("Running cell %s on worker thread", cell_id)
+        with worker_context as exc_ctx:
+            # Non-coroutine cells never await, so a private event loop
+            # suffices to drive `run`.
+            run_result = asyncio.run(self.run(cell_id))
+            run_result.accumulated_output = exc_ctx.output
+        return run_result
+
+    async def _run_all_serial(self) -> None:
         while self.pending():
             cell_id = self.pop_cell()
             LOGGER.debug("Cell runner processing %s", cell_id)
-            cell = self.graph.cells[cell_id]
-
-            # Update run result status for cells that won't run.
-            #
-            # Hack: frontend sets status to queued on run, so we also have to
-            # set runtime_state to get FE to transition.
-            if self.cancelled(cell_id):
-                LOGGER.debug("%s cancelled", cell_id)
-                cell.set_run_result_status("cancelled")
-                cell.set_runtime_state("idle")
-                continue
-            if cell.config.disabled:
-                LOGGER.debug("%s disabled", cell_id)
-                cell.set_run_result_status("disabled")
-                cell.set_runtime_state("idle")
-                continue
-            if self.graph.is_disabled(cell_id):
-                LOGGER.debug("%s disabled transitively", cell_id)
-                cell.set_run_result_status("disabled")
-                cell.set_runtime_state("disabled-transitively")
+            if self._skip_if_unrunnable(cell_id):
                 continue
+            await self._run_cell(cell_id)
+
+    async def _run_all_parallel(self) -> None:
+        """Run cells whose parents have finished concurrently.
+
+        Non-coroutine cells are run on a thread pool, each with its own
+        copy of the runtime context. Coroutine cells share the kernel's
+        context, so they are run on the kernel's event loop only when no
+        other cell is in flight. Hooks always run on the kernel thread, in
+        completion order.
+
+        Cells that are already running on a worker thread can't be
+        interrupted; after an interrupt, they run to completion but no new
+        cells are scheduled.
+        """
+        assert self.worker_execution_context is not None
+        scheduled = set(self.cells_to_run)
+        # parents of each cell that have not yet finished in this run
+        waiting_on = {
+            cid: set(p for p in self.graph.parents[cid] if p in scheduled)
+            for cid in self.cells_to_run
+        }
+
+        def release(cell_id: CellId_t) -> None:
+            for child in self.graph.children[cell_id]:
+                if child in waiting_on:
+                    waiting_on[child].discard(cell_id)
+
+        running: dict[Future[RunResult], CellId_t] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="marimo-runner",
+        ) as pool:
+            while running or self.pending():
+                # cells_to_run is kept in topological order, so ready cells
+                # are started in the same order the serial runner uses
+                ready = [
+                    cid for cid in self.cells_to_run if not waiting_on[cid]
+                ]
+                progressed = False
+                for cell_id in ready:
+                    if self.interrupted or len(running) >= self.max_workers:
+                        break
+                    cell = self.graph.cells[cell_id]
+                    if cell.is_coroutine() and running:
+                        # wait for in-flight cells to drain
+                        continue
+                    with self._lock:
+                        self.cells_to_run.remove(cell_id)
+                    progressed = True
+                    LOGGER.debug("Cell runner processing %s", cell_id)
+                    if self._skip_if_unrunnable(cell_id):
+                        release(cell_id)
+                        continue
+                    if cell.is_coroutine():
+                        await self._run_cell(cell_id)
+                        release(cell_id)
+                        continue
+                    self._run_pre_execution_hooks(cell_id)
+                    future = pool.submit(
+                        self._run_in_worker,
+                        cell_id,
+                        self.worker_execution_context(cell_id),
+                    )
+                    running[future] = cell_id
+
+                if not running:
+                    if self.interrupted:
+                        break
+                    if not progressed and self.pending():
+                        # Defensive: nothing is ready even though no cell
+                        # is in flight; fall back to topological order.
+                        cell_id = self.pop_cell()
+                        if not self._skip_if_unrunnable(cell_id):
+                            await self._run_cell(cell_id)
+                        release(cell_id)
+                    continue
 
-            LOGGER.debug("Running pre_execution hooks")
-            for pre_hook in self.pre_execution_hooks:
-                pre_hook(cell, self)
-            LOGGER.debug("Running cell %s", cell_id)
-            if self.execution_context is not None:
-                with self.execution_context(cell_id) as exc_ctx:
-                    run_result = await self.run(cell_id)
-                    run_result.accumulated_output = exc_ctx.output
+                for future in self._wait_for_workers(running):
+                    cell_id = running.pop(future)
+                    run_result = future.result()
+                    self._run_post_execution_hooks(cell_id, run_result)
+                    release(cell_id)
+
+    def _wait_for_workers(
+        self, running: dict[Future[RunResult], CellId_t]
+    ) -> set[Future[RunResult]]:
+        """Block until at least one in-flight cell finishes.
+
+        The kernel thread blocks, as it does when running a cell serially,
+        so that an interrupt is raised here instead of in the event loop.
+        Returns no futures if the wait was interrupted.
+        """
+        try:
+            if self.interrupt_context is None or self.interrupted:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
             else:
-                run_result = await self.run(cell_id)
-            LOGGER.debug("Running post_execution hooks")
-            for post_hook in self.post_execution_hooks:
-                post_hook(cell, self, run_result)
+                with self.interrupt_context(next(iter(running.values()))):
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+        except MarimoInterrupt:
+            LOGGER.debug("Parallel run interrupted")
+            with self._lock:
+                self.interrupted = True
+            return set()
+        return done
+
+    async def run_all(self) -> None:
+        LOGGER.debug("Running preparation hooks")
+        for prep_hook in self.preparation_hooks:
+            prep_hook(self)
+
+        # Strict and process executors rebind the kernel's globals while a
+        # cell runs, so their cells can't share them across threads.
+        if (
+            self.max_workers > 1
+            and self.worker_execution_context is not None
+            and self.execution_type == "relaxed"
+        ):
+            await self._run_all_parallel()
+        else:
+            await self._run_all_serial()
 
         LOGGER.debug("Running on_finish hooks")
         for finish_hook in self.on_finish_hooks:
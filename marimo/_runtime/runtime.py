@@ -129,7 +129,9 @@ from marimo._runtime.runner.hooks_post_execution import PostExecutionHookType
 from marimo._runtime.runner.hooks_pre_execution import PreExecutionHookType
 from marimo._runtime.runner.hooks_preparation import PreparationHookType
 from marimo._runtime.scratch import SCRATCH_CELL_ID
+from marimo._runtime.shared_state import SHARED_STATE, SharedApp
 from marimo._runtime.state import State
+from marimo._runtime.threads import THREADS
 from marimo._runtime.utils.set_ui_element_request_manager import (
     SetUIElementRequestManager,
 )
@@ -527,6 +529,14 @@ class Kernel:
         self.execution_type: ExecutionType = user_config.get(
             "experimental", {}
         ).get("execution_type", "relaxed")
+        # Number of independent cells that may run concurrently; opt-in,
+        # since cells that share mutable state implicitly may race.
+        self.max_workers: int = user_config.get("experimental", {}).get(
+            "max_workers", 1
+        )
+        # Results of cells that don't depend on UI elements, shared with
+        # other sessions of the same app; only set in run mode.
+        self.shared_state: SharedApp | None = None
         self._update_runtime_from_user_config(user_config)
 
         # initializers to override construction of ui elements
@@ -559,6 +569,9 @@ class Kernel:
         # globals appear to leak, even though the thread exits. As a hack we
         # manually clear kernel memory.
         self._module.__dict__.clear()
+        if self.shared_state is not None:
+            SHARED_STATE.release(self.shared_state)
+            self.shared_state = None
 
     def lazy(self) -> bool:
         return self.reactive_execution_mode == "lazy"
@@ -711,6 +724,63 @@ class Kernel:
                         reload=False,
                     )
 
+    @contextlib.contextmanager
+    def _install_interrupt_context(self, cell_id: CellId_t) -> Iterator[None]:
+        """Mark a cell as executing while the kernel waits on workers.
+
+        The interrupt handler only raises when a cell is executing, so this
+        is installed while the kernel thread waits on cells running on
+        worker threads.
+        """
+        ctx = get_context()
+        assert isinstance(ctx, KernelRuntimeContext)
+        try:
+            ctx.execution_context = ExecutionContext(
+                cell_id, setting_element_value=False
+            )
+            yield
+        finally:
+            ctx.execution_context = None
+
+    def _worker_execution_context(
+        self, cell_id: CellId_t
+    ) -> contextlib._GeneratorContextManager[ExecutionContext]:
+        """Context for running a cell on a worker thread.
+
+        Must be called on the kernel thread; the returned context manager
+        is entered on the worker thread.
+        """
+        ctx = get_context()
+        assert isinstance(ctx, KernelRuntimeContext)
+        return self._install_worker_execution_context(ctx, cell_id)
+
+    @contextlib.contextmanager
+    def _install_worker_execution_context(
+        self, ctx: KernelRuntimeContext, cell_id: CellId_t
+    ) -> Iterator[ExecutionContext]:
+        # Like mo.Thread, each worker gets its own copy of the runtime
+        # context; the stream copy shares the pipe and its lock, but is
+        # bound to this cell. Standard streams are not yet threadsafe, so
+        # they aren't redirected; print is forwarded by print_override.
+        worker_ctx = KernelRuntimeContext(**ctx.__dict__)
+        worker_ctx.stream = copy(ctx.stream)
+        worker_ctx.stream.cell_id = cell_id
+        worker_ctx.stdout = None
+        worker_ctx.stderr = None
+        worker_ctx.execution_context = (
+            exec_ctx := ExecutionContext(cell_id, setting_element_value=False)
+        )
+        thread_id = threading.get_ident()
+        THREADS.add(thread_id)
+        try:
+            with (
+                worker_ctx.install(),
+                worker_ctx.provide_ui_ids(str(cell_id)),
+            ):
+                yield exec_ctx
+        finally:
+            THREADS.discard(thread_id)
+
     def _register_cell(self, cell_id: CellId_t, cell: CellImpl) -> None:
         if cell_id in self.cell_metadata:
             # If we already have a config for this cell id, restore it
@@ -1330,8 +1400,10 @@ class Kernel:
             run_result: cell_runner.RunResult,
         ) -> None:
             del cell_impl
-            del runner
-            if isinstance(run_result.exception, MarimoInterrupt):
+            # a parallel run is interrupted while its cells are in flight
+            if runner.interrupted or isinstance(
+                run_result.exception, MarimoInterrupt
+            ):
                 self.last_interrupt_timestamp = time.time()
 
         runner = cell_runner.Runner(
@@ -1343,6 +1415,10 @@ class Kernel:
             execution_mode=self.reactive_execution_mode,
             execution_type=self.execution_type,
             execution_context=self._install_execution_context,
+            worker_execution_context=self._worker_execution_context,
+            interrupt_context=self._install_interrupt_context,
+            max_workers=self.max_workers,
+            shared_state=self.shared_state,
             preparation_hooks=self._preparation_hooks + [invalidate_state],
             pre_execution_hooks=self._pre_execution_hooks,
             post_execution_hooks=self._post_execution_hooks
@@ -2238,10 +2314,13 @@ def launch_kernel(
             LOGGER.debug("Failed to connect to socket.")
             return
 
+        # Messages cross a process boundary, so they are sent pre-encoded
+        # for the frontend instead of pickled.
         stream = ThreadSafeStream(
             pipe=pipe,
             input_queue=input_queue,
             redirect_console=should_redirect_stdio,
+            binary=True,
         )
     elif stream_queue is not None:
         stream = ThreadSafeStream(
@@ -2304,6 +2383,13 @@ def launch_kernel(
         mode=SessionMode.EDIT if is_edit_mode else SessionMode.RUN,
     )
 
+    if not is_edit_mode and user_config.get("experimental", {}).get(
+        "share_initial_state", False
+    ):
+        # Run-mode kernels are threads of the server process, so results of
+        # cells that don't depend on UI elements can be shared among them.
+        kernel.shared_state = SHARED_STATE.acquire(app_metadata)
+
     if is_edit_mode:
         # completions only provided in edit mode
         kernel.start_completion_worker(completion_queue)
@@ -0,0 +1,260 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Initial notebook state shared read-only across run-mode sessions.
+
+In run mode, every session runs in a thread of the same server process,
+and re-executes cells whose results are identical for all viewers (loading
+a dataset, fitting a model, ...). When sharing is enabled, the first
+session to run such a cell publishes its definitions; later sessions bind
+the published objects into their own globals instead of executing the cell.
+
+A cell is shareable if all of its parents are shareable and, when it runs,
+it succeeds without constructing UI elements or state, and without
+imperatively appending to its output. Only cells that depend on UI
+elements (directly or transitively) run per session, so memory scales with
+the number of distinct UI states instead of the number of sessions.
+
+Sessions never receive the published objects themselves, but clones that
+share their data (see `marimo._runtime.copy`): numpy arrays are bound as
+read-only views, pyarrow and polars data share their buffers, and pandas
+objects share their buffers copy-on-write or, without copy-on-write,
+read-only. A session that mutates its clone can't corrupt the state of
+another session. Cells whose definitions could only be deep copied (e.g.,
+fitted models) are not shared, since memory would again scale with the
+number of sessions; nor are cells that define functions or classes, since
+these look up globals in the namespace of the session that defined them.
+
+A shared app lives as long as one of its sessions does, and holds at most
+one result per cell: running a cell with different code replaces it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import json
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from marimo._loggers import marimo_logger
+from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._runtime.context import get_context
+from marimo._runtime.copy import ZeroCopy, clone
+from marimo._runtime.primitives import (
+    from_unclonable_module,
+    is_unclonable_type,
+)
+from marimo._runtime.state import SetFunctor, State
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import CellImpl
+    from marimo._runtime.dataflow import DirectedGraph
+    from marimo._runtime.requests import AppMetadata
+
+LOGGER = marimo_logger()
+
+# (cell id, code): a cell is only shared with sessions running the same code
+CellKey = tuple[CellId_t, str]
+
+
+@dataclass
+class SharedCell:
+    # The cell's definitions, bound to the objects created by its first run
+    defs: dict[str, Any]
+    # Raw output of the cell (last expression)
+    output: Any
+
+    def view(self) -> tuple[dict[str, Any], Any]:
+        """Clones of the definitions and output, for one session."""
+        # Shared across values, so that objects they share are cloned once
+        memo: dict[int, Any] = {}
+        defs = {name: _clone(value, memo) for name, value in self.defs.items()}
+        # The output can't be referenced by other cells, so it is shared as
+        # is, unless it is also one of the definitions
+        return defs, memo.get(id(self.output), self.output)
+
+
+def _clone(value: Any, memo: dict[int, Any]) -> Any:
+    if (
+        isinstance(value, ZeroCopy)
+        or inspect.ismodule(value)
+        or from_unclonable_module(value)
+        or is_unclonable_type(value)
+    ):
+        return value
+    return clone(value, memo, read_only=True)[0]
+
+
+@dataclass
+class SharedClaim:
+    """Result of claiming a cell for a session.
+
+    `cell` is not None when another session already ran the cell; otherwise
+    the claiming session must run the cell and `record` its result.
+    """
+
+    app: SharedApp
+    key: CellKey
+    cell: Optional[SharedCell] = None
+
+    def record(
+        self, cell: CellImpl, glbls: dict[str, Any], output: Any, ok: bool
+    ) -> None:
+        if not ok or not _is_shareable(cell, glbls, output):
+            LOGGER.debug("Cell %s is not shareable", cell.cell_id)
+            self.app._publish(self.key, None)
+            return
+        # Private variables are mangled in globals and only visible to the
+        # cell itself, so they are not shared.
+        shared = SharedCell(
+            {name: glbls[name] for name in cell.defs if name in glbls},
+            output,
+        )
+        try:
+            # The session that ran the cell gets clones as well, so that it
+            # can't mutate the published objects.
+            defs, _ = shared.view()
+        except Exception as e:
+            LOGGER.debug("Cell %s is not shareable: %s", cell.cell_id, e)
+            self.app._publish(self.key, None)
+            return
+        glbls.update(defs)
+        self.app._publish(self.key, shared)
+
+
+def _is_shareable(cell: CellImpl, glbls: dict[str, Any], output: Any) -> bool:
+    ctx = get_context()
+    if (
+        ctx.execution_context is not None
+        and ctx.execution_context.output is not None
+    ):
+        # mo.output.append et al. are side effects that aren't replayed
+        return False
+    if ctx.ui_element_registry.constructed_by(cell.cell_id):
+        return False
+    for value in [output, *(glbls.get(name) for name in cell.defs)]:
+        if isinstance(value, (UIElement, State, SetFunctor)):
+            return False
+        if inspect.isfunction(value) or inspect.isclass(value):
+            # Their globals are the namespace of this session
+            return False
+    return True
+
+
+class SharedApp:
+    """Shared cells for one app, as viewed with one set of parameters."""
+
+    def __init__(self, key: Optional[str] = None) -> None:
+        # Key of the app in its registry, if any
+        self.key = key
+        # Number of sessions using the app
+        self.sessions = 0
+        # cell id -> (code, cell); a None cell marks a cell that ran but was
+        # found not to be shareable
+        self._cells: dict[CellId_t, tuple[str, Optional[SharedCell]]] = {}
+        # One lock per cell, so that concurrent sessions wait for the first
+        # run instead of duplicating it
+        self._cell_locks: dict[CellId_t, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(cell: CellImpl) -> CellKey:
+        return (cell.cell_id, cell.code)
+
+    def _lookup(self, key: CellKey) -> tuple[bool, Optional[SharedCell]]:
+        """Whether the cell ran with this code, and its shared result."""
+        cell_id, code = key
+        entry = self._cells.get(cell_id)
+        if entry is None or entry[0] != code:
+            return False, None
+        return True, entry[1]
+
+    def is_candidate(self, cell: CellImpl, graph: DirectedGraph) -> bool:
+        """Whether the cell may be shared, given what is known so far."""
+        if cell.is_coroutine() or cell.config.disabled:
+            return False
+        with self._lock:
+            ran, shared = self._lookup(self._key(cell))
+            if ran and shared is None:
+                return False
+            for parent_id in graph.parents.get(cell.cell_id, set()):
+                parent = graph.cells[parent_id]
+                if self._lookup(self._key(parent))[1] is None:
+                    return False
+        return True
+
+    @contextlib.contextmanager
+    def claim(self, cell: CellImpl) -> Iterator[SharedClaim]:
+        key = self._key(cell)
+        with self._lock:
+            cell_lock = self._cell_locks.setdefault(
+                cell.cell_id, threading.Lock()
+            )
+        with cell_lock:
+            with self._lock:
+                claim = SharedClaim(self, key, self._lookup(key)[1])
+            yield claim
+
+    def _publish(self, key: CellKey, cell: Optional[SharedCell]) -> None:
+        cell_id, code = key
+        with self._lock:
+            # Replaces the result of the cell's previous code, if any
+            self._cells[cell_id] = (code, cell)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(cell is not None for _, cell in self._cells.values())
+
+
+class SharedStateRegistry:
+    """Process-wide registry of shared apps, refcounted by session."""
+
+    def __init__(self) -> None:
+        self._apps: dict[str, SharedApp] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def app_key(app_metadata: AppMetadata) -> str:
+        # Query params and CLI args can change what a cell computes without
+        # a UI element being involved, so they are part of the key.
+        return json.dumps(
+            [
+                app_metadata.filename,
+                app_metadata.query_params,
+                app_metadata.cli_args,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    def acquire(self, app_metadata: AppMetadata) -> SharedApp:
+        """Shared app for a new session; release it when the session ends."""
+        key = self.app_key(app_metadata)
+        with self._lock:
+            if key not in self._apps:
+                self._apps[key] = SharedApp(key)
+            app = self._apps[key]
+            app.sessions += 1
+            return app
+
+    def release(self, app: SharedApp) -> None:
+        """Drops the app, and its shared objects, with its last session."""
+        with self._lock:
+            if app.key is None or self._apps.get(app.key) is not app:
+                return
+            app.sessions -= 1
+            if app.sessions <= 0:
+                del self._apps[app.key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._apps)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._apps.clear()
+
+
+SHARED_STATE = SharedStateRegistry()
@@ -56,6 +56,7 @@ class Thread(threading.Thread):
                     input_queue=ctx.stream.input_queue,
                     cell_id=ctx.stream.cell_id,
                     redirect_console=False,
+                    binary=ctx.stream.binary,
                 )
             else:
                 raise RuntimeError(
@@ -71,6 +72,7 @@ class Thread(threading.Thread):
                     input_queue=ctx.stream.input_queue,
                     cell_id=ctx.stream.cell_id,
                     redirect_console=False,
+                    binary=ctx.stream.binary,
                 )
             else:
                 raise RuntimeError(
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import hashlib
 import mimetypes
+import os
 import random
 import string
 import sys
@@ -19,7 +21,7 @@ from marimo._utils.data_uri import build_data_url
 from marimo._utils.platform import is_pyodide
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from marimo._runtime.context.types import RuntimeContext
 
@@ -35,13 +37,9 @@ _ALPHABET = string.ascii_letters + string.digits
 
 def random_filename(ext: str) -> str:
     # adapted from: https://stackoverflow.com/questions/13484726/safe-enough-8-character-short-unique-random-string  # noqa: E501
-    # TODO(akshayka): should callers redraw if they get a collision?
-    try:
-        tid = str(threading.get_native_id())
-    except AttributeError:
-        # get_native_id() not implemented in pyodide/WASM
-        tid = "0"
-    basename = tid + "-" + "".join(random.choices(_ALPHABET, k=8))
+    basename = (
+        _native_thread_id() + "-" + "".join(random.choices(_ALPHABET, k=8))
+    )
     return f"{basename}.{ext}"
 
 
@@ -120,30 +118,21 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
     def create(self, context: "RuntimeContext" | None) -> None:
         """Create the virtual file
 
-        Every virtual file gets a unique random name. Uniqueness is
-        required for reference counting.
+        Virtual files are named by their contents, so that files with the
+        same contents share storage; the registry counts their owners.
         """
-        filename = random_filename(self.ext)
         if context is None or not context.virtual_files_supported:
             self._virtual_file = VirtualFile(
-                filename=filename, buffer=self.buffer, as_data_url=True
+                filename=random_filename(self.ext),
+                buffer=self.buffer,
+                as_data_url=True,
             )
             return
 
         registry = context.virtual_file_registry
-        # create a unique filename for the virtual file
-        tries = 0
-        max_tries = 100
-        while registry.has(filename) and tries < max_tries:
-            filename = random_filename(self.ext)
-            tries += 1
-        if tries > max_tries:
-            raise RuntimeError(
-                "Failed to add virtual file to registry. "
-                "This is a bug in marimo. Please file an issue."
-            )
+        filename = registry.content_filename(self.ext, self.buffer)
         self._virtual_file = VirtualFile(filename, self.buffer)
-        context.virtual_file_registry.add(self._virtual_file, context)
+        registry.add(self._virtual_file, context)
 
     def dispose(self, context: "RuntimeContext", deletion: bool) -> bool:
         # Remove the file if the refcount is 0, or if the cell is being
@@ -159,12 +148,32 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
         return False
 
 
+# Total size of the virtual files of a kernel; beyond it, files that are
+# no longer used by any cell are evicted, least recently used first.
+VIRTUAL_FILES_MAX_BYTES = int(
+    os.getenv("MARIMO_VIRTUAL_FILES_MAX_BYTES", 256_000_000)
+)
+
+
+def _native_thread_id() -> str:
+    try:
+        return str(threading.get_native_id())
+    except AttributeError:
+        # get_native_id() not implemented in pyodide/WASM
+        return "0"
+
+
 @dataclasses.dataclass
 class VirtualFileRegistryItem:
     # contents of the file
     shm: shared_memory.SharedMemory
     # number of HTML objects that are referencing this virtual file
     refcount: int
+    # size of the file in bytes
+    size: int = 0
+    # number of lifecycle items (cell outputs) that own this virtual file;
+    # files without owners are kept for reuse, until evicted
+    owners: int = 1
 
 
 @dataclasses.dataclass
@@ -177,16 +186,67 @@ class VirtualFileRegistry:
 
     The registry itself doesn't maintain the reference counts, it only
     exposes methods for incrementing, decrementing, and getting the counts.
+
+    Filenames are derived from file contents (see `content_filename`), so
+    adding a file that is already registered reuses its shared memory.
+    Files that are removed by all their owners are kept, so that re-running
+    a cell that produces the same file doesn't recreate it, until the
+    registry exceeds `max_bytes`; then they are evicted in least recently
+    used order.
     """
 
+    # ordered from least to most recently used
     registry: dict[str, VirtualFileRegistryItem] = dataclasses.field(
         default_factory=dict
     )
+    max_bytes: int = VIRTUAL_FILES_MAX_BYTES
+    # prefix of the filenames of this registry, unique to its kernel
+    namespace: str = dataclasses.field(default_factory=_native_thread_id)
+    total_bytes: int = 0
+    # number of files added that were already registered
+    hits: int = 0
+    evictions: int = 0
     shutting_down = False
 
     def __del__(self) -> None:
         self.shutdown()
 
+    def content_filename(self, ext: str, buffer: bytes) -> str:
+        """The filename of a virtual file with the given contents.
+
+        Filenames name shared memory segments, which macOS limits to 31
+        characters including a leading slash, so the digest is encoded
+        compactly. If another registered file has the same name, a random
+        filename is returned instead.
+        """
+        digest = hashlib.blake2b(buffer, digest_size=10).digest()
+        encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        filename = f"{self.namespace}-{encoded}.{_without_leading_dot(ext)}"
+        if filename in self.registry and not self._has_contents(
+            filename, buffer
+        ):
+            LOGGER.debug("Virtual file digest collision (key=%s)", filename)
+            return random_filename(_without_leading_dot(ext))
+        return filename
+
+    def _has_contents(self, filename: str, buffer: bytes) -> bool:
+        """Whether a registered file has the given contents."""
+        item = self.registry[filename]
+        if item.size != len(buffer):
+            return False
+        if sys.platform == "win32":
+            # the segment is kept open on Windows
+            shm = item.shm
+        else:
+            shm = shared_memory.SharedMemory(name=filename)
+        view = shm.buf[: item.size]
+        try:
+            return view == buffer
+        finally:
+            view.release()
+            if shm is not item.shm:
+                shm.close()
+
     def has(self, filename: str) -> bool:
         return filename in self.registry
 
@@ -217,9 +277,13 @@ class VirtualFileRegistry:
 
         key = virtual_file.filename
         if key in self.registry:
-            LOGGER.debug(
-                "Virtual file (key=%s) already registered", virtual_file
-            )
+            # content_filename checks the contents of files it names
+            assert self.registry[key].size == len(virtual_file.buffer)
+            LOGGER.debug("Reusing virtual file (key=%s)", key)
+            item = self.registry.pop(key)
+            item.owners += 1
+            self.registry[key] = item
+            self.hits += 1
             return
 
         buffer = virtual_file.buffer
@@ -251,16 +315,40 @@ class VirtualFileRegistry:
             shm.close()
         # We have to keep a reference to the shared memory to prevent it from
         # being destroyed on Windows
-        self.registry[key] = VirtualFileRegistryItem(shm=shm, refcount=0)
+        self.registry[key] = VirtualFileRegistryItem(
+            shm=shm, refcount=0, size=len(buffer)
+        )
+        self.total_bytes += len(buffer)
+        self.evict()
 
     def remove(self, virtual_file: VirtualFile) -> None:
+        """Release an owner's claim on a virtual file.
+
+        The file is kept for reuse until evicted.
+        """
         key = virtual_file.filename
         if key in self.registry:
-            if sys.platform == "win32":
-                self.registry[key].shm.close()
-            # destroy the shared memory
-            self.registry[key].shm.unlink()
-            del self.registry[key]
+            self.registry[key].owners -= 1
+            self.evict()
+
+    def evict(self) -> None:
+        """Destroy unowned files until the registry fits in `max_bytes`."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        for key, item in list(self.registry.items()):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if item.owners <= 0:
+                self._destroy(key)
+                self.evictions += 1
+
+    def _destroy(self, key: str) -> None:
+        item = self.registry.pop(key)
+        self.total_bytes -= item.size
+        if sys.platform == "win32":
+            item.shm.close()
+        # destroy the shared memory
+        item.shm.unlink()
 
     def shutdown(self) -> None:
         # Try to make this method re-entrant since it's called in the
@@ -276,26 +364,42 @@ class VirtualFileRegistry:
                     item.shm.close()
                 item.shm.unlink()
             self.registry.clear()
+            self.total_bytes = 0
         finally:
             self.shutting_down = False
 
 
+def shared_memory_usage(namespace: str) -> Optional[int]:
+    """Bytes of shared memory used by the virtual files of a registry.
+
+    Only available where shared memory is backed by /dev/shm (Linux).
+    """
+    try:
+        entries = os.scandir("/dev/shm")
+    except OSError:
+        return None
+    total = 0
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(f"{namespace}-"):
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    # removed while scanning
+                    pass
+    return total
+
+
 def _without_leading_dot(ext: str) -> str:
     return ext[1:] if ext.startswith(".") else ext
 
 
-def read_virtual_file(filename: str, byte_length: int) -> bytes:
+def _open_virtual_file(filename: str) -> shared_memory.SharedMemory:
     if not shared_memory:
         raise RuntimeError("Shared memory is not supported on this platform")
 
-    key = filename
-    shm = None
     try:
-        # NB: this can't be collapsed into a one-liner!
-        # doing it in one line yields a 'released memoryview ...'
-        # because shared_memory has built in ref-tracking + GC
-        shm = shared_memory.SharedMemory(name=key)
-        buffer_contents = bytes(shm.buf)[: int(byte_length)]
+        return shared_memory.SharedMemory(name=filename)
     except FileNotFoundError as err:
         LOGGER.debug(
             "Error retrieving shared memory for virtual file: %s", err
@@ -304,8 +408,55 @@ def read_virtual_file(filename: str, byte_length: int) -> bytes:
             HTTPStatus.NOT_FOUND,
             detail="File not found",
         ) from err
+
+
+def read_virtual_file(filename: str, byte_length: int) -> bytes:
+    shm = _open_virtual_file(filename)
+    try:
+        # NB: views of the buffer must be released before the shared
+        # memory is closed
+        view = shm.buf[: int(byte_length)]
+        try:
+            return bytes(view)
+        finally:
+            view.release()
     finally:
-        if shm is not None:
+        shm.close()
+
+
+# Virtual files are streamed in chunks of this size
+VIRTUAL_FILE_CHUNK_SIZE = 256 * 1024
+
+
+def stream_virtual_file(
+    filename: str,
+    byte_length: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Read bytes `start` to `stop` of a virtual file, in chunks.
+
+    Chunks are copied out of the shared memory one at a time, so that
+    serving a file doesn't hold a second copy of it in memory.
+
+    The file is opened before the iterator is returned; a missing file
+    raises an HTTPException right away.
+    """
+    shm = _open_virtual_file(filename)
+    # The segment may be larger than the file, rounded up to a page
+    stop = byte_length if stop is None else min(stop, byte_length)
+
+    def chunks() -> Iterator[bytes]:
+        try:
+            view = shm.buf[start:stop]
+            try:
+                for offset in range(0, len(view), VIRTUAL_FILE_CHUNK_SIZE):
+                    yield bytes(
+                        view[offset : offset + VIRTUAL_FILE_CHUNK_SIZE]
+                    )
+            finally:
+                view.release()
+        finally:
             shm.close()
 
-    return buffer_contents
+    return chunks()
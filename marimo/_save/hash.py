@@ -8,6 +8,7 @@ import inspect
 import struct
 import sys
 import types
+import weakref
 from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple, Optional
 
 from marimo._ast.variables import (
@@ -19,6 +20,7 @@ from marimo._ast.visitor import Name, ScopedVisitor
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._core.ui_element import UIElement
 from marimo._runtime.context import ContextNotInitializedError, get_context
+from marimo._runtime.copy import ZeroCopy
 from marimo._runtime.primitives import (
     FN_CACHE_TYPE,
     is_data_primitive,
@@ -170,21 +172,41 @@ def type_sign(value: bytes, label: str) -> bytes:
     # attacker can override python internals to provide a matched hash. A key
     # signed cache result is the only way to properly protect against this.
     #
-    # Additionally, (less meaningful, but still possible)- a byte collision can
-    # be manufactured by choosing data so long that the length of the data acts
-    # as the data injection.
+    # The length is encoded as a fixed width prefix, so that a byte collision
+    # can't be manufactured by choosing data so long that the length of the
+    # data acts as the data injection.
     #
-    # TODO: Benchmark something like `sha1 (integrity) + delimiter`, this
-    # method is chosen because it was assumed to be fast, but might be slow
-    # with a copy of large data.
-    return b"".join([value, bytes(len(value)), bytes(":" + label, "utf-8")])
+    # Large buffers should not be signed directly, since the join copies
+    # them; see `stream_sign`.
+    return b"".join([length_prefix(len(value)), value, label_suffix(label)])
+
+
+def length_prefix(length: int) -> bytes:
+    return struct.pack("<Q", length)
+
+
+def label_suffix(label: str) -> bytes:
+    return bytes(":" + label, "utf-8")
+
+
+def stream_sign(
+    value: memoryview, label: str, hash_type: str = DEFAULT_HASH
+) -> bytes:
+    """Sign a (potentially large) buffer by its digest.
+
+    The buffer is fed to an incremental hash as is, so no copy of the data
+    is made. The digest is signed like any other value.
+    """
+    hash_alg = hashlib.new(hash_type, usedforsecurity=False)
+    hash_alg.update(length_prefix(value.nbytes))
+    hash_alg.update(value)
+    hash_alg.update(label_suffix(label))
+    return type_sign(hash_alg.digest(), label)
 
 
 def iterable_sign(value: Iterable[Any], label: str) -> bytes:
     values = list(value)
-    return b"".join(
-        [b"".join(values), bytes(len(values)), bytes(":" + label, "utf-8")]
-    )
+    return b"".join([length_prefix(len(values)), *values, label_suffix(label)])
 
 
 def primitive_to_bytes(value: Any) -> bytes:
@@ -201,7 +223,9 @@ def primitive_to_bytes(value: Any) -> bytes:
     return type_sign(bytes(value), "bytes")
 
 
-def common_container_to_bytes(value: Any) -> bytes:
+def common_container_to_bytes(
+    value: Any, hash_type: str = DEFAULT_HASH
+) -> bytes:
     visited: dict[int, int] = {}
 
     def recurse_container(value: Any) -> bytes:
@@ -224,12 +248,80 @@ def common_container_to_bytes(value: Any) -> bytes:
 
         if is_primitive(value):
             return primitive_to_bytes(value)
-        return data_to_buffer(value)
+        return data_to_buffer(value, hash_type)
 
     return recurse_container(value)
 
 
-def data_to_buffer(data: Tensor) -> bytes:
+def is_immutable_data(data: Any) -> bool:
+    """Whether the content of a data primitive can't change in place."""
+    # zero_copy is a promise from the user not to mutate the object.
+    if isinstance(data, ZeroCopy):
+        return True
+    if DependencyManager.pyarrow.imported():
+        import pyarrow as pa
+
+        # Arrow memory is immutable once built.
+        if isinstance(
+            data, (pa.Table, pa.RecordBatch, pa.Array, pa.ChunkedArray)
+        ):
+            return True
+    if DependencyManager.numpy.imported():
+        import numpy as np
+
+        if isinstance(data, np.ndarray):
+            # A read-only view may share memory with a writeable array.
+            while isinstance(data, np.ndarray):
+                if data.flags.writeable:
+                    return False
+                data = data.base
+            return data is None or isinstance(data, bytes)
+    return False
+
+
+class ContentHashMemo:
+    """Content hashes of immutable data, keyed by object identity.
+
+    Hashing the same large object again (e.g. an argument to successive
+    calls of a `mo.cache` function) is then O(1) instead of O(bytes). Only
+    objects that can't change in place are memoized, and entries are evicted
+    when their object is garbage collected, so that a recycled id never maps
+    to a stale hash.
+    """
+
+    def __init__(self) -> None:
+        self._hashes: dict[tuple[int, str], bytes] = {}
+
+    def get(self, data: Any, hash_type: str) -> Optional[bytes]:
+        return self._hashes.get((id(data), hash_type))
+
+    def put(self, data: Any, hash_type: str, value: bytes) -> None:
+        key = (id(data), hash_type)
+        try:
+            weakref.finalize(data, self._hashes.pop, key, None)
+        except TypeError:
+            # Not weak referenceable, so eviction can't be tracked.
+            return
+        self._hashes[key] = value
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+CONTENT_HASH_MEMO = ContentHashMemo()
+
+
+def data_to_buffer(data: Tensor, hash_type: str = DEFAULT_HASH) -> bytes:
+    if not is_immutable_data(data):
+        return _data_to_buffer(data, hash_type)
+    serial_value = CONTENT_HASH_MEMO.get(data, hash_type)
+    if serial_value is None:
+        serial_value = _data_to_buffer(data, hash_type)
+        CONTENT_HASH_MEMO.put(data, hash_type, serial_value)
+    return serial_value
+
+
+def _data_to_buffer(data: Tensor, hash_type: str) -> bytes:
     data = standardize_tensor(data)
     # From joblib.hashing
     if data.shape == ():
@@ -245,7 +337,8 @@ def data_to_buffer(data: Tensor) -> bytes:
         # alleviates this issue. Note: There might be a more efficient way of
         # doing this, check for joblib updates.
         data_c_contiguous = data.flatten()
-    return type_sign(memoryview(data_c_contiguous.view("uint8")), "data")
+    buffer = memoryview(data_c_contiguous.view("uint8")).cast("B")
+    return stream_sign(buffer, "data", hash_type)
 
 
 def attempt_signed_bytes(value: bytes, label: str) -> bytes:
@@ -699,9 +792,11 @@ class BlockHasher:
             if is_primitive(value):
                 serial_value = primitive_to_bytes(value)
             elif is_data_primitive(value):
-                serial_value = data_to_buffer(value)
+                serial_value = data_to_buffer(value, self.hash_alg.name)
             elif is_data_primitive_container(value):
-                serial_value = common_container_to_bytes(value)
+                serial_value = common_container_to_bytes(
+                    value, self.hash_alg.name
+                )
             elif is_pure_function(
                 local_ref, value, scope, self.fn_cache, self.graph
             ):
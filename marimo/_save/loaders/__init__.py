@@ -4,13 +4,15 @@ from typing import Literal
 from marimo._save.loaders.json import JsonLoader
 from marimo._save.loaders.loader import Loader, LoaderPartial, LoaderType
 from marimo._save.loaders.memory import MemoryLoader
+from marimo._save.loaders.mmap import MmapLoader
 from marimo._save.loaders.pickle import PickleLoader
 
-LoaderKey = Literal["memory", "pickle", "json"]
+LoaderKey = Literal["memory", "pickle", "json", "mmap"]
 
 PERSISTENT_LOADERS: dict[LoaderKey, LoaderType] = {
     "pickle": PickleLoader,
     "json": JsonLoader,
+    "mmap": MmapLoader,
 }
 
 __all__ = [
@@ -20,5 +22,6 @@ __all__ = [
     "LoaderPartial",
     "LoaderType",
     "MemoryLoader",
+    "MmapLoader",
     "PickleLoader",
 ]
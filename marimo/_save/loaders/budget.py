@@ -0,0 +1,231 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Literal, Optional
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = _loggers.marimo_logger()
+
+# "lru" evicts the least recently used entries first. "value" evicts the
+# entries that save the least compute time per byte first, breaking ties by
+# recency.
+EvictionPolicy = Literal["lru", "value"]
+
+INDEX_FILE = "index.json"
+
+# Minimum seconds between writes of the index that aren't due to eviction
+FLUSH_INTERVAL = 5.0
+
+# Serializes index updates within a process. Processes sharing a cache
+# directory (e.g. over NFS) may race on the index; the index is then
+# reconciled against the directory on the next eviction.
+_INDEX_LOCK = threading.Lock()
+
+
+@dataclass
+class BudgetEntry:
+    size: int
+    last_access: float
+    # Seconds spent computing the entry, i.e. saved by each hit
+    compute_time: float = 0.0
+
+
+class DiskBudget:
+    """Byte budget for a persistent cache directory.
+
+    Entries of all caches under the directory are tracked in an index, with
+    their size, last access time and compute time. The index is read and
+    reconciled with the directory once, then kept in memory and updated
+    incrementally; it is written back at most every `FLUSH_INTERVAL`
+    seconds, and at exit. When a save exceeds the budget, the directory is
+    rescanned (other processes may share it) and entries are evicted
+    according to the policy until the directory fits again.
+
+    Use `disk_budget` to get the budget of a directory, which is shared by
+    all loaders saving to it.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int,
+        policy: EvictionPolicy = "lru",
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._entries: Optional[dict[str, BudgetEntry]] = None
+        self._total = 0
+        self._dirty = False
+        self._written_at = 0.0
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILE
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def _scan(self) -> dict[str, os.stat_result]:
+        files = {}
+        for directory in self.root.iterdir():
+            if not directory.is_dir():
+                continue
+            for path in directory.iterdir():
+                # Skips files that are still being written
+                if path.is_file() and not path.name.startswith("."):
+                    files[self._key(path)] = path.stat()
+        return files
+
+    def _read(
+        self, known: Optional[dict[str, BudgetEntry]] = None
+    ) -> dict[str, BudgetEntry]:
+        """Read the index, reconciled with the files on disk.
+
+        Entries in `known` take precedence over those in the index file.
+        """
+        try:
+            raw = json.loads(self.index_path.read_text())
+            index = {key: BudgetEntry(**value) for key, value in raw.items()}
+        except FileNotFoundError:
+            index = {}
+        except (ValueError, TypeError) as e:
+            LOGGER.warning("Rebuilding corrupt cache index: %s", e)
+            index = {}
+        index.update(known or {})
+        entries = {}
+        for key, stat in self._scan().items():
+            entry = index.get(key)
+            if entry is None:
+                entry = BudgetEntry(
+                    size=stat.st_size,
+                    last_access=max(stat.st_atime, stat.st_mtime),
+                )
+            entry.size = stat.st_size
+            entries[key] = entry
+        return entries
+
+    def _load(self, rescan: bool = False) -> dict[str, BudgetEntry]:
+        if self._entries is None or rescan:
+            self._entries = self._read(self._entries)
+            self._total = sum(entry.size for entry in self._entries.values())
+        return self._entries
+
+    def _write(self, entries: dict[str, BudgetEntry]) -> None:
+        tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({key: asdict(entry) for key, entry in entries.items()})
+        )
+        os.replace(tmp, self.index_path)
+        self._dirty = False
+        self._written_at = time.monotonic()
+
+    def _maybe_flush(self) -> None:
+        self._dirty = True
+        if time.monotonic() - self._written_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the index if it changed since it was last written."""
+        if self._dirty and self._entries is not None:
+            try:
+                self._write(self._entries)
+            except OSError as e:
+                LOGGER.debug("Could not write cache index: %s", e)
+
+    def _eviction_order(self, entries: dict[str, BudgetEntry]) -> list[str]:
+        if self.policy == "value":
+            return sorted(
+                entries,
+                key=lambda key: (
+                    entries[key].compute_time / max(entries[key].size, 1),
+                    entries[key].last_access,
+                ),
+            )
+        return sorted(entries, key=lambda key: entries[key].last_access)
+
+    def record_access(self, path: Path) -> None:
+        with _INDEX_LOCK:
+            entry = self._load().get(self._key(path))
+            if entry is None:
+                return
+            entry.last_access = time.time()
+            self._maybe_flush()
+
+    def record_save(self, path: Path, compute_time: float) -> int:
+        """Record a new entry and evict others to fit the budget.
+
+        Returns:
+            The number of evicted entries.
+        """
+        with _INDEX_LOCK:
+            entries = self._load()
+            key = self._key(path)
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                return 0
+            previous = entries.get(key)
+            self._total += size - (previous.size if previous else 0)
+            entries[key] = BudgetEntry(size, time.time(), compute_time)
+            if self._total <= self.max_bytes:
+                self._maybe_flush()
+                return 0
+
+            # Other processes may have added or evicted entries
+            entries = self._load(rescan=True)
+            evicted = 0
+            for candidate in self._eviction_order(entries):
+                if self._total <= self.max_bytes:
+                    break
+                if candidate == key:
+                    # The new entry is kept, even if it alone exceeds the
+                    # budget, since its caller is about to use it.
+                    continue
+                try:
+                    (self.root / candidate).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # e.g. a file that is still mapped on Windows
+                    LOGGER.debug("Could not evict %s: %s", candidate, e)
+                    continue
+                self._total -= entries.pop(candidate).size
+                evicted += 1
+            self._write(entries)
+            return evicted
+
+
+# Budgets by cache directory, shared by the loaders saving to it
+_BUDGETS: dict[Path, DiskBudget] = {}
+
+
+def disk_budget(
+    root: Path, max_bytes: int, policy: EvictionPolicy = "lru"
+) -> DiskBudget:
+    """The budget of a cache directory, configured with the given limits."""
+    key = root.absolute()
+    with _INDEX_LOCK:
+        budget = _BUDGETS.get(key)
+        if budget is None:
+            budget = _BUDGETS[key] = DiskBudget(key, max_bytes, policy)
+        budget.max_bytes = max_bytes
+        budget.policy = policy
+        return budget
+
+
+@atexit.register
+def _flush_budgets() -> None:
+    with _INDEX_LOCK:
+        for budget in _BUDGETS.values():
+            budget.flush()
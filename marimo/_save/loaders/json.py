@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import dataclasses
 import json
+from typing import Any
 
 from marimo._save.cache import Cache, CacheType
 from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
@@ -11,8 +12,8 @@ from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
 class JsonLoader(BasePersistenceLoader):
     """Readable json loader for basic objects."""
 
-    def __init__(self, name: str, save_path: str) -> None:
-        super().__init__(name, "json", save_path)
+    def __init__(self, name: str, save_path: str, **kwargs: Any) -> None:
+        super().__init__(name, "json", save_path, **kwargs)
 
     def load_persistent_cache(
         self, hashed_context: str, cache_type: CacheType
@@ -28,7 +29,7 @@ class JsonLoader(BasePersistenceLoader):
                     "Invalid json object for cache restoration"
                 ) from e
 
-    def save_cache(self, cache: Cache) -> None:
+    def save_persistent_cache(self, cache: Cache) -> None:
         with open(self.build_path(cache.hash, cache.cache_type), "w") as f:
             dump = dataclasses.asdict(cache)
             dump["stateful_refs"] = list(dump["stateful_refs"])
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import os
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Type
+from typing import TYPE_CHECKING, Any, Optional, Type
 
 from marimo._runtime.context import get_context
 from marimo._runtime.context.types import ContextNotInitializedError
@@ -15,10 +16,19 @@ from marimo._save.cache import (
     Cache,
     CacheType,
 )
+from marimo._save.loaders.budget import (
+    DiskBudget,
+    EvictionPolicy,
+    disk_budget,
+)
 
 if TYPE_CHECKING:
     from marimo._ast.visitor import Name
 
+# Misses whose entry is never saved (e.g. the computation failed) are
+# forgotten beyond this many pending misses.
+MAX_PENDING_MISSES = 128
+
 INCONSISTENT_CACHE_BOILER_PLATE = (
     "The cache state does not match "
     "expectations, this can be due to file "
@@ -109,6 +119,11 @@ class Loader(ABC):
     def __init__(self, name: str) -> None:
         self.name = name
         self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # hash -> time of the miss, to measure how long an entry took to
+        # compute once it is saved.
+        self._miss_times: dict[str, float] = {}
 
     def build_path(self, hashed_context: str, cache_type: CacheType) -> Path:
         prefix = CACHE_PREFIX.get(cache_type, "U_")
@@ -122,6 +137,12 @@ class Loader(ABC):
         cache_type: CacheType,
     ) -> Cache:
         if not self.cache_hit(hashed_context, cache_type):
+            self._misses += 1
+            self._miss_times.pop(hashed_context, None)
+            self._miss_times[hashed_context] = time.monotonic()
+            if len(self._miss_times) > MAX_PENDING_MISSES:
+                # Forget the oldest miss
+                del self._miss_times[next(iter(self._miss_times))]
             return Cache(
                 {d: None for d in defs},
                 hashed_context,
@@ -150,6 +171,21 @@ class Loader(ABC):
     def hits(self) -> int:
         return self._hits
 
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def compute_time(self, hashed_context: str) -> float:
+        """Seconds since the miss of an entry that is being saved."""
+        missed_at = self._miss_times.pop(hashed_context, None)
+        if missed_at is None:
+            return 0.0
+        return time.monotonic() - missed_at
+
     @classmethod
     def partial(cls, **kwargs: Any) -> LoaderPartial:
         return LoaderPartial(cls, **kwargs)
@@ -183,10 +219,20 @@ class Loader(ABC):
 
 
 class BasePersistenceLoader(Loader):
-    """Abstract base for cache written to disk."""
+    """Abstract base for cache written to disk.
+
+    If `max_bytes` is set, the cache directory (shared by all caches saved
+    to the same path) is kept under that many bytes by evicting entries with
+    the `eviction` policy; see `DiskBudget`.
+    """
 
     def __init__(
-        self, name: str, suffix: str, save_path: str | Path | None
+        self,
+        name: str,
+        suffix: str,
+        save_path: str | Path | None,
+        max_bytes: Optional[int] = None,
+        eviction: EvictionPolicy = "lru",
     ) -> None:
         super().__init__(name)
 
@@ -194,6 +240,14 @@ class BasePersistenceLoader(Loader):
         # Setter takes care of this, not sure why mypy is complaining.
         self.save_path = save_path  # type: ignore
         self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+
+    @property
+    def budget(self) -> Optional[DiskBudget]:
+        if self.max_bytes is None:
+            return None
+        return disk_budget(self._save_path, self.max_bytes, self.eviction)
 
     @property
     def save_path(self) -> Path:
@@ -219,9 +273,20 @@ class BasePersistenceLoader(Loader):
 
     def load_cache(self, hashed_context: str, cache_type: CacheType) -> Cache:
         try:
-            return self.load_persistent_cache(hashed_context, cache_type)
+            cache = self.load_persistent_cache(hashed_context, cache_type)
         except FileNotFoundError as e:
             raise LoaderError("Unexpected cache miss.") from e
+        if (budget := self.budget) is not None:
+            budget.record_access(self.build_path(hashed_context, cache_type))
+        return cache
+
+    def save_cache(self, cache: Cache) -> None:
+        self.save_persistent_cache(cache)
+        if (budget := self.budget) is not None:
+            self._evictions += budget.record_save(
+                self.build_path(cache.hash, cache.cache_type),
+                self.compute_time(cache.hash),
+            )
 
     @abstractmethod
     def load_persistent_cache(
@@ -229,5 +294,9 @@ class BasePersistenceLoader(Loader):
     ) -> Cache:
         """May throw FileNotFoundError"""
 
+    @abstractmethod
+    def save_persistent_cache(self, cache: Cache) -> None:
+        """Write the cache to `build_path`"""
+
 
 LoaderType = Type[Loader]
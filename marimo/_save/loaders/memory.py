@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 from marimo._save.cache import Cache, CacheType
 from marimo._save.loaders.loader import Loader, LoaderError
+from marimo._utils.memory import estimate_nbytes
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -16,19 +17,26 @@ T = TypeVar("T")
 
 
 class MemoryLoader(Loader):
-    """In memory loader for saved objects."""
+    """In memory loader for saved objects.
+
+    Least recently used entries are evicted once there are more than
+    `max_size` entries, or once the entries hold more than `max_bytes`
+    (as estimated by `estimate_nbytes`). Either limit is disabled if not
+    positive.
+    """
 
     def __init__(
         self,
         *args: Any,
         max_size: int = 128,
+        max_bytes: int = -1,
         cache: Optional[OrderedDict[Path, Cache]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
         self._cache: Union[OrderedDict[Path, Cache], dict[Path, Cache]]
-        self.is_lru = max_size > 0
+        self.is_lru = max_size > 0 or max_bytes > 0
 
         # Normal python dicts are atomic, ordered dictionaries are not.
         # As such, default to normal dict if not LRU.
@@ -39,8 +47,13 @@ class MemoryLoader(Loader):
             self._cache = OrderedDict()
             self._cache_lock = threading.Lock()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        # Estimated size of each entry, tracked when max_bytes is set
+        self._sizes: dict[Path, int] = {}
+        self._total_bytes = 0
         if cache is not None:
             self._maybe_lock(lambda: self._cache.update(cache))
+            self._reconfigure(max_size, max_bytes)
 
     def _maybe_lock(self, fn: Callable[..., T]) -> T:
         if self._cache_lock is not None:
@@ -66,36 +79,76 @@ class MemoryLoader(Loader):
 
     def save_cache(self, cache: Cache) -> None:
         key = self.build_path(cache.hash, cache.cache_type)
+        # Compute time is only used to budget persistent caches.
+        self.compute_time(cache.hash)
         # LRU
         if self.is_lru:
             assert isinstance(self._cache, OrderedDict)
             assert self._cache_lock is not None
+            size = 0
+            if self._max_bytes > 0:
+                size = estimate_nbytes([cache.defs, cache.meta])
             with self._cache_lock:
                 self._cache[key] = cache
                 self._cache.move_to_end(key)
-                if len(self._cache) > self.max_size:
-                    self._cache.popitem(last=False)
+                if self._max_bytes > 0:
+                    self._total_bytes += size - self._sizes.get(key, 0)
+                    self._sizes[key] = size
+                self._evict()
+            return
         self._cache[key] = cache
 
-    def resize(self, max_size: int) -> None:
+    def _evict(self) -> None:
+        """Evict entries beyond the limits, with the lock held."""
+        assert isinstance(self._cache, OrderedDict)
+        while len(self._cache) > 1 and (
+            (self._max_size > 0 and len(self._cache) > self._max_size)
+            or (self._max_bytes > 0 and self._total_bytes > self._max_bytes)
+        ):
+            key, _ = self._cache.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self._evictions += 1
+
+    def _reconfigure(self, max_size: int, max_bytes: int) -> None:
+        is_lru = max_size > 0 or max_bytes > 0
         if not self.is_lru:
-            self.is_lru = max_size > 0
+            self.is_lru = is_lru
             if self.is_lru:
                 self._cache = OrderedDict(self._cache.items())
                 self._cache_lock = threading.Lock()
             self._max_size = max_size
-            return
+            self._max_bytes = max_bytes
+            if not self.is_lru:
+                return
         assert isinstance(self._cache, OrderedDict)
         assert self._cache_lock is not None
         with self._cache_lock:
-            self.is_lru = max_size > 0
+            self.is_lru = is_lru
+            self._max_size = max_size
+            self._max_bytes = max_bytes
             if not self.is_lru:
                 self._cache = dict(self._cache.items())
-                self._max_size = max_size
+                self._sizes.clear()
+                self._total_bytes = 0
                 return
-            while len(self._cache) > max_size:
-                self._cache.popitem(last=False)
-        self._max_size = max_size
+            if max_bytes > 0:
+                for key, cache in self._cache.items():
+                    if key not in self._sizes:
+                        size = estimate_nbytes([cache.defs, cache.meta])
+                        self._sizes[key] = size
+                        self._total_bytes += size
+            else:
+                self._sizes.clear()
+                self._total_bytes = 0
+            self._evict()
+
+    def resize(self, max_size: int) -> None:
+        self._reconfigure(max_size, self._max_bytes)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of the entries, if max_bytes is set"""
+        return self._total_bytes
 
     @property
     def max_size(self) -> int:
@@ -104,3 +157,11 @@ class MemoryLoader(Loader):
     @max_size.setter
     def max_size(self, value: int) -> None:
         self.resize(value)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._reconfigure(self._max_size, value)
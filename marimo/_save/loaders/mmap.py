@@ -0,0 +1,110 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any
+
+from marimo._save.cache import Cache, CacheType
+from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
+
+# File layout:
+#   header: magic, pickle size, number of buffers
+#   one (offset, size) entry per buffer
+#   the pickle stream, with large buffers stored out-of-band
+#   the buffers, each aligned to BUFFER_ALIGNMENT
+MAGIC = b"MOMMAP01"
+HEADER = struct.Struct("<8sQQ")
+ENTRY = struct.Struct("<QQ")
+# Cache line alignment, which also satisfies the alignment of any dtype.
+BUFFER_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+class MmapLoader(BasePersistenceLoader):
+    """Zero-copy loader for large array data.
+
+    Objects are pickled with protocol 5, which lets numpy arrays (and with
+    them pandas frames), and pyarrow tables, hand over their memory as
+    out-of-band buffers. These buffers are written next to the pickle stream
+    and restored by memory mapping the file, so a cache hit only reads the
+    pages that are actually accessed, instead of reading and deserializing
+    the whole file up front.
+
+    The mapping is copy-on-write: restored arrays are writeable, but changes
+    are never written back to the cache. Saves replace the file atomically,
+    so objects restored from an earlier version keep their data. Objects that don't support
+    out-of-band buffers (such as polars frames) are pickled as usual.
+    """
+
+    def __init__(self, name: str, save_path: str, **kwargs: Any) -> None:
+        super().__init__(name, "mmap", save_path, **kwargs)
+
+    def load_persistent_cache(
+        self, hashed_context: str, cache_type: CacheType
+    ) -> Cache:
+        with open(self.build_path(hashed_context, cache_type), "rb") as handle:
+            # The mapping outlives the file handle, and is released once no
+            # restored object references it.
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(mapped)
+        try:
+            magic, size, count = HEADER.unpack_from(view)
+        except struct.error as e:
+            raise LoaderError("Truncated mmap cache header.") from e
+        if magic != MAGIC:
+            raise LoaderError(f"Unexpected mmap cache header {magic!r}.")
+        buffers = []
+        for i in range(count):
+            offset, length = ENTRY.unpack_from(
+                view, HEADER.size + i * ENTRY.size
+            )
+            buffers.append(view[offset : offset + length])
+        start = HEADER.size + count * ENTRY.size
+        cache = pickle.loads(view[start : start + size], buffers=buffers)
+        if not isinstance(cache, Cache):
+            raise LoaderError(f"Excepted cache object, got{type(cache)}")
+        return cache
+
+    def save_persistent_cache(self, cache: Cache) -> None:
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps(
+            cache, protocol=5, buffer_callback=buffers.append
+        )
+        raw = [buffer.raw() for buffer in buffers]
+
+        entries = []
+        offset = _align(HEADER.size + len(raw) * ENTRY.size + len(payload))
+        for data in raw:
+            entries.append((offset, data.nbytes))
+            offset = _align(offset + data.nbytes)
+
+        # Written to a temporary file and moved into place, since the file
+        # may be mapped by an earlier load: rewriting it in place would
+        # change (or, once truncated, fault on) pages restored objects have
+        # not read yet.
+        path = self.build_path(cache.hash, cache.cache_type)
+        fd, tmp = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(MAGIC, len(payload), len(raw)))
+                for entry in entries:
+                    f.write(ENTRY.pack(*entry))
+                f.write(payload)
+                for (offset, _), data in zip(entries, raw):
+                    f.write(bytes(offset - f.tell()))
+                    f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
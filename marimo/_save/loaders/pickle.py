@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import pickle
+from typing import Any
 
 from marimo._save.cache import Cache, CacheType
 from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
@@ -10,8 +11,8 @@ from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
 class PickleLoader(BasePersistenceLoader):
     """General loader for serializable objects."""
 
-    def __init__(self, name: str, save_path: str) -> None:
-        super().__init__(name, "pickle", save_path)
+    def __init__(self, name: str, save_path: str, **kwargs: Any) -> None:
+        super().__init__(name, "pickle", save_path, **kwargs)
 
     def load_persistent_cache(
         self, hashed_context: str, cache_type: CacheType
@@ -22,6 +23,6 @@ class PickleLoader(BasePersistenceLoader):
                 raise LoaderError(f"Excepted cache object, got{type(cache)}")
             return cache
 
-    def save_cache(self, cache: Cache) -> None:
+    def save_persistent_cache(self, cache: Cache) -> None:
         with open(self.build_path(cache.hash, cache.cache_type), "wb") as f:
             pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -61,6 +61,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from marimo._runtime.dataflow import DirectedGraph
+    from marimo._save.loaders.budget import EvictionPolicy
 
 
 class SkipWithBlock(Exception):
@@ -105,6 +106,18 @@ class _cache_call(object):
             return 0
         return self.loader.hits
 
+    @property
+    def misses(self) -> int:
+        if self._loader is None:
+            return 0
+        return self.loader.misses
+
+    @property
+    def evictions(self) -> int:
+        if self._loader is None:
+            return 0
+        return self.loader.evictions
+
     def _set_context(self, fn: Callable[..., Any]) -> None:
         assert callable(fn), "the provided function must be callable"
         ctx = get_context()
@@ -687,6 +700,8 @@ def persistent_cache(
     save_path: str | None = None,
     method: LoaderKey = "pickle",
     pin_modules: bool = False,
+    max_bytes: Optional[int] = None,
+    eviction: EvictionPolicy = "lru",
 ) -> _cache_context: ...
 
 
@@ -696,6 +711,8 @@ def persistent_cache(
     save_path: str | None = None,
     method: LoaderKey = "pickle",
     pin_modules: bool = False,
+    max_bytes: Optional[int] = None,
+    eviction: EvictionPolicy = "lru",
 ) -> _cache_call: ...
 
 
@@ -704,6 +721,8 @@ def persistent_cache(  # type: ignore[misc]
     save_path: str | None = None,
     method: LoaderKey = "pickle",
     *args: Any,
+    max_bytes: Optional[int] = None,
+    eviction: EvictionPolicy = "lru",
     _internal_interface_not_for_external_use: None = None,
     **kwargs: Any,
 ) -> Union[_cache_call, _cache_context]:
@@ -748,9 +767,15 @@ def persistent_cache(  # type: ignore[misc]
     - `save_path`: the folder in which to save the cache, defaults to
       `__marimo__/cache` in the directory of the notebook file
     - `method`: the serialization method to use, current options are "json",
-      and "pickle" (default).
+      "mmap" (memory maps array data on load), and "pickle" (default).
     - `pin_modules`: if True, the cache will be invalidated if module versions
       differ between runs, defaults to False.
+    - `max_bytes`: if set, the total size of the cache directory (shared by
+      all caches saved to `save_path`) is kept under this many bytes by
+      evicting entries.
+    - `eviction`: the entries evicted first when `max_bytes` is exceeded;
+      "lru" (default) evicts the least recently used entries, "value" the
+      entries that save the least compute time per byte.
 
 
     ## Decorator for persistently caching the return value of a function.
@@ -783,9 +808,15 @@ def persistent_cache(  # type: ignore[misc]
     - `save_path`: the folder in which to save the cache, defaults to
       `__marimo__/cache` in the directory of the notebook file
     - `method`: the serialization method to use, current options are "json",
-      and "pickle" (default).
+      "mmap" (memory maps array data on load), and "pickle" (default).
     - `pin_modules`: if True, the cache will be invalidated if module versions
       differ between runs, defaults to False.
+    - `max_bytes`: if set, the total size of the cache directory (shared by
+      all caches saved to `save_path`) is kept under this many bytes by
+      evicting entries.
+    - `eviction`: the entries evicted first when `max_bytes` is exceeded;
+      "lru" (default) evicts the least recently used entries, "value" the
+      entries that save the least compute time per byte.
     """
 
     arg = name
@@ -801,7 +832,9 @@ def persistent_cache(  # type: ignore[misc]
             f"Invalid method {method}, expected one of "
             f"{PERSISTENT_LOADERS.keys()}"
         )
-    loader = PERSISTENT_LOADERS[method].partial(save_path=save_path)
+    loader = PERSISTENT_LOADERS[method].partial(
+        save_path=save_path, max_bytes=max_bytes, eviction=eviction
+    )
     # Injection hook for testing
     if "_loader" in kwargs:
         loader = kwargs.pop("_loader")
@@ -3,18 +3,28 @@ from __future__ import annotations
 
 import mimetypes
 import re
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, Optional
 
 from starlette.authentication import requires
 from starlette.exceptions import HTTPException
-from starlette.responses import FileResponse, HTMLResponse, Response
+from starlette.responses import (
+    FileResponse,
+    HTMLResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.staticfiles import StaticFiles
 
 from marimo import _loggers
 from marimo._config.manager import get_default_config_manager
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._output.utils import uri_decode_component, uri_encode_component
-from marimo._runtime.virtual_file import EMPTY_VIRTUAL_FILE, read_virtual_file
+from marimo._runtime.virtual_file import (
+    EMPTY_VIRTUAL_FILE,
+    stream_virtual_file,
+)
 from marimo._server.api.deps import AppState
 from marimo._server.router import APIRouter
 from marimo._server.templates.templates import (
@@ -25,6 +35,8 @@ from marimo._server.templates.templates import (
 from marimo._utils.paths import import_files
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from starlette.requests import Request
 
 LOGGER = _loggers.marimo_logger()
@@ -176,10 +188,20 @@ def virtual_file(
                 application/octet-stream:
                     schema:
                         type: string
+        206:
+            description: Get a byte range of a virtual file
+            content:
+                application/octet-stream:
+                    schema:
+                        type: string
+        304:
+            description: The virtual file matches the If-None-Match ETag
         404:
             description: Invalid virtual file request
         404:
             description: Invalid byte length in virtual file request
+        416:
+            description: The requested byte range is not satisfiable
     """
     filename_and_length = request.path_params["filename_and_length"]
 
@@ -198,13 +220,157 @@ def virtual_file(
             status_code=404,
             detail="Invalid byte length in virtual file request",
         )
-
-    buffer_contents = read_virtual_file(filename, int(byte_length))
+    size = int(byte_length)
     mimetype, _ = mimetypes.guess_type(filename)
-    return Response(
-        content=buffer_contents,
-        media_type=mimetype,
-        headers={"Cache-Control": "max-age=86400"},
+
+    # Virtual files are immutable: a filename is never reused for other
+    # contents, so it makes a strong ETag.
+    etag = f'"{filename_and_length}"'
+    headers = {
+        "Cache-Control": "max-age=86400",
+        "Accept-Ranges": "bytes",
+    }
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header is not None and if_range in (None, etag):
+        byte_range = _parse_range(range_header, size)
+    encoding = (
+        _choose_encoding(request.headers.get("accept-encoding", ""))
+        if byte_range is None and _is_compressible(mimetype, size)
+        else None
+    )
+    if encoding is not None:
+        # Each encoding is a different representation, with its own ETag
+        etag = f'"{filename_and_length}-{encoding}"'
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+    headers["ETag"] = etag
+
+    if _matches_etag(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if byte_range is not None:
+        start, stop = byte_range
+        headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+        headers["Content-Length"] = str(stop - start)
+        return StreamingResponse(
+            stream_virtual_file(filename, size, start, stop),
+            status_code=206,
+            media_type=mimetype,
+            headers=headers,
+        )
+
+    chunks = stream_virtual_file(filename, size)
+    if encoding is not None:
+        return StreamingResponse(
+            _compress(chunks, encoding), media_type=mimetype, headers=headers
+        )
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(chunks, media_type=mimetype, headers=headers)
+
+
+ContentEncoding = Literal["br", "gzip"]
+
+# Smaller files aren't worth compressing
+_MIN_COMPRESS_BYTES = 1024
+_COMPRESSIBLE_MIMETYPES = {
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def _is_compressible(mimetype: Optional[str], size: int) -> bool:
+    if mimetype is None or size < _MIN_COMPRESS_BYTES:
+        return False
+    return (
+        mimetype.startswith("text/")
+        or mimetype in _COMPRESSIBLE_MIMETYPES
+        or mimetype.endswith(("+json", "+xml"))
+    )
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[ContentEncoding]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    if "br" in accepted and DependencyManager.brotli.has():
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(
+    chunks: Iterator[bytes], encoding: ContentEncoding
+) -> Iterator[bytes]:
+    if encoding == "br":
+        import brotli  # type: ignore[import-not-found,unused-ignore]
+
+        compressor = brotli.Compressor(quality=4)
+        for chunk in chunks:
+            if data := compressor.process(chunk):
+                yield data
+        yield compressor.finish()
+    else:
+        # wbits=31 writes a gzip header and trailer
+        gzip = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            if data := gzip.compress(chunk):
+                yield data
+        yield gzip.flush()
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Parse a Range header into a [start, stop) byte range.
+
+    Only single ranges are supported; for anything else the header is
+    ignored, and the whole file is served.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+    match = re.fullmatch(r"(\d*)-(\d*)", spec.strip(), re.ASCII)
+    if match is None or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        start, stop = max(size - int(last), 0), size
+    else:
+        start = int(first)
+        stop = min(int(last) + 1, size) if last else size
+    if start >= size or start >= stop:
+        raise HTTPException(
+            status_code=416,
+            detail="Range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, stop
+
+
+def _matches_etag(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, per RFC 9110
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
     )
 
 
@@ -16,6 +16,8 @@ from marimo._server.api.deps import AppState
 from marimo._server.api.utils import parse_request
 from marimo._server.models.models import (
     BaseResponse,
+    ConsoleHistoryRequest,
+    ConsoleHistoryResponse,
     FormatRequest,
     FormatResponse,
     StdinRequest,
@@ -183,6 +185,32 @@ async def stdin(request: Request) -> BaseResponse:
     return SuccessResponse()
 
 
+@router.post("/console_history")
+@requires("edit")
+async def console_history(request: Request) -> ConsoleHistoryResponse:
+    """
+    requestBody:
+        content:
+            application/json:
+                schema:
+                    $ref: "#/components/schemas/ConsoleHistoryRequest"
+    responses:
+        200:
+            description: Fetch older console outputs of a cell
+            content:
+                application/json:
+                    schema:
+                        $ref: "#/components/schemas/ConsoleHistoryResponse"
+    """
+    app_state = AppState(request)
+    body = await parse_request(request, cls=ConsoleHistoryRequest)
+    session_view = app_state.require_current_session().session_view
+    outputs, total = session_view.get_spilled_console_outputs(
+        body.cell_id, body.offset, body.limit
+    )
+    return ConsoleHistoryResponse(outputs=outputs, total=total)
+
+
 @router.post("/install_missing_packages")
 @requires("edit")
 async def install_missing_packages(request: Request) -> BaseResponse:
@@ -8,6 +8,7 @@ from starlette.authentication import requires
 from starlette.responses import JSONResponse, PlainTextResponse
 
 from marimo import __version__, _loggers
+from marimo._runtime.virtual_file import shared_memory_usage
 from marimo._server.api.deps import AppState
 from marimo._server.router import APIRouter
 from marimo._utils.health import (
@@ -146,6 +147,8 @@ async def usage(request: Request) -> JSONResponse:
                                 properties:
                                     memory:
                                         type: integer
+                                    shared_memory:
+                                        type: integer
                             cpu:
                                 type: object
                                 properties:
@@ -188,6 +191,19 @@ async def usage(request: Request) -> JSONResponse:
             except psutil.NoSuchProcess:
                 pass
 
+    # Shared memory holding the kernel's virtual files, which are named
+    # after the kernel's thread (the main thread of a process has its pid)
+    kernel_shared_memory: Optional[int] = None
+    kernel_task = session.kernel_manager.kernel_task if session else None
+    if kernel_task is not None:
+        native_id = (
+            kernel_task.pid
+            if isinstance(kernel_task, Process)
+            else kernel_task.native_id
+        )
+        if native_id is not None:
+            kernel_shared_memory = shared_memory_usage(str(native_id))
+
     return JSONResponse(
         {
             # computer memory
@@ -205,6 +221,7 @@ async def usage(request: Request) -> JSONResponse:
             # marimo kernel (for the given session)
             "kernel": {
                 "memory": kernel_memory,
+                "shared_memory": kernel_shared_memory,
             },
             "cpu": {
                 "percent": cpu,
@@ -231,3 +248,34 @@ async def connections(request: Request) -> JSONResponse:
     return JSONResponse(
         {"active": app_state.session_manager.get_active_connection_count()}
     )
+
+
+@router.get("/api/status/kernel_pools")
+async def kernel_pools(request: Request) -> JSONResponse:
+    """
+    responses:
+        200:
+            description: Get metrics for the pools of pre-initialized kernels
+            content:
+                application/json:
+                    schema:
+                        type: object
+                        properties:
+                            size:
+                                type: integer
+                            ttl_seconds:
+                                type: integer
+                                nullable: true
+                            idle:
+                                type: integer
+                            hits:
+                                type: integer
+                            misses:
+                                type: integer
+                            created:
+                                type: integer
+                            expired:
+                                type: integer
+    """
+    app_state = AppState(request)
+    return JSONResponse(app_state.session_manager.kernel_pool_stats())
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import partial
@@ -26,7 +25,6 @@ from marimo._messaging.ops import (
     serialize,
 )
 from marimo._messaging.types import KernelMessage, NoopStream
-from marimo._plugins.core.json_encoder import WebComponentEncoder
 from marimo._plugins.core.web_component import JSONType
 from marimo._runtime.params import QueryParams
 from marimo._server.api.deps import AppState
@@ -37,6 +35,7 @@ from marimo._server.model import (
     SessionMode,
 )
 from marimo._server.router import APIRouter
+from marimo._server.session.frame import MessageFrame
 from marimo._server.sessions import Session, SessionManager
 from marimo._types.ids import CellId_t, ConsumerId, SessionId
 
@@ -50,6 +49,8 @@ router = APIRouter()
 SESSION_QUERY_PARAM_KEY = "session_id"
 FILE_QUERY_PARAM_KEY = "file"
 KIOSK_QUERY_PARAM_KEY = "kiosk"
+# Frontends that set this receive messages as binary (UTF-8 JSON) frames
+BINARY_QUERY_PARAM_KEY = "binary"
 
 class WebSocketCodes(IntEnum):
     ALREADY_CONNECTED = 1003
@@ -88,6 +89,7 @@ async def websocket_endpoint(
         return
 
     kiosk = app_state.query_params(KIOSK_QUERY_PARAM_KEY) == "true"
+    binary = app_state.query_params(BINARY_QUERY_PARAM_KEY) == "true"
 
     config = app_state.config_manager.get_config()
 
@@ -103,6 +105,7 @@ async def websocket_endpoint(
         file_key=file_key,
         kiosk=kiosk,
         auto_instantiate=auto_instantiate,
+        binary=binary,
     ).start()
 
 
@@ -273,6 +276,7 @@ class WebsocketHandler(SessionConsumer):
         file_key: MarimoFileKey,
         kiosk: bool,
         auto_instantiate: bool,
+        binary: bool = False,
     ):
         self.websocket = websocket
         self.manager = manager
@@ -283,6 +287,8 @@ class WebsocketHandler(SessionConsumer):
         self.status: ConnectionState
         self.kiosk = kiosk
         self.auto_instantiate = auto_instantiate
+        # Send messages as bytes, skipping a decode of encoded frames
+        self.binary = binary
         self.cancel_close_handle: Optional[asyncio.TimerHandle] = None
         self.heartbeat_task: Optional[asyncio.Task[None]] = None
         # Messages from the kernel are put in this queue
@@ -603,6 +609,21 @@ class WebsocketHandler(SessionConsumer):
                 file_key=self.file_key,
             )
             self.status = ConnectionState.CONNECTING
+            if new_session.prewarmed:
+                # The app was instantiated ahead of time (kernel pool);
+                # send its current state instead of re-running it.
+                view = new_session.get_current_state()
+                self._write_kernel_ready(
+                    new_session,
+                    resumed=True,
+                    ui_values=view.ui_values,
+                    last_executed_code=view.last_executed_code,
+                    last_execution_time=view.last_execution_time,
+                    kiosk=False,
+                )
+                self.status = ConnectionState.OPEN
+                self._replay_previous_session(new_session)
+                return new_session
             # Let the frontend know it can instantiate the app.
             self._write_kernel_ready(
                 new_session,
@@ -623,7 +644,8 @@ class WebsocketHandler(SessionConsumer):
 
         async def listen_for_messages() -> None:
             while True:
-                (op, data) = await self.message_queue.get()
+                message = await self.message_queue.get()
+                op = message[0]
 
                 if op in KIOSK_ONLY_OPERATIONS and not self.kiosk:
                     LOGGER.debug(
@@ -638,24 +660,22 @@ class WebsocketHandler(SessionConsumer):
                     )
                     continue
 
+                # Messages broadcast to a room arrive as frames shared with
+                # the other consumers, and are only encoded once.
+                frame = (
+                    message
+                    if isinstance(message, MessageFrame)
+                    else MessageFrame(*message)
+                )
                 try:
-                    text = json.dumps(
-                        {
-                            "op": op,
-                            "data": data,
-                        },
-                        cls=WebComponentEncoder,
-                    )
-                except TypeError as e:
-                    # This is a deserialization error
-                    LOGGER.error(
-                        "Failed to send message to frontend: %s", str(e)
-                    )
-                    LOGGER.error("Message: %s", data)
-                    continue
-
-                try:
-                    await self.websocket.send_text(text)
+                    if self.binary:
+                        if frame.buffer is None:
+                            continue
+                        await self.websocket.send_bytes(frame.buffer)
+                    else:
+                        if frame.text is None:
+                            continue
+                        await self.websocket.send_text(frame.text)
                 except WebSocketDisconnect as e:
                     self._on_disconnect(
                         e,
@@ -707,8 +727,12 @@ class WebsocketHandler(SessionConsumer):
 
         return listener
 
-    def write_operation(self, op: MessageOperation) -> None:
-        self.message_queue.put_nowait((op.name, serialize(op)))
+    def write_operation(
+        self, op: MessageOperation, frame: Optional[MessageFrame] = None
+    ) -> None:
+        self.message_queue.put_nowait(
+            frame if frame is not None else (op.name, serialize(op))
+        )
 
     def on_stop(self) -> None:
         # Cancel the heartbeat task, reader
@@ -75,6 +75,14 @@ async def lsp(app: Starlette) -> AsyncIterator[None]:
     yield
 
 
+@contextlib.asynccontextmanager
+async def kernel_pools(app: Starlette) -> AsyncIterator[None]:
+    state = AppState.from_app(app)
+    # Fill the kernel pool before the first request arrives
+    await state.session_manager.start_kernel_pools()
+    yield
+
+
 @contextlib.asynccontextmanager
 async def open_browser(app: Starlette) -> AsyncIterator[None]:
     state = AppState.from_app(app)
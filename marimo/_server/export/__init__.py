@@ -24,6 +24,7 @@ from marimo._server.file_router import AppFileRouter
 from marimo._server.model import ConnectionState, SessionConsumer, SessionMode
 from marimo._server.models.export import ExportAsHTMLRequest
 from marimo._server.models.models import InstantiateRequest
+from marimo._server.session.frame import MessageFrame
 from marimo._server.session.session_view import SessionView
 from marimo._types.ids import ConsumerId
 from marimo._utils.marimo_path import MarimoPath
@@ -249,7 +250,9 @@ async def run_app_until_completion(
         def on_stop(self) -> None:
             pass
 
-        def write_operation(self, op: MessageOperation) -> None:
+        def write_operation(
+            self, op: MessageOperation, frame: Optional[MessageFrame] = None
+        ) -> None:
             pass
 
         def connection_state(self) -> ConnectionState:
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import abc
 from enum import Enum
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Optional
 
 from marimo._types.ids import ConsumerId
 
 if TYPE_CHECKING:
     from marimo._messaging.ops import MessageOperation
     from marimo._messaging.types import KernelMessage
+    from marimo._server.session.frame import MessageFrame
 
 
 class ConnectionState(Enum):
@@ -56,7 +57,14 @@ class SessionConsumer(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def write_operation(self, op: MessageOperation) -> None:
+    def write_operation(
+        self, op: MessageOperation, frame: Optional[MessageFrame] = None
+    ) -> None:
+        """Write an operation to the consumer.
+
+        When broadcasting, `frame` holds the operation already serialized
+        for the frontend, shared with the other consumers.
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
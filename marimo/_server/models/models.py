@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from marimo._ast.cell import CellConfig
 from marimo._config.config import MarimoConfig
+from marimo._messaging.cell_output import CellOutput
 from marimo._runtime.requests import (
     ExecuteMultipleRequest,
     ExecuteScratchpadRequest,
@@ -54,6 +55,21 @@ class ErrorResponse(BaseResponse):
     message: Optional[str] = None
 
 
+@dataclass
+class ConsoleHistoryRequest:
+    cell_id: CellId_t
+    # Index of the first output, where 0 is the oldest
+    offset: int
+    limit: int = 100
+
+
+@dataclass
+class ConsoleHistoryResponse:
+    outputs: List[CellOutput]
+    # Total number of outputs that are no longer kept in memory
+    total: int
+
+
 @dataclass
 class FormatRequest:
     codes: Dict[CellId_t, str]
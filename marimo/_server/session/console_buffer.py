@@ -0,0 +1,173 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from array import array
+from collections import deque
+from typing import IO, Optional
+
+from marimo import _loggers
+from marimo._messaging.cell_output import CellOutput
+from marimo._utils.parse_dataclass import parse_raw
+
+LOGGER = _loggers.marimo_logger()
+
+# Console outputs kept in memory per cell; older outputs are spilled to disk.
+CONSOLE_MAX_LINES = int(os.getenv("MARIMO_CONSOLE_MAX_LINES", 10_000))
+CONSOLE_MAX_BYTES = int(os.getenv("MARIMO_CONSOLE_MAX_BYTES", 5_000_000))
+
+
+def _size(output: CellOutput) -> tuple[int, int]:
+    """Approximate (lines, bytes) of a console output."""
+    data = output.data
+    if not isinstance(data, str):
+        data = json.dumps(data)
+    return max(data.count("\n"), 1), len(data)
+
+
+class ConsoleSpill:
+    """Append-only temporary file of the outputs spilled by consoles.
+
+    The consoles of a session share one spill file, so that a session holds
+    at most one file descriptor however many of its cells spill. The file
+    is created on the first spill, and truncated once no console refers to
+    its contents.
+    """
+
+    def __init__(self) -> None:
+        self._file: Optional[IO[bytes]] = None
+        # Bytes referred to by consoles
+        self._live = 0
+
+    def write(self, data: bytes) -> int:
+        """Append data, returning its offset."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="marimo-console-")
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self._live += len(data)
+        return offset
+
+    def read(self, offset: int, size: int) -> bytes:
+        if self._file is None:
+            return b""
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    def release(self, size: int) -> None:
+        """Drop the reference of a console to `size` bytes."""
+        self._live -= size
+        if self._live <= 0 and self._file is not None:
+            self._live = 0
+            self._file.truncate(0)
+
+    def close(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                LOGGER.debug("Failed to close console spill file: %s", e)
+            self._file = None
+        self._live = 0
+
+
+class ConsoleBuffer:
+    """Bounded console of a cell.
+
+    Keeps the most recent outputs in memory, within `max_lines` and
+    `max_bytes`. Outputs that fall out of the buffer are appended to a
+    spill file, so that they can be paged in on request (see
+    `read_spilled`) without being held in memory or replayed to every
+    reconnecting client. The spill file may be shared with the consoles of
+    other cells; otherwise the console creates its own.
+
+    The most recent output is always kept, even if it alone exceeds the
+    limits.
+    """
+
+    def __init__(
+        self,
+        max_lines: int = CONSOLE_MAX_LINES,
+        max_bytes: int = CONSOLE_MAX_BYTES,
+        spill: Optional[ConsoleSpill] = None,
+    ) -> None:
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._outputs: deque[CellOutput] = deque()
+        self._sizes: deque[tuple[int, int]] = deque()
+        self._lines = 0
+        self._bytes = 0
+        # Spilled outputs, one JSON document each, and their locations in
+        # the spill file
+        self._owns_spill = spill is None
+        self._spill = spill if spill is not None else ConsoleSpill()
+        self._spill_offsets = array("Q")
+        self._spill_sizes = array("Q")
+
+    @property
+    def outputs(self) -> list[CellOutput]:
+        return list(self._outputs)
+
+    @property
+    def spilled(self) -> int:
+        """The number of outputs spilled to disk."""
+        return len(self._spill_offsets)
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def extend(self, outputs: list[CellOutput]) -> None:
+        for output in outputs:
+            lines, nbytes = _size(output)
+            self._outputs.append(output)
+            self._sizes.append((lines, nbytes))
+            self._lines += lines
+            self._bytes += nbytes
+        while len(self._outputs) > 1 and (
+            self._lines > self.max_lines or self._bytes > self.max_bytes
+        ):
+            lines, nbytes = self._sizes.popleft()
+            self._lines -= lines
+            self._bytes -= nbytes
+            self._write_spill(self._outputs.popleft())
+
+    def _write_spill(self, output: CellOutput) -> None:
+        data = json.dumps(output.asdict()).encode()
+        self._spill_offsets.append(self._spill.write(data))
+        self._spill_sizes.append(len(data))
+
+    def read_spilled(self, offset: int, limit: int) -> list[CellOutput]:
+        """Read spilled outputs, oldest first.
+
+        Args:
+            offset: index of the first output, where 0 is the oldest
+            limit: the maximum number of outputs to read
+        """
+        end = min(offset + limit, self.spilled)
+        if offset >= end or offset < 0:
+            return []
+        return [
+            parse_raw(
+                self._spill.read(self._spill_offsets[i], self._spill_sizes[i]),
+                CellOutput,
+            )
+            for i in range(offset, end)
+        ]
+
+    def clear(self) -> None:
+        self._outputs.clear()
+        self._sizes.clear()
+        self._lines = 0
+        self._bytes = 0
+        self.close()
+
+    def close(self) -> None:
+        """Drop the spilled outputs."""
+        if self._owns_spill:
+            self._spill.close()
+        else:
+            self._spill.release(sum(self._spill_sizes))
+        self._spill_offsets = array("Q")
+        self._spill_sizes = array("Q")
@@ -0,0 +1,51 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Optional, Tuple
+
+from marimo._messaging.encoding import encode_message
+
+
+class MessageFrame(Tuple[str, Any]):
+    """A message for the frontend, encoded at most once.
+
+    A frame is an immutable `(op, data)` pair, so it can be used wherever a
+    `KernelMessage` is expected. A session shares a single frame among all
+    of its consumers, so that a message broadcast to N consumers is encoded
+    once instead of N times.
+
+    Frames received from a kernel process arrive already encoded (see
+    `from_bytes`), and are forwarded to the frontend as is.
+    """
+
+    def __new__(cls, op: str, data: Any) -> MessageFrame:
+        return super().__new__(cls, (op, data))
+
+    @staticmethod
+    def from_bytes(buffer: bytes) -> MessageFrame:
+        """Decode a frame encoded by `encode_message`, keeping its bytes."""
+        message = json.loads(buffer)
+        frame = MessageFrame(message["op"], message["data"])
+        frame.__dict__["buffer"] = buffer
+        return frame
+
+    @property
+    def op(self) -> str:
+        return self[0]
+
+    @property
+    def data(self) -> Any:
+        return self[1]
+
+    @functools.cached_property
+    def buffer(self) -> Optional[bytes]:
+        """The encoded message, or None if not encodable"""
+        return encode_message(self.op, self.data)
+
+    @functools.cached_property
+    def text(self) -> Optional[str]:
+        """The encoded message as text, or None if not encodable"""
+        buffer = self.buffer
+        return buffer.decode("utf-8") if buffer is not None else None
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import os
 from pathlib import Path
 from typing import List, Optional, cast
 
@@ -33,61 +34,66 @@ from marimo._utils.lists import as_list
 LOGGER = _loggers.marimo_logger()
 
 
-def serialize_session_view(view: SessionView) -> NotebookSessionV1:
-    """Convert a SessionView to a NotebookSession schema."""
-    cells: List[Cell] = []
-
-    for cell_id, cell_op in view.cell_operations.items():
-        outputs: List[OutputType] = []
-        console: List[StreamOutput] = []
-
-        # Convert output
-        if cell_op.output:
-            if cell_op.output.channel == CellChannel.MARIMO_ERROR:
-                for error in cast(List[MarimoError], cell_op.output.data):
-                    outputs.append(
-                        ErrorOutput(
-                            type="error",
-                            ename=error.type,
-                            evalue=error.describe(),
-                            traceback=[],
-                        )
-                    )
-            else:
+def serialize_cell(view: SessionView, cell_id: CellId_t) -> Cell:
+    """Convert a cell of a SessionView to a Cell schema."""
+    cell_op = view.cell_operations[cell_id]
+    outputs: List[OutputType] = []
+    console: List[StreamOutput] = []
+
+    # Convert output
+    if cell_op.output:
+        if cell_op.output.channel == CellChannel.MARIMO_ERROR:
+            for error in cast(List[MarimoError], cell_op.output.data):
                 outputs.append(
-                    DataOutput(
-                        type="data",
-                        data={
-                            cell_op.output.mimetype: cell_op.output.data,
-                        },
+                    ErrorOutput(
+                        type="error",
+                        ename=error.type,
+                        evalue=error.describe(),
+                        traceback=[],
                     )
                 )
+        else:
+            outputs.append(
+                DataOutput(
+                    type="data",
+                    data={
+                        cell_op.output.mimetype: cell_op.output.data,
+                    },
+                )
+            )
 
-        # Convert console outputs
-        for console_out in as_list(cell_op.console):
-            assert isinstance(console_out, CellOutput)
-            if console_out:
-                console.append(
-                    StreamOutput(
-                        type="stream",
-                        name="stderr"
-                        if console_out.channel == CellChannel.STDERR
-                        else "stdout",
-                        text=str(console_out.data),
-                    )
+    # Convert console outputs
+    for console_out in as_list(cell_op.console):
+        assert isinstance(console_out, CellOutput)
+        if console_out:
+            console.append(
+                StreamOutput(
+                    type="stream",
+                    name="stderr"
+                    if console_out.channel == CellChannel.STDERR
+                    else "stdout",
+                    text=str(console_out.data),
                 )
+            )
 
-        code_hash = _hash_code(view.last_executed_code.get(cell_id))
+    code_hash = _hash_code(view.last_executed_code.get(cell_id))
 
-        cells.append(
-            Cell(
-                id=cell_id,
-                code_hash=code_hash,
-                outputs=outputs,
-                console=console,
-            )
-        )
+    return Cell(
+        id=cell_id,
+        code_hash=code_hash,
+        outputs=outputs,
+        console=console,
+    )
+
+
+def serialize_session_view(view: SessionView) -> NotebookSessionV1:
+    """Convert a SessionView to a NotebookSession schema."""
+    return _notebook_session(
+        [serialize_cell(view, cell_id) for cell_id in view.cell_operations]
+    )
 
+
+def _notebook_session(cells: List[Cell]) -> NotebookSessionV1:
     return NotebookSessionV1(
         version=VERSION,
         metadata=NotebookMetadata(marimo_version=__version__),
@@ -95,80 +101,84 @@ def serialize_session_view(view: SessionView) -> NotebookSessionV1:
     )
 
 
-def deserialize_session(session: NotebookSessionV1) -> SessionView:
-    """Convert a NotebookSession schema to a SessionView."""
-    view = SessionView()
+def deserialize_cell(cell: Cell) -> CellOp:
+    """Convert a Cell schema to a cell operation."""
+    cell_outputs: List[CellOutput] = []
 
-    for cell in session["cells"]:
-        cell_outputs: List[CellOutput] = []
-
-        # Convert outputs
-        for output in cell["outputs"]:
-            if output["type"] == "error":
+    # Convert outputs
+    for output in cell["outputs"]:
+        if output["type"] == "error":
+            cell_outputs.append(
+                CellOutput(
+                    channel=CellChannel.MARIMO_ERROR,
+                    mimetype="text/plain",
+                    data=[
+                        MarimoExceptionRaisedError(
+                            type="exception",
+                            exception_type=output["ename"],
+                            msg=output["evalue"],
+                            raising_cell=None,
+                        )
+                    ],
+                )
+            )
+        elif output["type"] == "data":
+            # No data
+            if len(output["data"]) == 0:
+                continue
+            elif len(output["data"]) == 1:
                 cell_outputs.append(
                     CellOutput(
-                        channel=CellChannel.MARIMO_ERROR,
-                        mimetype="text/plain",
-                        data=[
-                            MarimoExceptionRaisedError(
-                                type="exception",
-                                exception_type=output["ename"],
-                                msg=output["evalue"],
-                                raising_cell=None,
-                            )
-                        ],
+                        channel=CellChannel.OUTPUT,
+                        mimetype=cast(
+                            KnownMimeType,
+                            next(iter(output["data"].keys())),
+                        ),
+                        data=next(iter(output["data"].values())),
                     )
                 )
-            elif output["type"] == "data":
-                # No data
-                if len(output["data"]) == 0:
-                    continue
-                elif len(output["data"]) == 1:
-                    cell_outputs.append(
-                        CellOutput(
-                            channel=CellChannel.OUTPUT,
-                            mimetype=cast(
-                                KnownMimeType,
-                                next(iter(output["data"].keys())),
-                            ),
-                            data=next(iter(output["data"].values())),
-                        )
-                    )
-                else:
-                    # Mime bundle
-                    cell_outputs.append(
-                        CellOutput(
-                            channel=CellChannel.OUTPUT,
-                            mimetype="application/vnd.marimo+mimebundle",
-                            data=output["data"],
-                        )
-                    )
             else:
-                LOGGER.warning(f"Unknown output type: {output}")
-                continue
-
-        # Convert console
-        console_outputs: List[CellOutput] = []
-        for console in cell["console"]:
-            console_outputs.append(
-                CellOutput(
-                    channel=CellChannel.STDERR
-                    if console["name"] == "stderr"
-                    else CellChannel.STDOUT,
-                    data=console["text"],
-                    mimetype="text/plain",
+                # Mime bundle
+                cell_outputs.append(
+                    CellOutput(
+                        channel=CellChannel.OUTPUT,
+                        mimetype="application/vnd.marimo+mimebundle",
+                        data=output["data"],
+                    )
                 )
+        else:
+            LOGGER.warning(f"Unknown output type: {output}")
+            continue
+
+    # Convert console
+    console_outputs: List[CellOutput] = []
+    for console in cell["console"]:
+        console_outputs.append(
+            CellOutput(
+                channel=CellChannel.STDERR
+                if console["name"] == "stderr"
+                else CellChannel.STDOUT,
+                data=console["text"],
+                mimetype="text/plain",
             )
+        )
+
+    return CellOp(
+        cell_id=CellId_t(cell["id"]),
+        status="idle",
+        output=cell_outputs[0] if cell_outputs else None,
+        console=console_outputs,
+        timestamp=0,
+    )
 
-        cell_id = CellId_t(cell["id"])
 
-        view.cell_operations[cell_id] = CellOp(
-            cell_id=cell_id,
-            status="idle",
-            output=cell_outputs[0] if cell_outputs else None,
-            console=console_outputs,
-            timestamp=0,
-        )
+def deserialize_session(session: NotebookSessionV1) -> SessionView:
+    """Convert a NotebookSession schema to a SessionView."""
+    view = SessionView()
+
+    for cell in session["cells"]:
+        cell_op = deserialize_cell(cell)
+        view.cell_operations[cell_op.cell_id] = cell_op
 
     return view
 
@@ -182,6 +192,36 @@ def get_session_cache_file(path: Path) -> Path:
     return path.parent / "__marimo__" / "session" / f"{path.name}.json"
 
 
+def get_session_log_file(cache_file: Path) -> Path:
+    """Get the log of changes made since the cache file was written.
+
+    Each line of the log is a Cell, which replaces the cell with the same
+    id in the cache file (or is added after its cells).
+    """
+    return cache_file.with_name(f"{cache_file.name}.log")
+
+
+def read_session_cache(cache_file: Path) -> NotebookSessionV1:
+    """Read a session cache file, with its log of changes applied."""
+    session = cast(NotebookSessionV1, json.loads(cache_file.read_text()))
+    log_file = get_session_log_file(cache_file)
+    if not log_file.exists():
+        return session
+
+    cells = {cell["id"]: cell for cell in session["cells"]}
+    with log_file.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                cell = cast(Cell, json.loads(line))
+            except json.JSONDecodeError:
+                # A write was interrupted; later lines were never written.
+                LOGGER.warning("Ignoring truncated session cache log")
+                break
+            cells[cell["id"]] = cell
+    session["cells"] = list(cells.values())
+    return session
+
+
 def _hash_code(code: Optional[str]) -> Optional[str]:
     if code is None or code == "":
         return None
@@ -189,7 +229,17 @@ def _hash_code(code: Optional[str]) -> Optional[str]:
 
 
 class SessionCacheWriter(AsyncBackgroundTask):
-    """Periodically writes a SessionView to a file."""
+    """Periodically writes a SessionView to a file.
+
+    Only cells that changed since the last write are serialized, and they
+    are appended to a log next to the file. Once the log outgrows the file
+    (see `COMPACT_MIN_BYTES`), both are compacted into a new file, which
+    atomically replaces the old one. File I/O and encoding run in a worker
+    thread, off the event loop.
+    """
+
+    # The log is compacted once it is larger than both this and the file.
+    COMPACT_MIN_BYTES = 1_000_000
 
     def __init__(
         self,
@@ -200,7 +250,14 @@ class SessionCacheWriter(AsyncBackgroundTask):
         super().__init__()
         self.session_view = session_view
         self.path = path
+        self.log_path = get_session_log_file(path)
         self.interval = interval
+        # The last serialization of each cell
+        self._cells: dict[CellId_t, Cell] = {}
+        # Whether self.path holds this writer's cells (plus its log)
+        self._compacted = False
+        self._file_bytes = 0
+        self._log_bytes = 0
 
     async def startup(self) -> None:
         # Create parent directories if they don't exist
@@ -209,15 +266,16 @@ class SessionCacheWriter(AsyncBackgroundTask):
         except Exception as e:
             LOGGER.error(f"Failed to create parent directories: {e}")
             raise
+        self.session_view.take_dirty_cells()
+        self._cells = {
+            CellId_t(cell["id"]): cell
+            for cell in serialize_session_view(self.session_view)["cells"]
+        }
 
     async def run(self) -> None:
         while self.running:
             try:
-                if self.session_view.needs_export("session"):
-                    self.session_view.mark_auto_export_session()
-                    LOGGER.debug(f"Writing session view to cache {self.path}")
-                    data = serialize_session_view(self.session_view)
-                    self.path.write_text(json.dumps(data, indent=2))
+                await self._write()
                 await asyncio.sleep(self.interval)
             except asyncio.CancelledError:
                 raise
@@ -226,6 +284,59 @@ class SessionCacheWriter(AsyncBackgroundTask):
                 # If we fail to write, we should stop the writer
                 break
 
+    async def shutdown(self) -> None:
+        try:
+            await self._write()
+            if self._log_bytes:
+                await self._compact()
+        except Exception as e:
+            LOGGER.error(f"Write error: {e}")
+
+    async def _write(self) -> None:
+        if not self.session_view.needs_export("session"):
+            return
+        self.session_view.mark_auto_export_session()
+        changed: List[Cell] = []
+        for cell_id in self.session_view.take_dirty_cells():
+            if cell_id not in self.session_view.cell_operations:
+                continue
+            cell = serialize_cell(self.session_view, cell_id)
+            if self._cells.get(cell_id) != cell:
+                self._cells[cell_id] = cell
+                changed.append(cell)
+
+        if not self._compacted or self._log_bytes > max(
+            self._file_bytes, self.COMPACT_MIN_BYTES
+        ):
+            await self._compact()
+        elif changed:
+            LOGGER.debug(f"Appending {len(changed)} cells to {self.log_path}")
+            self._log_bytes += await asyncio.to_thread(
+                self._append_log, changed
+            )
+
+    async def _compact(self) -> None:
+        LOGGER.debug(f"Writing session view to cache {self.path}")
+        session = _notebook_session(list(self._cells.values()))
+        self._file_bytes = await asyncio.to_thread(self._write_file, session)
+        self._log_bytes = 0
+        self._compacted = True
+
+    def _append_log(self, cells: List[Cell]) -> int:
+        data = "".join(json.dumps(cell) + "\n" for cell in cells)
+        with self.log_path.open("a", encoding="utf-8") as f:
+            f.write(data)
+        return len(data)
+
+    def _write_file(self, session: NotebookSessionV1) -> int:
+        data = json.dumps(session, indent=2)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(data)
+        os.replace(tmp, self.path)
+        # The file now includes the changes in the log
+        self.log_path.unlink(missing_ok=True)
+        return len(data)
+
 
 class SessionCacheManager:
     """Manages the session cache writer.
@@ -279,7 +390,5 @@ class SessionCacheManager:
         cache_file = get_session_cache_file(Path(self.path))
         if not cache_file.exists():
             return self.session_view
-        self.session_view = deserialize_session(
-            json.loads(cache_file.read_text())
-        )
+        self.session_view = deserialize_session(read_session_cache(cache_file))
         return self.session_view
@@ -6,7 +6,11 @@ from dataclasses import dataclass
 from typing import Any, Literal, Optional
 
 from marimo._data.models import DataSourceConnection, DataTable
-from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.cell_output import (
+    CellChannel,
+    CellOutput,
+    apply_output_deltas,
+)
 from marimo._messaging.ops import (
     CellOp,
     Datasets,
@@ -19,6 +23,8 @@ from marimo._messaging.ops import (
     VariableValue,
     VariableValues,
 )
+from marimo._output.hypertext import Html
+from marimo._plugins.stateless.flex import vstack
 from marimo._runtime.requests import (
     ControlRequest,
     CreationRequest,
@@ -26,6 +32,10 @@ from marimo._runtime.requests import (
     ExecutionRequest,
     SetUIElementValueRequest,
 )
+from marimo._server.session.console_buffer import (
+    ConsoleBuffer,
+    ConsoleSpill,
+)
 from marimo._sql.engines import INTERNAL_DUCKDB_ENGINE
 from marimo._types.ids import CellId_t
 from marimo._utils.lists import as_list
@@ -65,7 +75,20 @@ class SessionView:
         # Last seen cell IDs
         self.cell_ids: Optional[UpdateCellIdsRequest] = None
         # List of operations we care about keeping track of.
-        self.cell_operations: dict[CellId_t, CellOp] = {}
+        self._cell_operations: dict[CellId_t, CellOp] = {}
+        # Items of outputs sent as OutputDeltas, by cell
+        self._output_items: dict[CellId_t, list[str]] = {}
+        # Cells whose output is behind its items -> time of the last delta;
+        # outputs are rebuilt lazily, so that n deltas cost O(n).
+        self._stale_outputs: dict[CellId_t, float] = {}
+        # Bounded console of each cell; older outputs are spilled to disk,
+        # in a file shared by all cells.
+        self._consoles: dict[CellId_t, ConsoleBuffer] = {}
+        self._console_spill = ConsoleSpill()
+        # Cells whose console is behind its buffer
+        self._stale_consoles: set[CellId_t] = set()
+        # Cells changed since they were last saved to the session cache
+        self._dirty_cells: set[CellId_t] = set()
         # The most recent datasets operation.
         self.datasets = Datasets(tables=[])
         # The most recent data-connectors operation
@@ -86,11 +109,28 @@ class SessionView:
         # Auto-saving
         self.auto_export_state = AutoExportState()
 
+    @property
+    def cell_operations(self) -> dict[CellId_t, CellOp]:
+        for cell_id, timestamp in self._stale_outputs.items():
+            cell_op = self._cell_operations.get(cell_id)
+            if cell_op is not None:
+                cell_op.output = stack_output_items(
+                    self._output_items[cell_id], timestamp
+                )
+        self._stale_outputs.clear()
+        for cell_id in self._stale_consoles:
+            cell_op = self._cell_operations.get(cell_id)
+            if cell_op is not None:
+                cell_op.console = self._consoles[cell_id].outputs
+        self._stale_consoles.clear()
+        return self._cell_operations
+
     def _add_ui_value(self, name: str, value: Any) -> None:
         self.ui_values[name] = value
 
     def _add_last_run_code(self, req: ExecutionRequest) -> None:
         self.last_executed_code[req.cell_id] = req.code
+        self._dirty_cells.add(req.cell_id)
 
     def add_raw_operation(self, raw_operation: Any) -> None:
         self._touch()
@@ -133,6 +173,7 @@ class SessionView:
                 if cell_output.channel == CellChannel.STDIN:
                     cell_output.channel = CellChannel.STDOUT
                     cell_output.data = f"{cell_output.data} {stdin}\n"
+                    self._dirty_cells.add(cell_op.cell_id)
                     return
 
     def add_operation(self, operation: MessageOperation) -> None:
@@ -142,10 +183,41 @@ class SessionView:
         """Add an operation to the session view."""
 
         if isinstance(operation, CellOp):
-            previous = self.cell_operations.get(operation.cell_id)
-            self.cell_operations[operation.cell_id] = merge_cell_operation(
-                previous, operation
-            )
+            cell_id = operation.cell_id
+            self._dirty_cells.add(cell_id)
+            if operation.output_delta is not None:
+                self._output_items[cell_id] = apply_output_deltas(
+                    self._output_items.get(cell_id), operation.output_delta
+                )
+                self._stale_outputs[cell_id] = operation.timestamp
+                operation.output_delta = None
+            elif operation.output is not None:
+                self._output_items.pop(cell_id, None)
+                self._stale_outputs.pop(cell_id, None)
+            previous = self._cell_operations.get(cell_id)
+            console = self._consoles.get(cell_id)
+            if console is None:
+                console = self._consoles[cell_id] = ConsoleBuffer(
+                    spill=self._console_spill
+                )
+                if previous is not None:
+                    # e.g. a cell operation restored from a session file
+                    console.extend(as_list(previous.console))
+            # If we went from queued to running, clear the console.
+            if (
+                previous is not None
+                and previous.status == "queued"
+                and operation.status == "running"
+            ):
+                console.clear()
+            if operation.console is not None:
+                console.extend(as_list(operation.console))
+                self._stale_consoles.add(cell_id)
+                operation.console = None
+            merged = merge_cell_operation(previous, operation)
+            if merged.console is None:
+                merged.console = []
+            self._cell_operations[cell_id] = merged
             if not previous:
                 return
             if previous.status == "queued" and operation.status == "running":
@@ -251,6 +323,31 @@ class SessionView:
                 outputs[cell_id] = cell_op.output
         return outputs
 
+    def take_dirty_cells(self) -> set[CellId_t]:
+        """Return and reset the cells changed since the last call."""
+        dirty, self._dirty_cells = self._dirty_cells, set()
+        return dirty
+
+    def get_spilled_console_outputs(
+        self, cell_id: CellId_t, offset: int, limit: int
+    ) -> tuple[list[CellOutput], int]:
+        """Get console outputs of a cell that no longer fit in memory.
+
+        Returns:
+            The outputs, oldest first, and the total number of spilled
+            outputs.
+        """
+        console = self._consoles.get(cell_id)
+        if console is None:
+            return [], 0
+        return console.read_spilled(offset, limit), console.spilled
+
+    def close(self) -> None:
+        """Release the console spill file."""
+        for console in self._consoles.values():
+            console.close()
+        self._console_spill.close()
+
     def get_cell_console_outputs(
         self, ids: list[CellId_t]
     ) -> dict[CellId_t, list[CellOutput]]:
@@ -319,6 +416,16 @@ class SessionView:
         self.auto_export_state.mark_all_stale()
 
 
+def stack_output_items(items: list[str], timestamp: float) -> CellOutput:
+    """The output of a cell built from OutputDeltas."""
+    return CellOutput(
+        channel=CellChannel.OUTPUT,
+        mimetype="text/html",
+        data=vstack([Html(item) for item in items]).text,
+        timestamp=timestamp,
+    )
+
+
 def merge_cell_operation(
     previous: Optional[CellOp],
     next_: CellOp,
@@ -15,6 +15,8 @@ even if its socket is closed.
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import multiprocessing as mp
 import os
 import queue
@@ -24,10 +26,11 @@ import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from multiprocessing import connection
 from multiprocessing.queues import Queue as MPQueue
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 from uuid import uuid4
 
 from marimo import _loggers
@@ -42,6 +45,7 @@ from marimo._messaging.ops import (
     Reload,
     UpdateCellCodes,
     UpdateCellIdsRequest,
+    serialize,
 )
 from marimo._messaging.types import KernelMessage
 from marimo._output.formatters.formatters import register_formatters
@@ -62,6 +66,7 @@ from marimo._server.file_router import AppFileRouter, MarimoFileKey
 from marimo._server.model import ConnectionState, SessionConsumer, SessionMode
 from marimo._server.models.models import InstantiateRequest
 from marimo._server.recents import RecentFilesManager
+from marimo._server.session.frame import MessageFrame
 from marimo._server.session.serialize import (
     SessionCacheManager,
 )
@@ -355,6 +360,37 @@ class Room:
         self.main_consumer: Optional[SessionConsumer] = None
         self.consumers: Dict[SessionConsumer, ConsumerId] = {}
         self.disposables: Dict[SessionConsumer, Disposable] = {}
+        # Subscriptions to kernel messages, fed by `fan_out`
+        self.listeners: list[Callable[[KernelMessage], None]] = []
+
+    def subscribe(
+        self, listener: Callable[[KernelMessage], None]
+    ) -> Disposable:
+        """Subscribe a listener to kernel messages sent to this room."""
+        self.listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+        return Disposable(_remove)
+
+    def fan_out(self, message: KernelMessage) -> None:
+        """Share a kernel message with all listeners as a single frame.
+
+        The frame is encoded lazily by the first listener that needs its
+        text, and the encoding is reused by the rest. Frames that arrive
+        encoded from the kernel are shared as is.
+        """
+        if not self.listeners:
+            return
+        frame = (
+            message
+            if isinstance(message, MessageFrame)
+            else MessageFrame(*message)
+        )
+        for listener in list(self.listeners):
+            listener(frame)
 
     @property
     def size(self) -> int:
@@ -398,11 +434,15 @@ class Room:
         operation: MessageOperation,
         except_consumer: Optional[ConsumerId],
     ) -> None:
+        frame: Optional[MessageFrame] = None
         for consumer in self.consumers:
             if consumer.consumer_id == except_consumer:
                 continue
             if consumer.connection_state() == ConnectionState.OPEN:
-                consumer.write_operation(operation)
+                # Serialize once, for all consumers
+                if frame is None:
+                    frame = MessageFrame(operation.name, serialize(operation))
+                consumer.write_operation(operation, frame)
 
     def close(self) -> None:
         for consumer in self.consumers:
@@ -429,7 +469,7 @@ class Session:
     def create(
         cls,
         initialization_id: str,
-        session_consumer: SessionConsumer,
+        session_consumer: Optional[SessionConsumer],
         mode: SessionMode,
         app_metadata: AppMetadata,
         app_file_manager: AppFileManager,
@@ -440,6 +480,9 @@ class Session:
     ) -> Session:
         """
         Create a new session.
+
+        If `session_consumer` is None, the session is started without a
+        main consumer; one can be connected later with `connect_consumer`.
         """
         configs = app_file_manager.app.cell_manager.config_map()
         use_multiprocessing = mode == SessionMode.EDIT
@@ -465,7 +508,7 @@ class Session:
     def __init__(
         self,
         initialization_id: str,
-        session_consumer: SessionConsumer,
+        session_consumer: Optional[SessionConsumer],
         queue_manager: QueueManager,
         kernel_manager: KernelManager,
         app_file_manager: AppFileManager,
@@ -485,6 +528,9 @@ class Session:
         )
         self.session_view = SessionView()
         self.session_cache_manager: SessionCacheManager | None = None
+        # Whether the app was instantiated before a consumer connected,
+        # i.e. the session was handed out by a KernelPool
+        self.prewarmed = False
 
         self.kernel_manager.start_kernel()
         # Reads from the kernel connection and distributes the
@@ -494,8 +540,11 @@ class Session:
             | QueueDistributor[KernelMessage]
         )
         if self.kernel_manager.mode == SessionMode.EDIT:
+            # The kernel process sends messages already encoded for the
+            # frontend; see ThreadSafeStream.
             self.message_distributor = ConnectionDistributor[KernelMessage](
-                self.kernel_manager.kernel_connection
+                self.kernel_manager.kernel_connection,
+                decode=MessageFrame.from_bytes,
             )
         else:
             q = self._queue_manager.stream_queue
@@ -505,14 +554,24 @@ class Session:
         self.message_distributor.add_consumer(
             lambda msg: self.session_view.add_raw_operation(msg[1])
         )
-        self.connect_consumer(session_consumer, main=True)
+        self.message_distributor.add_consumer(self.room.fan_out)
+        if session_consumer is not None:
+            self.connect_consumer(session_consumer, main=True)
         self.message_distributor.start()
 
         self.heartbeat_task: Optional[asyncio.Task[Any]] = None
-        self._start_heartbeat()
+        self.start_heartbeat()
         self._closed = False
 
-    def _start_heartbeat(self) -> None:
+    def start_heartbeat(self) -> None:
+        """Check that the kernel is alive every second, on the event loop.
+
+        Does nothing if the heartbeat is already running or there is no
+        event loop.
+        """
+        if self.heartbeat_task is not None:
+            return
+
         def _check_alive() -> None:
             if not self.kernel_manager.is_alive():
                 LOGGER.debug(
@@ -613,7 +672,7 @@ class Session:
         an exception is raised.
         """
         subscribe = session_consumer.on_start()
-        unsubscribe_consumer = self.message_distributor.add_consumer(subscribe)
+        unsubscribe_consumer = self.room.subscribe(subscribe)
         self.room.add_consumer(
             session_consumer,
             unsubscribe_consumer,
@@ -660,6 +719,7 @@ class Session:
             self.heartbeat_task.cancel()
         if self.session_cache_manager:
             self.session_cache_manager.stop()
+        self.session_view.close()
         self.kernel_manager.close_kernel()
 
     def instantiate(
@@ -718,6 +778,114 @@ class Session:
         )
 
 
+class KernelPool:
+    """Pool of pre-initialized run-mode sessions for one app.
+
+    Pooled sessions have no consumer, and their kernels have already been
+    asked to run the notebook to its initial state, so handing one out
+    makes first paint independent of the notebook's run time. Sessions
+    older than `ttl_seconds` are closed instead of handed out, so that
+    clients don't see stale initial state.
+
+    `replenish` blocks while sessions are created, so it is run on a
+    worker thread; the pool is safe to acquire from concurrently.
+    """
+
+    def __init__(
+        self,
+        create_session: Callable[[], Session],
+        size: int,
+        ttl_seconds: Optional[int],
+    ) -> None:
+        self._create_session = create_session
+        self.size = size
+        self.ttl_seconds = ttl_seconds
+        self._sessions: deque[tuple[Session, float]] = deque()
+        self._lock = threading.Lock()
+        self._replenishing = False
+        self._closed = False
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.expired = 0
+
+    @property
+    def idle(self) -> int:
+        return len(self._sessions)
+
+    def acquire(self) -> Optional[Session]:
+        """Take a pre-initialized session, if one is available."""
+        with self._lock:
+            self._evict()
+            if not self._sessions:
+                self.misses += 1
+                return None
+            session, _ = self._sessions.popleft()
+            self.hits += 1
+            return session
+
+    def replenish(self) -> None:
+        """Start sessions until the pool is full.
+
+        Returns immediately if another thread is already replenishing.
+        """
+        with self._lock:
+            if self._replenishing or self._closed:
+                return
+            self._replenishing = True
+            self._evict()
+        try:
+            while True:
+                with self._lock:
+                    if self._closed or len(self._sessions) >= self.size:
+                        return
+                # Created without holding the lock, so that sessions can
+                # be handed out in the meantime
+                session = self._create_session()
+                with self._lock:
+                    if self._closed:
+                        session.close()
+                        return
+                    self._sessions.append((session, time.monotonic()))
+                    self.created += 1
+        finally:
+            with self._lock:
+                self._replenishing = False
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        live: deque[tuple[Session, float]] = deque()
+        for session, created_at in self._sessions:
+            if (
+                session.connection_state() == ConnectionState.CLOSED
+                or not session.kernel_manager.is_alive()
+            ):
+                session.close()
+            elif (
+                self.ttl_seconds is not None
+                and now - created_at > self.ttl_seconds
+            ):
+                LOGGER.debug("Closing pooled session (TTL EXPIRED)")
+                session.close()
+                self.expired += 1
+            else:
+                live.append((session, created_at))
+        self._sessions = live
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for session, _ in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+# Pools are keyed by file and query params; bound how many we keep warm.
+_MAX_KERNEL_POOLS = 8
+
+
 class SessionManager:
     """Mapping from client session IDs to sessions.
 
@@ -746,6 +914,8 @@ class SessionManager:
         redirect_console_to_browser: bool,
         ttl_seconds: Optional[int],
         watch: bool = False,
+        kernel_pool_size: int = 0,
+        kernel_pool_ttl_seconds: Optional[int] = None,
     ) -> None:
         self.file_router = file_router
         self.mode = mode
@@ -762,6 +932,14 @@ class SessionManager:
         self.cli_args = cli_args
         self.redirect_console_to_browser = redirect_console_to_browser
         self.supabase_client = client.get_supabase_client()
+        # Pre-initialized sessions, only used in run mode
+        self.kernel_pool_size = (
+            kernel_pool_size if mode == SessionMode.RUN else 0
+        )
+        self.kernel_pool_ttl_seconds = kernel_pool_ttl_seconds
+        self.kernel_pools: dict[tuple[MarimoFileKey, str], KernelPool] = {}
+        # Keep references to background replenish tasks until they finish
+        self._kernel_pool_tasks: set[asyncio.Task[None]] = set()
 
         # Auth token and Skew-protection token
         if auth_token is not None:
@@ -814,46 +992,156 @@ class SessionManager:
         query_params: SerializedQueryParams,
         file_key: MarimoFileKey,
     ) -> Session:
-        """Create a new session"""
+        """Create a new session
+
+        In run mode, with a kernel pool configured, the session may be
+        handed out already instantiated (`session.prewarmed`).
+        """
         LOGGER.debug("Creating new session for id %s", session_id)
         LOGGER.debug("File query params: %s", query_params)
 
         if session_id not in self.sessions:
             self.persist_session_id(session_id, query_params.get('notebook_id'))
-            app_file_manager = self.file_router.get_file_manager(
-                query_params=query_params,
-                key=file_key,
-                default_width=self.user_config_manager.get_config()["display"][
-                    "default_width"
-                ],
+            session = self._acquire_pooled_session(
+                session_consumer, query_params, file_key
             )
+            if session is None:
+                session = self._new_session(
+                    session_consumer, query_params, file_key
+                )
+
+            if session.app_file_manager.path:
+                self.recents.touch(session.app_file_manager.path)
 
-            if app_file_manager.path:
-                self.recents.touch(app_file_manager.path)
-
-            session = Session.create(
-                initialization_id=file_key,
-                session_consumer=session_consumer,
-                mode=self.mode,
-                app_metadata=AppMetadata(
-                    query_params=query_params,
-                    filename=app_file_manager.path,
-                    cli_args=self.cli_args,
-                ),
-                app_file_manager=app_file_manager,
-                user_config_manager=self.user_config_manager,
-                virtual_files_supported=True,
-                redirect_console_to_browser=self.redirect_console_to_browser,
-                ttl_seconds=self.ttl_seconds,
-            )
             self.sessions[session_id] = session
 
             # Start file watcher if enabled
-            if self.watch and app_file_manager.path:
+            if self.watch and session.app_file_manager.path:
                 self._start_file_watcher_for_session(session)
 
         return self.sessions[session_id]
 
+    def _new_session(
+        self,
+        session_consumer: Optional[SessionConsumer],
+        query_params: SerializedQueryParams,
+        file_key: MarimoFileKey,
+    ) -> Session:
+        app_file_manager = self.file_router.get_file_manager(
+            query_params=query_params,
+            key=file_key,
+            default_width=self.user_config_manager.get_config()["display"][
+                "default_width"
+            ],
+        )
+        return Session.create(
+            initialization_id=file_key,
+            session_consumer=session_consumer,
+            mode=self.mode,
+            app_metadata=AppMetadata(
+                query_params=query_params,
+                filename=app_file_manager.path,
+                cli_args=self.cli_args,
+            ),
+            app_file_manager=app_file_manager,
+            user_config_manager=self.user_config_manager,
+            virtual_files_supported=True,
+            redirect_console_to_browser=self.redirect_console_to_browser,
+            ttl_seconds=self.ttl_seconds,
+        )
+
+    def _prewarm_session(
+        self, query_params: SerializedQueryParams, file_key: MarimoFileKey
+    ) -> Session:
+        session = self._new_session(None, query_params, file_key)
+        session.instantiate(
+            InstantiateRequest(object_ids=[], values=[], auto_run=True),
+            http_request=None,
+        )
+        session.prewarmed = True
+        return session
+
+    def _get_kernel_pool(
+        self, query_params: SerializedQueryParams, file_key: MarimoFileKey
+    ) -> Optional[KernelPool]:
+        if self.kernel_pool_size <= 0:
+            return None
+
+        # Kernels see the query params, so they are part of the key
+        pool_key = (file_key, json.dumps(query_params, sort_keys=True))
+        pool = self.kernel_pools.get(pool_key)
+        if pool is None:
+            if len(self.kernel_pools) >= _MAX_KERNEL_POOLS:
+                return None
+            pool = KernelPool(
+                create_session=functools.partial(
+                    self._prewarm_session, query_params, file_key
+                ),
+                size=self.kernel_pool_size,
+                ttl_seconds=self.kernel_pool_ttl_seconds,
+            )
+            self.kernel_pools[pool_key] = pool
+        return pool
+
+    def _replenish_in_background(self, pool: KernelPool) -> None:
+        """Refill a pool on a worker thread, off the event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pool.replenish()
+            return
+        task = loop.create_task(asyncio.to_thread(pool.replenish))
+        self._kernel_pool_tasks.add(task)
+        task.add_done_callback(self._kernel_pool_tasks.discard)
+
+    async def start_kernel_pools(self) -> None:
+        """Create and fill the kernel pool of a single-file app.
+
+        Called at server startup, so that the first visitor gets a
+        pre-initialized session. Pools for other query params are created
+        on their first request.
+        """
+        file_key = self.file_router.get_unique_file_key()
+        if file_key is None or file_key == AppFileRouter.NEW_FILE:
+            return
+        pool = self._get_kernel_pool({}, file_key)
+        if pool is not None:
+            await asyncio.to_thread(pool.replenish)
+
+    def _acquire_pooled_session(
+        self,
+        session_consumer: SessionConsumer,
+        query_params: SerializedQueryParams,
+        file_key: MarimoFileKey,
+    ) -> Optional[Session]:
+        pool = self._get_kernel_pool(query_params, file_key)
+        if pool is None:
+            return None
+
+        session = pool.acquire()
+        self._replenish_in_background(pool)
+
+        if session is not None:
+            LOGGER.debug("Using pre-initialized session for %s", file_key)
+            # Pooled sessions are created off the event loop, without a
+            # heartbeat
+            session.start_heartbeat()
+            session.connect_consumer(session_consumer, main=True)
+        return session
+
+    def kernel_pool_stats(self) -> dict[str, Any]:
+        """Aggregate metrics across kernel pools."""
+        pools = list(self.kernel_pools.values())
+        return {
+            "size": self.kernel_pool_size,
+            "ttl_seconds": self.kernel_pool_ttl_seconds,
+            "idle": sum(pool.idle for pool in pools),
+            "hits": sum(pool.hits for pool in pools),
+            "misses": sum(pool.misses for pool in pools),
+            "created": sum(pool.created for pool in pools),
+            "expired": sum(pool.expired for pool in pools),
+        }
+
     def _start_file_watcher_for_session(self, session: Session) -> None:
         """Start a file watcher for a session."""
         if not session.app_file_manager.path:
@@ -1128,6 +1416,9 @@ class SessionManager:
         """Shutdown the session manager and stop all file watchers."""
         LOGGER.debug("Shutting down")
         self.close_all_sessions()
+        for pool in self.kernel_pools.values():
+            pool.close()
+        self.kernel_pools = {}
         self.lsp_server.stop()
         self.watcher_manager.stop_all()
 
@@ -83,6 +83,8 @@ def start(
     allow_origins: Optional[tuple[str, ...]] = None,
     auth_token: Optional[AuthToken],
     redirect_console_to_browser: bool,
+    kernel_pool_size: int = 0,
+    kernel_pool_ttl_seconds: Optional[int] = None,
 ) -> None:
     """
     Start the server.
@@ -131,6 +133,8 @@ def start(
         auth_token=auth_token,
         redirect_console_to_browser=redirect_console_to_browser,
         watch=watch,
+        kernel_pool_size=kernel_pool_size,
+        kernel_pool_ttl_seconds=kernel_pool_ttl_seconds,
     )
 
     log_level = "info" if development_mode else "error"
@@ -143,6 +147,7 @@ def start(
             [
                 lifespans.lsp,
                 lifespans.etc,
+                lifespans.kernel_pools,
                 lifespans.signal_handler,
                 lifespans.logging,
                 lifespans.open_browser,
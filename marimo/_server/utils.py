@@ -67,6 +67,7 @@ def initialize_mimetypes() -> None:
     mimetypes.add_type("application/javascript", ".js")
     mimetypes.add_type("text/css", ".css")
     mimetypes.add_type("image/svg+xml", ".svg")
+    mimetypes.add_type("application/vnd.apache.arrow.stream", ".arrow")
 
 
 def initialize_asyncio() -> None:
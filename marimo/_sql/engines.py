@@ -1,7 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, cast
 
 from marimo import _loggers
 from marimo._data.get_datasets import get_databases_from_duckdb
@@ -28,6 +28,9 @@ if TYPE_CHECKING:
 # Internal engine name for DuckDB, we need to ensure this is unique
 INTERNAL_DUCKDB_ENGINE = cast(VariableName, "__marimo_duckdb")
 
+# Number of rows fetched from a SQLAlchemy result at a time
+SQL_FETCH_BATCH_SIZE = 10_000
+
 
 def raise_df_import_error(pkg: str) -> None:
     raise ModuleNotFoundError(
@@ -56,13 +59,17 @@ class DuckDBEngine(SQLEngine):
     def dialect(self) -> str:
         return "duckdb"
 
-    def execute(self, query: str) -> Any:
+    def execute(self, query: str, limit: Optional[int] = None) -> Any:
         relation = wrapped_sql(query, self._connection)
 
         # Invalid / empty query
         if relation is None:
             return None
 
+        if limit is not None:
+            # Relations are lazy, so the limit is part of the query plan
+            relation = relation.limit(limit)
+
         if DependencyManager.polars.has():
             return relation.pl()
         elif DependencyManager.pandas.has():
@@ -109,7 +116,7 @@ class SQLAlchemyEngine(SQLEngine):
     def dialect(self) -> str:
         return str(self._engine.dialect.name)
 
-    def execute(self, query: str) -> Any:
+    def execute(self, query: str, limit: Optional[int] = None) -> Any:
         # Can't use polars.imported() because this is the first time we
         # might come across polars.
         if not (
@@ -120,25 +127,30 @@ class SQLAlchemyEngine(SQLEngine):
         from sqlalchemy import text
 
         with self._engine.connect() as connection:
+            if limit is not None:
+                # Use a server-side cursor where the driver supports one, so
+                # that rows past the limit are never sent
+                connection = connection.execution_options(stream_results=True)
             result = connection.execute(text(query))
-            rows = result.fetchall() if result.returns_rows else None
+            if not result.returns_rows:
+                df = None
+            elif limit is not None:
+                df = _rows_to_dataframe(
+                    [result.fetchmany(limit)], list(result.keys())
+                )
+                result.close()
+            else:
+                df = _rows_to_dataframe(
+                    result.partitions(SQL_FETCH_BATCH_SIZE),
+                    list(result.keys()),
+                )
 
             try:
                 connection.commit()
             except Exception:
                 LOGGER.info("Unable to commit transaction", exc_info=True)
 
-            if rows is None:
-                return None
-
-            if DependencyManager.polars.has():
-                import polars as pl
-
-                return pl.DataFrame(rows)  # type: ignore
-            else:
-                import pandas as pd
-
-                return pd.DataFrame(rows)
+            return df
 
     @staticmethod
     def is_compatible(var: Any) -> bool:
@@ -400,6 +412,45 @@ class SQLAlchemyEngine(SQLEngine):
             return None
 
 
+def _rows_to_dataframe(
+    batches: Iterable[Sequence[Sequence[Any]]], columns: list[str]
+) -> Any:
+    """Build a dataframe from batches of rows, one batch at a time."""
+    if DependencyManager.polars.has():
+        import polars as pl
+
+        # Polars requires unique column names
+        schema = columns if len(set(columns)) == len(columns) else None
+        frames = [
+            pl.DataFrame(
+                # SQLAlchemy rows are sequences, but not tuples
+                [tuple(row) for row in batch],
+                schema=schema,
+                orient="row",
+                infer_schema_length=None,
+                strict=False,
+            )
+            for batch in batches
+        ]
+        if not frames:
+            return pl.DataFrame(schema=schema)
+        if len(frames) == 1:
+            return frames[0]
+        return pl.concat(frames, how="vertical_relaxed")
+    else:
+        import pandas as pd
+
+        pd_frames = [
+            pd.DataFrame([tuple(row) for row in batch], columns=columns)
+            for batch in batches
+        ]
+        if not pd_frames:
+            return pd.DataFrame(columns=columns)
+        if len(pd_frames) == 1:
+            return pd_frames[0]
+        return pd.concat(pd_frames, ignore_index=True)
+
+
 def _sql_type_to_data_type(type_str: str) -> DataType:
     """Convert SQL type string to DataType"""
     type_str = type_str.lower()
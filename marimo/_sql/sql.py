@@ -22,6 +22,7 @@ def get_default_result_limit() -> Optional[int]:
 if TYPE_CHECKING:
     import duckdb
     import sqlalchemy
+    from sqlglot.expressions import Select
 
 
 @mddoc
@@ -65,18 +66,32 @@ def sql(
             "Unsupported engine. Must be a SQLAlchemy engine or DuckDB connection."
         )
 
-    df = sql_engine.execute(query)
-    if df is None:
-        return None
-
-    has_limit = _query_includes_limit(query)
     try:
         default_result_limit = get_default_result_limit()
     except OSError:
         default_result_limit = None
 
+    statements = (
+        _parse_statements(query) if default_result_limit is not None else []
+    )
+    last_select = _last_select(statements)
+    has_limit = last_select is not None and _select_has_limit(last_select)
     enforce_own_limit = not has_limit and default_result_limit is not None
 
+    # Only a query that is a single SELECT is pushed down: engines may run
+    # it with a server-side cursor (e.g., psycopg2 wraps it in
+    # `DECLARE ... CURSOR FOR`), which can't hold other statements
+    if enforce_own_limit and last_select is not None and len(statements) == 1:
+        # Push the limit down to the engine, fetching one more row to tell
+        # whether the result was truncated
+        df = sql_engine.execute(
+            query, limit=cast(int, default_result_limit) + 1
+        )
+    else:
+        df = sql_engine.execute(query)
+    if df is None:
+        return None
+
     custom_total_count: Optional[Literal["too_many"]] = None
     if enforce_own_limit:
         if DependencyManager.polars.has():
@@ -112,22 +127,43 @@ def sql(
 
 def _query_includes_limit(query: str) -> bool:
     """Check if a SQL query includes a LIMIT clause."""
+    last_select = _parse_last_select(query)
+    return last_select is not None and _select_has_limit(last_select)
+
+
+def _parse_last_select(query: str) -> Optional[Select]:
+    """The last statement of a SQL query, if it is a SELECT."""
+    return _last_select(_parse_statements(query))
+
+
+def _parse_statements(query: str) -> list[Any]:
+    """The statements of a SQL query, or none if it can't be parsed."""
     import sqlglot
-    from sqlglot.expressions import Limit, Select
 
     try:
         expressions = sqlglot.parse(query.strip())
     except Exception:
         # May not be valid SQL
-        return False
+        return []
+    # Empty statements (e.g., `;;`) parse to None
+    return [expr for expr in expressions if expr is not None]
 
-    if not expressions:
-        return False
+
+def _last_select(statements: list[Any]) -> Optional[Select]:
+    from sqlglot.expressions import Select
+
+    if not statements:
+        return None
 
     # Only check the last statement in case of multiple statements
-    last_expr = expressions[-1]
+    last_expr = statements[-1]
     if not isinstance(last_expr, Select):
-        return False
+        return None
+    return last_expr
+
+
+def _select_has_limit(select: Select) -> bool:
+    from sqlglot.expressions import Limit
 
     # Look for any LIMIT clause in the SELECT statement
-    return last_expr.find(Limit) is not None
+    return select.find(Limit) is not None
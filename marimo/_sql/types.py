@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 
 class SQLEngine(ABC):
@@ -21,8 +21,12 @@ class SQLEngine(ABC):
         pass
 
     @abstractmethod
-    def execute(self, query: str) -> Any:
-        """Execute a SQL query and return a dataframe."""
+    def execute(self, query: str, limit: Optional[int] = None) -> Any:
+        """Execute a SQL query and return a dataframe.
+
+        If limit is not None, the query must be a SELECT; at most `limit`
+        rows are fetched from the engine.
+        """
         pass
 
     @staticmethod
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
-from typing import TYPE_CHECKING, Callable, Generic, TypeVar, Union
+from typing import TYPE_CHECKING, Callable, Generic, Optional, TypeVar, Union
 
 from marimo import _loggers
 from marimo._utils.disposable import Disposable
@@ -37,9 +37,16 @@ class ConnectionDistributor(Generic[T]):
     for context.
     """
 
-    def __init__(self, input_connection: TypedConnection[T]) -> None:
+    def __init__(
+        self,
+        input_connection: TypedConnection[T],
+        decode: Optional[Callable[[bytes], T]] = None,
+    ) -> None:
         self.consumers: list[Consumer[T]] = []
         self.input_connection = input_connection
+        # When set, the connection carries encoded bytes instead of pickled
+        # objects, and messages are decoded with this function
+        self.decode = decode
 
     def add_consumer(self, consumer: Consumer[T]) -> Disposable:
         """Add a consumer to the distributor."""
@@ -56,9 +63,10 @@ class ConnectionDistributor(Generic[T]):
         retry_sleep_seconds = 0.001
         while self.input_connection.poll():
             try:
-                # TODO: just recv_bytes (and change stream to send_bytes)
-                # to eliminate pickling overhead/bugs
-                response = self.input_connection.recv()
+                if self.decode is not None:
+                    response = self.decode(self.input_connection.recv_bytes())
+                else:
+                    response = self.input_connection.recv()
             except BlockingIOError as e:
                 # recv() sporadically fails with EAGAIN, EDEADLK ...
                 LOGGER.warning(
@@ -89,7 +97,10 @@ class ConnectionDistributor(Generic[T]):
         """Flush the distributor."""
         while self.input_connection.poll():
             try:
-                self.input_connection.recv()
+                if self.decode is not None:
+                    self.input_connection.recv_bytes()
+                else:
+                    self.input_connection.recv()
             except EOFError:
                 break
 
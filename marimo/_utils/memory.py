@@ -0,0 +1,41 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+def estimate_nbytes(value: Any, deep: bool = True) -> int:
+    """Approximate memory held by a value, counting data buffers.
+
+    With `deep=False`, objects referenced by the value (the elements of
+    containers, the Python objects in pandas object columns) are not
+    counted, so the estimate doesn't visit every element.
+    """
+    visited: set[int] = set()
+
+    def recurse(value: Any) -> int:
+        if id(value) in visited:
+            return 0
+        visited.add(id(value))
+        # polars
+        if hasattr(value, "estimated_size"):
+            return int(value.estimated_size())
+        # pandas
+        if hasattr(value, "memory_usage"):
+            usage = value.memory_usage(index=True, deep=deep)
+            return int(getattr(usage, "sum", lambda: usage)())
+        # numpy, pyarrow, torch, ...
+        if isinstance(getattr(value, "nbytes", None), int):
+            return int(value.nbytes)
+        size = sys.getsizeof(value)
+        if not deep:
+            return size
+        if isinstance(value, dict):
+            size += sum(map(recurse, value.keys()))
+            size += sum(map(recurse, value.values()))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(map(recurse, value))
+        return size
+
+    return recurse(value)
@@ -82,6 +82,25 @@ def dataframe_to_csv(df: IntoFrame) -> str:
     return str(csv_str)
 
 
+def dataframe_to_arrow_ipc(df: IntoFrame) -> bytes:
+    """
+    Convert a dataframe to an Arrow IPC stream.
+
+    Requires pyarrow.
+    """
+    import pyarrow as pa  # type: ignore[import-not-found,unused-ignore]
+
+    assert_can_narwhalify(df)
+    df = nw.from_native(df, strict=True)
+    if isinstance(df, nw.LazyFrame):
+        df = df.collect()
+    table = df.to_arrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue())
+
+
 def is_narwhals_integer_type(
     dtype: Any,
 ) -> TypeGuard[
@@ -133,7 +152,7 @@ def unwrap_narwhals_dataframe(df: Any) -> Any:
     """
     Unwrap a narwhals dataframe.
     """
-    if isinstance(df, nw.DataFrame):
+    if isinstance(df, (nw.DataFrame, nw.LazyFrame)):
         return df.to_native()  # type: ignore[return-value]
     return df
 
@@ -32,6 +32,22 @@ export interface paths {
                         "application/octet-stream": string;
                     };
                 };
+                /** @description Get a byte range of a virtual file */
+                206: {
+                    headers: {
+                        [name: string]: unknown;
+                    };
+                    content: {
+                        "application/octet-stream": string;
+                    };
+                };
+                /** @description The virtual file matches the If-None-Match ETag */
+                304: {
+                    headers: {
+                        [name: string]: unknown;
+                    };
+                    content?: never;
+                };
                 /** @description Invalid byte length in virtual file request */
                 404: {
                     headers: {
@@ -39,6 +55,13 @@ export interface paths {
                     };
                     content?: never;
                 };
+                /** @description The requested byte range is not satisfiable */
+                416: {
+                    headers: {
+                        [name: string]: unknown;
+                    };
+                    content?: never;
+                };
             };
         };
         put?: never;
@@ -901,6 +924,45 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/kernel/console_history": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        post: {
+            parameters: {
+                query?: never;
+                header?: never;
+                path?: never;
+                cookie?: never;
+            };
+            requestBody?: {
+                content: {
+                    "application/json": components["schemas"]["ConsoleHistoryRequest"];
+                };
+            };
+            responses: {
+                /** @description Fetch older console outputs of a cell */
+                200: {
+                    headers: {
+                        [name: string]: unknown;
+                    };
+                    content: {
+                        "application/json": components["schemas"]["ConsoleHistoryResponse"];
+                    };
+                };
+            };
+        };
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/kernel/copy": {
         parameters: {
             query?: never;
@@ -1937,6 +1999,49 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/status/kernel_pools": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get: {
+            parameters: {
+                query?: never;
+                header?: never;
+                path?: never;
+                cookie?: never;
+            };
+            requestBody?: never;
+            responses: {
+                /** @description Get metrics for the pools of pre-initialized kernels */
+                200: {
+                    headers: {
+                        [name: string]: unknown;
+                    };
+                    content: {
+                        "application/json": {
+                            created?: number;
+                            expired?: number;
+                            hits?: number;
+                            idle?: number;
+                            misses?: number;
+                            size?: number;
+                            ttl_seconds?: number | null;
+                        };
+                    };
+                };
+            };
+        };
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/usage": {
         parameters: {
             query?: never;
@@ -1965,6 +2070,7 @@ export interface paths {
                             };
                             kernel?: {
                                 memory?: number;
+                                shared_memory?: number;
                             };
                             memory: {
                                 available: number;
@@ -2142,6 +2248,7 @@ export interface components {
             /** @enum {string} */
             name: "cell-op";
             output?: components["schemas"]["CellOutput"];
+            output_delta?: components["schemas"]["OutputDelta"][] | null;
             run_id?: string | null;
             stale_inputs?: boolean | null;
             status?: components["schemas"]["RuntimeState"];
@@ -2191,6 +2298,15 @@ export interface components {
             }[];
             prefix_length: number;
         };
+        ConsoleHistoryRequest: {
+            cellId: string;
+            limit: number;
+            offset: number;
+        };
+        ConsoleHistoryResponse: {
+            outputs: components["schemas"]["CellOutput"][];
+            total: number;
+        };
         CopyNotebookRequest: {
             destination: string;
             source: string;
@@ -2592,6 +2708,12 @@ export interface components {
         OpenTutorialRequest: {
             tutorialId: ("intro" | "dataflow" | "ui" | "markdown" | "plots" | "sql" | "layout" | "fileformat" | "for-jupyter-users") | "markdown-format";
         };
+        OutputDelta: {
+            data?: string | null;
+            index: number;
+            /** @enum {string} */
+            kind: "append" | "replace" | "truncate";
+        };
         PackageDescription: {
             name: string;
             version: string;
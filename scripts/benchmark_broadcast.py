@@ -0,0 +1,101 @@
+"""Benchmark CPU time per Room broadcast as the number of consumers grows.
+
+Compares encoding a kernel message once per consumer (the previous
+behavior) with sharing a single encoded frame among all consumers.
+
+Usage:
+    python scripts/benchmark_broadcast.py [--payload-kb 512] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from marimo._messaging.types import KernelMessage
+from marimo._plugins.core.json_encoder import WebComponentEncoder
+from marimo._server.session.frame import MessageFrame
+from marimo._server.sessions import Room
+
+
+def make_message(payload_kb: int) -> KernelMessage:
+    data = "<div>" + "x" * (payload_kb * 1024) + "</div>"
+    return (
+        "cell-op",
+        {
+            "cell_id": "Hbol",
+            "output": {
+                "channel": "output",
+                "mimetype": "text/html",
+                "data": data,
+            },
+            "console": None,
+            "status": "idle",
+        },
+    )
+
+
+def per_consumer_listener(sink: list[str]) -> Callable[[Any], None]:
+    def listener(message: KernelMessage) -> None:
+        op, data = message
+        sink.append(
+            json.dumps({"op": op, "data": data}, cls=WebComponentEncoder)
+        )
+
+    return listener
+
+
+def shared_frame_listener(sink: list[str]) -> Callable[[Any], None]:
+    def listener(message: KernelMessage) -> None:
+        assert isinstance(message, MessageFrame)
+        assert message.text is not None
+        sink.append(message.text)
+
+    return listener
+
+
+def bench(n_consumers: int, message: KernelMessage, repeat: int) -> None:
+    sink: list[str] = []
+
+    # Before: every consumer encodes the message it receives
+    start = time.process_time()
+    for _ in range(repeat):
+        listeners = [per_consumer_listener(sink) for _ in range(n_consumers)]
+        for listener in listeners:
+            listener(message)
+    before = (time.process_time() - start) / repeat
+    sink.clear()
+
+    # After: the room shares one frame, encoded by the first consumer
+    room = Room()
+    for _ in range(n_consumers):
+        room.subscribe(shared_frame_listener(sink))
+    start = time.process_time()
+    for _ in range(repeat):
+        room.fan_out(message)
+    after = (time.process_time() - start) / repeat
+    sink.clear()
+
+    print(
+        f"{n_consumers:>10} {before * 1e3:>14.3f} {after * 1e3:>14.3f} "
+        f"{before / after if after else float('inf'):>8.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payload-kb", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    message = make_message(args.payload_kb)
+    print(f"payload: {args.payload_kb} KiB, repeat: {args.repeat}")
+    print(f"{'consumers':>10} {'before (ms)':>14} {'after (ms)':>14} speedup")
+    for n_consumers in (1, 2, 4, 8, 16, 32, 64):
+        bench(n_consumers, message, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark content hashing throughput and peak memory for cached data.
+
+Hashes numpy arrays, pandas and polars dataframes the way `mo.cache` and
+`mo.persistent_cache` do when a cell references them, and reports the
+throughput (GB/s) and the peak memory allocated while hashing.
+
+Libraries that are not installed are skipped.
+
+Usage:
+    python scripts/benchmark_cache_hash.py [--size-mb 256] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._save.hash import common_container_to_bytes, data_to_buffer
+
+
+def make_inputs(size_mb: int) -> dict[str, tuple[Any, Callable[..., Any]]]:
+    inputs: dict[str, tuple[Any, Callable[..., Any]]] = {}
+    n = size_mb * 1024 * 1024 // 8
+    if DependencyManager.numpy.has():
+        import numpy as np
+
+        array = np.arange(n, dtype=np.float64)
+        inputs["numpy"] = (array, data_to_buffer)
+        inputs["numpy (strided)"] = (array[::2], data_to_buffer)
+    if DependencyManager.pandas.has():
+        import pandas as pd
+
+        frame = pd.DataFrame({"a": range(n // 2), "b": range(n // 2)})
+        inputs["pandas"] = (frame, data_to_buffer)
+    if DependencyManager.polars.has():
+        import polars as pl
+
+        frame = pl.DataFrame({"a": range(n // 2), "b": range(n // 2)})
+        inputs["polars"] = (frame, data_to_buffer)
+    if DependencyManager.numpy.has():
+        import numpy as np
+
+        inputs["dict of numpy"] = (
+            {"x": np.ones(n // 2), "y": np.zeros(n // 2)},
+            common_container_to_bytes,
+        )
+    return inputs
+
+
+def nbytes(value: Any) -> int:
+    if isinstance(value, dict):
+        return sum(nbytes(v) for v in value.values())
+    if hasattr(value, "estimated_size"):
+        return int(value.estimated_size())
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=False, deep=True).sum())
+    return int(value.nbytes)
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def bench(value: Any, sign: Callable[..., Any], repeat: int) -> None:
+    size = nbytes(value)
+    sign(value)  # warm up
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sign(value)
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {size / 2**20:9.1f} MB"
+        f"  {size / elapsed / 1e9:7.2f} GB/s"
+        f"  peak alloc {peak / 2**20:9.1f} MB"
+        f"  max rss {max_rss_mb():9.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (value, sign) in make_inputs(args.size_mb).items():
+        print(name)
+        bench(value, sign, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
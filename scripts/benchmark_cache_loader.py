@@ -0,0 +1,96 @@
+"""Benchmark persistent cache hits with PickleLoader and MmapLoader.
+
+Saves a cache holding a large numpy array with each loader, then times
+restoring it, both with the file evicted from the page cache (cold) and
+resident in it (warm). Each load is timed on its own ("load"), and
+followed by a full read of the array ("load + read"), since the mmap
+loader defers reading until the data is accessed.
+
+Evicting the page cache uses posix_fadvise, which is only available on
+some platforms; elsewhere only warm numbers are reported.
+
+Usage:
+    python scripts/benchmark_cache_loader.py [--size-mb 1024] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+
+from marimo._save.cache import Cache
+from marimo._save.loaders import MmapLoader, PickleLoader
+from marimo._save.loaders.loader import BasePersistenceLoader
+
+HASH = "benchmark"
+
+
+def evict(path: str) -> bool:
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def timed(
+    fn: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], object] = lambda: None,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(loader: BasePersistenceLoader, size_mb: int, repeat: int) -> None:
+    data = np.random.default_rng(0).random(size_mb * 1024 * 1024 // 8)
+    start = time.perf_counter()
+    loader.save_cache(
+        Cache({"data": data}, HASH, set(), "ContentAddressed", False, {})
+    )
+    save = time.perf_counter() - start
+    path = str(loader.build_path(HASH, "ContentAddressed"))
+    del data
+
+    def load() -> object:
+        return loader.load_cache(HASH, "ContentAddressed")
+
+    def load_and_read() -> object:
+        return float(load().defs["data"].sum())
+
+    print(f"{type(loader).__name__}  (save {save:.3f}s)")
+    for label, fn in [("load", load), ("load + read", load_and_read)]:
+        if evict(path):
+            cold = timed(fn, repeat, setup=lambda: evict(path))
+            print(f"  cold {label:12} {cold:8.4f}s")
+        fn()
+        print(f"  warm {label:12} {timed(fn, repeat):8.4f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for loader_type in (PickleLoader, MmapLoader):
+            bench(loader_type("benchmark", tmp), args.size_mb, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
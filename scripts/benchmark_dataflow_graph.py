@@ -0,0 +1,82 @@
+"""Benchmark building and editing the dataflow graph of large notebooks.
+
+Generates a notebook in which each cell defines a variable, reads a few
+earlier ones and a module imported by the first cell, then reports the
+time to register every cell (in notebook order, and in reverse order,
+which adds every edge against the registration order) and the latency of
+an edit, i.e. deleting and re-registering a cell in the middle of the
+notebook.
+
+Usage:
+    python scripts/benchmark_dataflow_graph.py [--cells 100 500 1500 3000]
+        [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from marimo._ast import compiler
+from marimo._ast.cell import CellImpl
+from marimo._runtime.dataflow import DirectedGraph
+from marimo._types.ids import CellId_t
+
+
+def make_cells(n: int) -> list[tuple[CellId_t, CellImpl]]:
+    cells = [(CellId_t("0"), compiler.compile_cell("import math\nx0 = 0", "0"))]
+    for i in range(1, n):
+        refs = sorted({f"x{i - 1}", f"x{i // 2}", f"x{i // 3}"})
+        code = f"x{i} = math.floor({' + '.join(refs)})"
+        cell_id = CellId_t(str(i))
+        cells.append((cell_id, compiler.compile_cell(code, cell_id)))
+    return cells
+
+
+def build(cells: list[tuple[CellId_t, CellImpl]]) -> DirectedGraph:
+    graph = DirectedGraph()
+    for cell_id, cell in cells:
+        graph.register_cell(cell_id, cell)
+    return graph
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--cells", type=int, nargs="+", default=[100, 500, 1500, 3000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'cells':>6} {'build':>10} {'reversed':>10} {'edit':>10}")
+    for n in args.cells:
+        cells = make_cells(n)
+        build_time = timed(lambda: build(cells), args.repeat)
+        reversed_time = timed(lambda: build(cells[::-1]), args.repeat)
+
+        graph = build(cells)
+        cell_id, cell = cells[n // 2]
+
+        def edit() -> None:
+            graph.delete_cell(cell_id)
+            graph.register_cell(cell_id, cell)
+
+        edit_time = timed(edit, args.repeat)
+        print(
+            f"{n:>6} {build_time:>9.4f}s {reversed_time:>9.4f}s "
+            f"{edit_time * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
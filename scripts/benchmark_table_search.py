@@ -0,0 +1,103 @@
+"""Benchmark mo.ui.table full-text search with and without the search index.
+
+Builds a frame with string, integer, float and date columns and times a
+few queries against it, first scanning every column on each query (the
+behavior for tables above the index size limit), then with the search
+index, whose one-off build time is reported separately. The index is built
+in the background, so the first query scans every column.
+
+Usage:
+    python scripts/benchmark_table_search.py [--rows 10000000]
+        [--library polars|pandas] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from marimo._plugins.ui._impl.tables.table_manager import TableManager
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
+
+QUERIES = ["alpha", "42", "2024-03", "zzz"]
+WORDS = np.array(["alpha", "beta", "gamma", "delta", "epsilon", "zeta"])
+
+
+def make_data(rows: int, library: str) -> Any:
+    rng = np.random.default_rng(0)
+    data = {
+        "name": WORDS[rng.integers(0, len(WORDS), rows)]
+        + rng.integers(0, 1000, rows).astype(str),
+        "count": rng.integers(0, 100_000, rows),
+        "value": rng.random(rows),
+        "day": np.datetime64(datetime.date(2024, 1, 1))
+        + rng.integers(0, 365, rows).astype("timedelta64[D]"),
+    }
+    if library == "polars":
+        import polars as pl
+
+        return pl.DataFrame(data)
+    import pandas as pd
+
+    return pd.DataFrame(data)
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(
+    manager: TableManager[Any], label: str, repeat: int
+) -> dict[str, float]:
+    results = {}
+    print(label)
+    for query in QUERIES:
+        results[query] = timed(lambda q=query: manager.search(q), repeat)
+        print(f"  {query!r:10} {results[query]:8.4f}s")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument(
+        "--library", choices=["polars", "pandas"], default="polars"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_data(args.rows, args.library)
+    print(f"{args.rows:,} rows ({args.library})")
+
+    # Scan every column on each query
+    scan = get_table_manager(data)
+    scan.DEFAULT_SEARCH_INDEX_MAX_BYTES = -1
+    scan.search(QUERIES[0])
+    scan._search_index.wait()
+    before = bench(scan, "column scan", args.repeat)
+
+    indexed = get_table_manager(data)
+    indexed.DEFAULT_SEARCH_INDEX_MAX_BYTES = 1 << 40
+    start = time.perf_counter()
+    indexed.search(QUERIES[0])
+    print(f"first query {time.perf_counter() - start:.4f}s")
+    indexed._search_index.wait()
+    print(f"index ready {time.perf_counter() - start:.4f}s")
+    after = bench(indexed, "search index", args.repeat)
+
+    print("speedup")
+    for query in QUERIES:
+        print(f"  {query!r:10} {before[query] / after[query]:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
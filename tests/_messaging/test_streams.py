@@ -1,6 +1,9 @@
+import queue
 import sys
 
+from marimo._messaging.streams import ThreadSafeStream
 from marimo._runtime.runtime import Kernel
+from marimo._server.session.frame import MessageFrame
 from tests.conftest import ExecReqProvider, MockedKernel
 
 
@@ -128,3 +131,32 @@ async def test_import_multiprocessing(
         ]
     )
     assert mocked_kernel.stdout.messages == ["hello", "\n"]
+
+
+class TestThreadSafeStream:
+    @staticmethod
+    def test_binary_write_sends_encoded_frame() -> None:
+        sent: list[bytes] = []
+
+        class BytesPipe:
+            def send(self, obj: object) -> None:
+                del obj
+                raise AssertionError("should not pickle")
+
+            def send_bytes(self, buf: bytes) -> None:
+                sent.append(buf)
+
+        stream = ThreadSafeStream(
+            pipe=BytesPipe(),
+            input_queue=queue.Queue(),
+            redirect_console=False,
+            binary=True,
+        )
+        stream.write("alert", {"title": "hi"})
+
+        (buffer,) = sent
+        frame = MessageFrame.from_bytes(buffer)
+        assert frame == ("alert", {"title": "hi"})
+        # The kernel's encoding is forwarded as is
+        assert frame.buffer is buffer
+        assert frame.text == buffer.decode("utf-8")
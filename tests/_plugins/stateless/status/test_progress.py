@@ -41,8 +41,8 @@ def test_progress_init() -> None:
 
 
 # Test update_progress method
-@patch("marimo._runtime.output._output.flush")
-def test_update_progress(mock_flush: Any) -> None:
+@patch("marimo._runtime.output._output.refresh")
+def test_update_progress(mock_refresh: Any) -> None:
     progress = _Progress(
         title="Test",
         subtitle="Running",
@@ -64,13 +64,13 @@ def test_update_progress(mock_flush: Any) -> None:
     eta = progress._get_eta()
     assert eta is not None
     assert eta > 0.0
-    mock_flush.assert_called_once()
+    mock_refresh.assert_called_once()
 
 
 # Test update_progress without arguments
-@patch("marimo._runtime.output._output.flush")
-def test_update_progress_no_args(mock_flush: Any) -> None:
-    del mock_flush
+@patch("marimo._runtime.output._output.refresh")
+def test_update_progress_no_args(mock_refresh: Any) -> None:
+    del mock_refresh
     progress = _Progress(
         title="Test",
         subtitle="Running",
@@ -91,8 +91,8 @@ def test_update_progress_no_args(mock_flush: Any) -> None:
 
 
 # Test update_progress with closed progress
-@patch("marimo._runtime.output._output.flush")
-def test_update_progress_closed(mock_flush: Any) -> None:
+@patch("marimo._runtime.output._output.refresh")
+def test_update_progress_closed(mock_refresh: Any) -> None:
     progress = _Progress(
         title="Test",
         subtitle="Running",
@@ -104,7 +104,7 @@ def test_update_progress_closed(mock_flush: Any) -> None:
     assert progress.closed is True
     with pytest.raises(RuntimeError):
         progress.update_progress()
-    mock_flush.assert_called_once()
+    mock_refresh.assert_called_once()
 
 
 def test_spinner_without_context():
@@ -150,6 +150,9 @@ class TestDefaultTable(unittest.TestCase):
         ]
         assert searched_manager.data == expected_data
 
+        # Values don't run into each other
+        assert self.manager.search("alice30").data == []
+
     def test_apply_formatting(self) -> None:
         format_mapping = {
             "name": lambda x: x.upper(),
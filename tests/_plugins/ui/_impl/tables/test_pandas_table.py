@@ -125,6 +125,24 @@ class TestPandasTableManager(unittest.TestCase):
         ).encode("utf-8")
         assert self.manager.to_csv() == expected_csv
 
+    @pytest.mark.skipif(
+        not DependencyManager.pyarrow.has(),
+        reason="optional dependencies not installed",
+    )
+    def test_to_arrow_ipc(self) -> None:
+        import pyarrow as pa
+
+        data = self.manager.to_arrow_ipc()
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.column_names == ["A", "B", "C", "D", "E", "F"]
+        assert table.schema.field("A").type == pa.int64()
+        assert table.column("B").to_pylist() == ["a", "b", " b"]
+
+        # Row headers are kept
+        indexed = self.factory.create()(self.data.set_index("B"))
+        table = pa.ipc.open_stream(indexed.to_arrow_ipc()).read_all()
+        assert table.column_names == ["A", "C", "D", "E", "F", "B"]
+
     def test_to_csv_datetime(self) -> None:
         D = pd.to_datetime("2024-12-17", errors="coerce")
 
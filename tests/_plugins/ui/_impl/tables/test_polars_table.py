@@ -142,6 +142,14 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
     def test_to_json(self) -> None:
         assert isinstance(self.manager.to_json(), bytes)
 
+    def test_to_arrow_ipc(self) -> None:
+        import io
+
+        import polars as pl
+
+        data = self.manager.to_arrow_ipc()
+        assert_frame_equal(pl.read_ipc_stream(io.BytesIO(data)), self.data)
+
     def test_to_json_complex(self) -> None:
         complex_data = self.get_complex_data()
         # pl.Time and pl.Object are not supported in JSON
@@ -297,6 +305,32 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
         # Too large of page and offset
         assert self.manager.take(10, 10).data.is_empty()
 
+    def test_lazy_frame(self) -> None:
+        import polars as pl
+
+        manager = self.factory.create()(self.data.lazy())
+        assert manager.get_num_rows(force=False) is None
+        assert manager.get_num_rows(force=True) == 3
+        assert manager.get_column_names() == ["A", "B", "C", "D", "E"]
+
+        # Searching, sorting and paging compile into one lazy query
+        page = (
+            manager.search("2021").sort_values("A", descending=True).take(1, 0)
+        )
+        assert isinstance(page.data.to_native(), pl.LazyFrame)
+        assert page.get_num_rows(force=True) == 1
+        assert page.select_rows([0]).get_num_rows(force=True) == 1
+        assert_frame_equal(
+            pl.read_csv(page.to_csv()).select("A", "B"),
+            pl.DataFrame({"A": [3], "B": ["c"]}),
+        )
+
+        paged = manager.take(2, 1)
+        assert isinstance(paged.data.to_native(), pl.LazyFrame)
+        assert paged.to_json() == self.data[1:3].write_json().encode("utf-8")
+        assert sorted(manager.get_unique_column_values("B")) == ["a", "b", "c"]
+        assert manager.get_summary("A").max == 3
+
     def test_summary_integer(self) -> None:
         column = "A"
         summary = self.manager.get_summary(column)
@@ -760,6 +794,44 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
         result = manager.search("^[ab]")
         assert result.get_num_rows() == 2
 
+    def test_search_index(self) -> None:
+        import polars as pl
+
+        df = pl.DataFrame({"A": ["apple", "Banana", None], "B": [1, 22, 3]})
+        manager = self.factory.create()(df)
+        # The first search starts building the index in the background
+        assert manager.search("^b").get_num_rows() == 1
+        search_index = manager._search_index
+        assert search_index is not None
+        assert search_index.wait(timeout=10) is not None
+
+        assert manager.search("^b").get_num_rows() == 1
+        assert manager.search("^2").get_num_rows() == 1
+        assert manager.search("a$").get_num_rows() == 1
+        assert manager.search("3").get_num_rows() == 1
+        # Values don't run into each other
+        assert manager.search("e1").get_num_rows() == 0
+        # Built once, and reused
+        assert manager._search_index is search_index
+
+        # Not built for lazy frames
+        lazy = self.factory.create()(df.lazy())
+        assert lazy._search_index is None
+        assert lazy.search("^b").get_num_rows() == 1
+
+    def test_search_index_max_bytes(self) -> None:
+        import polars as pl
+
+        df = pl.DataFrame({"A": ["apple", "banana"], "B": [1, 22]})
+        manager = self.factory.create()(df)
+        manager.DEFAULT_SEARCH_INDEX_MAX_BYTES = 10
+        assert manager.search("an").get_num_rows() == 1
+        search_index = manager._search_index
+        assert search_index is not None
+        # Too large to index, so searches keep scanning each column
+        assert search_index.wait(timeout=10) is None
+        assert manager.search("22").get_num_rows() == 1
+
     def test_sort_values_with_nulls(self) -> None:
         import polars as pl
 
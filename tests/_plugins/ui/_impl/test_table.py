@@ -474,6 +474,69 @@ def test_can_get_second_page() -> None:
     assert result.data[-1]["a"] == 19
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(),
+    reason="optional dependencies not installed",
+)
+def test_search_arrow_format() -> None:
+    import io
+
+    import polars as pl
+
+    table = ui.table(pl.DataFrame({"a": list(range(40)), "b": ["x"] * 40}))
+    result = table._search(
+        SearchTableArgs(
+            query="2",
+            page_size=5,
+            page_number=1,
+            format="arrow",
+        )
+    )
+    _, data = from_data_uri(result.data)
+    page = pl.read_ipc_stream(io.BytesIO(data))
+    assert page.schema["a"] == pl.Int64
+    assert page.schema["b"] == pl.String
+    assert page["a"].to_list() == [23, 24, 25, 26, 27]
+    assert result.total_rows == 13
+
+    # Tables that can't be encoded as Arrow use the default format
+    table = ui.table({"a": list(range(40))})
+    result = table._search(
+        SearchTableArgs(page_size=5, page_number=0, format="arrow")
+    )
+    assert result.data[0]["a"] == 0
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(),
+    reason="optional dependencies not installed",
+)
+def test_lazy_frame_stays_lazy() -> None:
+    import polars as pl
+
+    lazy = pl.LazyFrame({"a": list(range(40))})
+    table = ui.table(lazy, page_size=5)
+    assert table._component_args["total-rows"] == 40
+
+    result = table._search(
+        SearchTableArgs(
+            query="2",
+            sort=SortArgs("a", descending=True),
+            page_size=5,
+            page_number=1,
+        )
+    )
+    _, data = from_data_uri(result.data)
+    assert pl.read_csv(data)["a"].to_list() == [25, 24, 23, 22, 21]
+    assert result.total_rows == 13
+    assert isinstance(table._searched_manager.data.to_native(), pl.LazyFrame)
+
+    # Selections are lazy too
+    value = table._convert_value(["0"])
+    assert isinstance(value, pl.LazyFrame)
+    assert value.collect()["a"].to_list() == [32]
+
+
 def test_can_get_second_page_with_search() -> None:
     data = {"a": list(range(40))}
     table = ui.table(data)
@@ -569,6 +632,28 @@ def test_table_with_too_many_rows_column_summaries_disabled() -> None:
     assert summaries_enabled.is_disabled is False
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="Polars not installed"
+)
+def test_table_with_too_many_rows_column_summaries_approximate() -> None:
+    import polars as pl
+
+    data = pl.DataFrame(
+        {"a": list(range(20)), "b": ["x", "y"] * 10, "c": [1.5] * 20}
+    )
+    table = ui.table(data, _internal_summary_row_limit=10)
+
+    summaries = table._get_column_summaries(EmptyArgs())
+    assert summaries.is_disabled is False
+    by_column = {summary.column: summary for summary in summaries.summaries}
+    assert by_column["a"].min == 0
+    assert by_column["a"].max == 19
+    # Estimated, which is exact for so few values
+    assert by_column["a"].unique == 20
+    assert by_column["b"].unique == 2
+    assert by_column["c"].unique is None
+
+
 def test_with_too_many_rows_column_charts_disabled() -> None:
     data = {"a": list(range(20))}
     table = ui.table(data, _internal_column_charts_row_limit=10)
@@ -730,6 +815,69 @@ def test_table_with_filtered_columns_polars() -> None:
     assert result.total_rows == 1
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="Polars not installed"
+)
+def test_search_results_cached() -> None:
+    import polars as pl
+
+    table = ui.table(pl.DataFrame({"a": [3, 1, 2], "b": ["x", "y", "z"]}))
+    ascending = SearchTableArgs(
+        sort=SortArgs(by="a", descending=False), page_size=10, page_number=0
+    )
+    descending = SearchTableArgs(
+        sort=SortArgs(by="a", descending=True), page_size=10, page_number=0
+    )
+
+    table._search(ascending)
+    first = table._searched_manager
+    table._search(descending)
+    assert table._search_cache.hits == 0
+
+    # Toggling back reuses the sorted result
+    table._search(ascending)
+    assert table._search_cache.hits == 1
+    assert table._searched_manager is first
+    assert len(table._search_cache) == 2
+
+    # Over budget, only the most recent result is kept
+    table._search_cache.max_bytes = 0
+    table._search(
+        SearchTableArgs(query="y", page_size=10, page_number=0),
+    )
+    assert len(table._search_cache) == 1
+
+    # Unhashable filters are computed without caching
+    result = table._search(
+        SearchTableArgs(
+            filters=[Condition(column_id="a", operator="in", value=[1, 2])],
+            page_size=10,
+            page_number=0,
+        )
+    )
+    assert result.total_rows == 2
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="Pandas not installed"
+)
+def test_search_cache_charges_shallow_size() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame({"a": range(1000), "b": ["x" * 10_000] * 1000})
+    table = ui.table(df)
+    table._search(
+        SearchTableArgs(
+            sort=SortArgs(by="a", descending=True),
+            page_size=10,
+            page_number=0,
+        )
+    )
+    # The sorted result shares its ~10MB of strings with df, so only its
+    # own buffers are charged
+    assert 0 < table._search_cache.total_bytes < 100_000
+
+
 def test_show_column_summaries_default():
     # Test default behavior (True for < 40 columns, False otherwise)
     small_data = {"col" + str(i): range(5) for i in range(39)}
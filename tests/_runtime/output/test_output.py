@@ -1,6 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+from marimo._messaging.cell_output import OutputDelta, apply_output_deltas
 from marimo._runtime import output
 from tests.conftest import ExecReqProvider, MockedKernel
 
@@ -25,8 +26,8 @@ async def test_spinner_removed(
     for i, msg in enumerate(mocked_kernel.stream.messages):
         if (
             msg[0] == "cell-op"
-            and msg[1]["output"] is not None
-            and "marimo-progress" in msg[1]["output"]["data"]
+            and msg[1]["output_delta"] is not None
+            and "marimo-progress" in msg[1]["output_delta"][-1]["data"]
         ):
             # the spinner should be cleared immediately after the context
             # manager exits
@@ -58,14 +59,72 @@ async def test_mutating_appended_outputs(
             )
         ]
     )
-    outputs: list[str] = []
+    deltas: list[list[OutputDelta]] = []
     for msg in mocked_kernel.stream.messages:
-        if msg[0] == "cell-op" and msg[1]["output"] is not None:
-            outputs.append(msg[1]["output"]["data"])
-    assert len(outputs) == 2
-    assert "before" in outputs[0]
-    assert "before" in outputs[1]
-    assert "after" in outputs[1]
+        if msg[0] == "cell-op" and msg[1]["output_delta"] is not None:
+            deltas.append(
+                [OutputDelta(**delta) for delta in msg[1]["output_delta"]]
+            )
+    assert len(deltas) == 2
+    # The second append only sends the new item
+    assert [delta.kind for delta in deltas[1]] == ["append"]
+    items = apply_output_deltas(None, deltas[0])
+    assert len(items) == 1
+    assert "before" in items[0]
+    items = apply_output_deltas(items, deltas[1])
+    assert "before" in items[0]
+    assert "after" in items[1]
+
+
+async def test_append_sends_deltas(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+) -> None:
+    await mocked_kernel.k.run(
+        [
+            exec_req.get(
+                """
+                import marimo as mo
+
+                mo.output.replace("first")
+                for i in range(3):
+                    mo.output.append(i)
+                mo.output.replace_at_index("replaced", 1)
+                """
+            )
+        ]
+    )
+    cell_ops = [
+        msg[1] for msg in mocked_kernel.stream.messages if msg[0] == "cell-op"
+    ]
+    items: list[str] = []
+    for op in cell_ops:
+        if op["output"] is not None:
+            # A full output resets the items
+            items = []
+        if op["output_delta"] is not None:
+            items = apply_output_deltas(
+                items, [OutputDelta(**delta) for delta in op["output_delta"]]
+            )
+    assert len(items) == 4
+    assert "first" in items[0]
+    assert "replaced" in items[1]
+    assert "1" in items[2]
+    assert "2" in items[3]
+    # Each item is sent once, and replacing sends a single item
+    sent = [
+        delta
+        for op in cell_ops
+        if op["output_delta"] is not None
+        for delta in op["output_delta"]
+    ]
+    assert [delta["kind"] for delta in sent] == [
+        "truncate",
+        "append",
+        "append",
+        "append",
+        "append",
+        "replace",
+    ]
 
 
 async def test_nested_output(
@@ -1,5 +1,12 @@
 # Copyright 2024 Marimo. All rights reserved.
+import signal
+import sys
+
+import pytest
+
 from marimo._runtime.capture import capture_stderr
+from marimo._runtime.context import get_context
+from marimo._runtime.handlers import construct_interrupt_handler
 from marimo._runtime.runner.cell_runner import Runner
 from marimo._runtime.runtime import Kernel
 from tests.conftest import ExecReqProvider
@@ -83,3 +90,109 @@ async def test_base_exception_caught(
     with capture_stderr() as buffer:
         await runner.run(er.cell_id)
     assert "line 3" in buffer.getvalue()
+
+
+async def test_parallel_runs_independent_cells_concurrently(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 2
+    # The barrier only releases if both branches are in flight at the same
+    # time; a serial runner would time out.
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import threading
+                barrier = threading.Barrier(2, timeout=5)
+                """
+            ),
+            exec_req.get("barrier.wait(); a = 1"),
+            exec_req.get("barrier.wait(); b = 2"),
+            exec_req.get("c = a + b"),
+        ]
+    )
+    assert not k.errors
+    assert k.globals["c"] == 3
+
+
+async def test_parallel_propagates_exceptions(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 2
+    await k.run(
+        [
+            exec_req.get("x = 1"),
+            exec_req.get("y = x; raise ValueError"),
+            exec_req.get("z = y + 1"),
+            exec_req.get("w = x + 1"),
+        ]
+    )
+    assert "z" not in k.globals
+    assert k.globals["w"] == 2
+    assert (
+        k.graph.cells[
+            next(
+                cid
+                for cid, cell in k.graph.cells.items()
+                if cell.defs == {"z"}
+            )
+        ].run_result_status
+        == "cancelled"
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="SIGINT is not delivered with os.kill"
+)
+async def test_parallel_interrupt(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 2
+    previous = signal.signal(
+        signal.SIGINT,
+        construct_interrupt_handler(get_context()),  # type: ignore[arg-type]
+    )
+    try:
+        # Signals that arrive before the kernel starts waiting on the worker
+        # are ignored, so keep interrupting while the cell is in flight
+        await k.run(
+            [
+                exec_req.get(
+                    """
+                    import os, signal, time
+                    for _ in range(20):
+                        os.kill(os.getpid(), signal.SIGINT)
+                        time.sleep(0.05)
+                    a = 1
+                    """
+                ),
+                exec_req.get("b = a + 1"),
+            ]
+        )
+    finally:
+        signal.signal(signal.SIGINT, previous)
+    # the in-flight cell runs to completion, but its child isn't scheduled
+    assert k.globals["a"] == 1
+    assert "b" not in k.globals
+    assert k.last_interrupt_timestamp is not None
+
+
+async def test_parallel_falls_back_to_serial_in_strict_mode(
+    strict_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = strict_kernel
+    k.max_workers = 4
+    # Strict cells swap the kernel's globals while they run, so they can't
+    # share them with cells on other threads
+    await k.run(
+        [
+            exec_req.get("import time; time.sleep(0.1); x = 1"),
+            exec_req.get("import time as t; t.sleep(0.1); y = 2"),
+            exec_req.get("z = y + 1"),
+            exec_req.get("c = 3"),
+        ]
+    )
+    assert not k.errors
+    assert k.globals["x"] == 1
+    assert k.globals["z"] == 3
+    assert k.globals["c"] == 3
@@ -11,12 +11,16 @@ def _has_output(
     messages: list[Tuple[str, Dict[Any, Any]]], pattern: str
 ) -> bool:
     for op, data in messages:
-        if (
-            op == "cell-op"
-            and data["output"] is not None
-            and re.match(pattern, data["output"]["data"])
+        if op != "cell-op":
+            continue
+        if data["output"] is not None and re.match(
+            pattern, data["output"]["data"]
         ):
             return True
+        # Appended outputs are sent as deltas
+        for delta in data.get("output_delta") or []:
+            if delta["data"] is not None and re.match(pattern, delta["data"]):
+                return True
     return False
 
 
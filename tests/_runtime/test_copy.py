@@ -1,10 +1,13 @@
 import pytest
 
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.copy import (
+    CloneError,
     ReadOnlyError,
     ShallowCopy,
     ZeroCopy,
     _Copy,
+    clone,
     shadow_wrap,
     shallow_copy,
     unwrap_copy,
@@ -135,3 +138,107 @@ def test_cross_shallow_zero() -> None:
     assert isinstance(unwrap_copy(shadow2), list)
     assert not isinstance(unwrap_copy(shadow2), ShallowCopy)
     assert id(unwrap_copy(shadow2)) != id(base)
+
+
+def test_clone_containers() -> None:
+    class namespace: ...
+
+    shared = namespace()
+    shared.attr = [1]
+    base = {"items": [shared, (1, "a")], "again": shared}
+    base["self"] = base
+
+    copied, nbytes = clone(base)
+    assert copied is not base
+    assert copied["self"] is copied
+    assert copied["items"][0] is not shared
+    # Aliasing is preserved, immutable items are shared
+    assert copied["again"] is copied["items"][0]
+    assert copied["items"][1] is base["items"][1]
+    assert nbytes > 0
+
+    copied["items"][0].attr.append(2)
+    assert shared.attr == [1]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(),
+    reason="optional dependencies not installed",
+)
+def test_clone_numpy_read_only_view() -> None:
+    import numpy as np
+
+    base = np.arange(1000)
+    copied, nbytes = clone([base])
+    assert nbytes < base.nbytes
+    assert np.shares_memory(copied[0], base)
+    with pytest.raises(ValueError):
+        copied[0][0] = 1
+    assert base.flags.writeable
+
+    # Arrays of objects are copied
+    objects = np.array([[1], [2]], dtype=object)
+    copied_objects, _ = clone(objects)
+    assert copied_objects[0] is not objects[0]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(),
+    reason="optional dependencies not installed",
+)
+def test_clone_polars_shares_buffers() -> None:
+    import polars as pl
+
+    base = pl.DataFrame({"a": range(1000)})
+    copied, nbytes = clone(base)
+    assert nbytes == 0
+    copied.insert_column(1, pl.Series("b", range(1000)))
+    assert base.columns == ["a"]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(),
+    reason="optional dependencies not installed",
+)
+def test_clone_pandas() -> None:
+    import pandas as pd
+
+    base = pd.DataFrame({"a": range(1000)})
+    if int(pd.__version__.split(".")[0]) < 3:
+        with pd.option_context("mode.copy_on_write", False):
+            copied, nbytes = clone(base)
+        copied.loc[0, "a"] = -1
+        assert base.loc[0, "a"] == 0
+        assert nbytes >= 8000
+
+    with pd.option_context("mode.copy_on_write", True):
+        copied, nbytes = clone(base)
+        copied.loc[0, "a"] = -1
+    assert base.loc[0, "a"] == 0
+    assert nbytes == 0
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(),
+    reason="optional dependencies not installed",
+)
+def test_clone_read_only() -> None:
+    import pandas as pd
+
+    base = pd.DataFrame({"a": range(1000)})
+    if int(pd.__version__.split(".")[0]) < 3:
+        with pd.option_context("mode.copy_on_write", False):
+            copied, nbytes = clone(base, read_only=True)
+        with pytest.raises(ValueError, match="read-only"):
+            copied.loc[0, "a"] = -1
+        assert nbytes == 0
+
+        categorical = pd.DataFrame({"a": pd.Categorical(["x", "y"])})
+        with pd.option_context("mode.copy_on_write", False):
+            with pytest.raises(CloneError):
+                clone(categorical, read_only=True)
+
+    # Values that would be deep copied
+    with pytest.raises(CloneError):
+        clone([object()], read_only=True)
+    assert clone([1, "a"], read_only=True)[0] == [1, "a"]
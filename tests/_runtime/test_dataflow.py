@@ -227,6 +227,125 @@ def test_register_with_stale_ancestor() -> None:
     assert graph.get_stale() == set(["0", "1"])
 
 
+def test_referring_cells_index() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = x"))
+    graph.register_cell("2", parse_cell("z = x + y"))
+
+    assert graph.get_referring_cells("x", language="python") == set(["1", "2"])
+    assert graph.get_referring_cells("x", language="sql") == set()
+
+    graph.delete_cell("2")
+    assert graph.get_referring_cells("x", language="python") == set(["1"])
+    assert graph.get_referring_cells("y", language="python") == set()
+    assert graph.children == {"0": set(["1"]), "1": set()}
+
+
+def test_topological_order_maintained() -> None:
+    # Registered children first: 2 --> 1 --> 0
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("z = y"))
+    graph.register_cell("1", parse_cell("y = x"))
+    graph.register_cell("2", parse_cell("x = 0"))
+
+    index = graph.order.index
+    assert graph.order.valid
+    assert index["2"] < index["1"] < index["0"]
+    assert not graph.cycles
+
+
+def test_cycle_invalidates_topological_order() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = y"))
+    graph.register_cell("1", parse_cell("y = x"))
+    graph.register_cell("2", parse_cell("z = x"))
+
+    assert graph.cycles == set(
+        [(("0", "1"), ("1", "0"))],
+    )
+    assert not graph.order.valid
+
+    # Breaking the cycle restores the order
+    graph.delete_cell("1")
+    assert not graph.cycles
+    assert graph.order.valid
+    graph.register_cell("1", parse_cell("y = 0"))
+    index = graph.order.index
+    assert index["1"] < index["0"] < index["2"]
+    assert not graph.cycles
+
+
+def test_closures_invalidated_on_change() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = x"))
+    assert graph.descendants("0") == set(["1"])
+    assert graph.ancestors("1") == set(["0"])
+
+    graph.register_cell("2", parse_cell("z = y"))
+    assert graph.descendants("0") == set(["1", "2"])
+    assert graph.ancestors("2") == set(["0", "1"])
+
+    graph.delete_cell("1")
+    assert graph.descendants("0") == set()
+    assert graph.ancestors("2") == set()
+
+    # Mutating a returned set leaves the memoized closure intact
+    graph.descendants("0").add("2")
+    assert graph.descendants("0") == set()
+
+
+def test_topological_sort_reregistered_cell_sorts_last() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = 0"))
+    graph.register_cell("2", parse_cell("z = 0"))
+    assert dataflow.topological_sort(graph, ["2", "1", "0"]) == [
+        "0",
+        "1",
+        "2",
+    ]
+
+    # Re-registering a cell breaks ties as if it were registered last
+    graph.delete_cell("0")
+    graph.register_cell("0", parse_cell("x = 0"))
+    assert dataflow.topological_sort(graph, ["2", "1", "0"]) == [
+        "1",
+        "2",
+        "0",
+    ]
+
+
+def test_transitive_references_updated_on_change() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("def f():\n    return g()"))
+    assert graph.get_transitive_references({"f"}) == set(["f"])
+
+    # Defining a name referred to by a function extends its references
+    graph.register_cell("1", parse_cell("def g():\n    return h"))
+    graph.register_cell("2", parse_cell("h = 0"))
+    assert graph.get_transitive_references({"f"}) == set(["f", "g", "h"])
+    assert graph.get_transitive_references({"f"}, inclusive=False) == set(
+        ["g", "h"]
+    )
+
+    graph.delete_cell("1")
+    assert graph.get_transitive_references({"f"}) == set(["f"])
+    graph.register_cell("1", parse_cell("def g():\n    return 1"))
+    assert graph.get_transitive_references({"f"}) == set(["f", "g"])
+
+
+def test_transitive_references_predicate() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("def f():\n    return g()"))
+    graph.register_cell("1", parse_cell("def g():\n    return h"))
+    graph.register_cell("2", parse_cell("h = 0"))
+    assert graph.get_transitive_references(
+        {"f"}, predicate=lambda name, _: name != "g"
+    ) == set(["f", "g"])
+
+
 def test_topological_sort_single_node() -> None:
     graph = dataflow.DirectedGraph()
     code = "x = 0"
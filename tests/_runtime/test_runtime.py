@@ -1564,6 +1564,56 @@ class TestStrictExecution:
         else:
             assert k.globals["V1"] == 11
 
+    @staticmethod
+    async def test_cell_copy_shares_arrays(
+        strict_kernel: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = strict_kernel
+        await k.run(
+            [
+                exec_req.get(
+                    """
+                    import numpy as np
+                    X = np.zeros(100_000)
+                    L = [1, 2]
+                    """
+                ),
+                read := exec_req.get("V = X.sum() + len(L)"),
+                exec_req.get(
+                    """
+                    L.append(3)
+                    X[0] = 1
+                    """
+                ),
+            ]
+        )
+        assert k.globals["V"] == 2
+        assert k.globals["L"] == [1, 2]
+        assert not k.globals["X"].any()
+        # Arrays are read-only views rather than copies
+        assert k.graph.cells[read.cell_id].bytes_copied < 1000
+        assert "read-only" in k.stderr.messages[-1]
+
+    @staticmethod
+    async def test_cell_copy_warns_on_large_copies(
+        strict_kernel: Kernel,
+        exec_req: ExecReqProvider,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from marimo._runtime import executor
+
+        monkeypatch.setattr(executor, "STRICT_COPY_WARNING_BYTES", 10_000)
+        k = strict_kernel
+        await k.run(
+            [
+                exec_req.get("L = list(range(10_000))"),
+                read := exec_req.get("n = len(L)"),
+            ]
+        )
+        assert k.globals["n"] == 10_000
+        assert k.graph.cells[read.cell_id].bytes_copied > 10_000
+        assert "Strict execution copied" in k.stderr.messages[-1]
+
     @staticmethod
     async def test_wont_execute_bad_ref(execution_kernel: Kernel) -> None:
         k = execution_kernel
@@ -1662,6 +1712,133 @@ class TestStrictExecution:
         assert k.globals["x"] == 2
 
 
+class TestProcessExecution:
+    @staticmethod
+    async def test_defs_merged_from_worker(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                exec_req.get("import math"),
+                exec_req.get("x = 8"),
+                exec_req.get("y = math.sqrt(x * 2); print(y)"),
+            ]
+        )
+        assert not k.errors
+        assert k.globals["y"] == 4.0
+
+    @staticmethod
+    async def test_unpicklable_refs_run_in_kernel(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                exec_req.get("f = lambda v: v + 1"),
+                exec_req.get("y = f(1)"),
+            ]
+        )
+        assert not k.errors
+        assert k.globals["y"] == 2
+
+    @staticmethod
+    async def test_exception_in_worker(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                exec_req.get("x = 0"),
+                exec_req.get("y = 1 / x"),
+                exec_req.get("z = y"),
+            ]
+        )
+        assert "y" not in k.globals
+        assert "z" not in k.globals
+
+    @staticmethod
+    async def test_mutating_cell_runs_in_kernel(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                exec_req.get("lst = [1]"),
+                exec_req.get("lst.append(2)"),
+            ]
+        )
+        assert not k.errors
+        assert k.globals["lst"] == [1, 2]
+
+    @staticmethod
+    async def test_refs_not_rebound(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                # runs in the kernel, since it imports a module
+                exec_req.get(
+                    """
+                    import heapq
+                    s = {'a', 'b', 'c'}
+                    t = s
+                    lst = [3, 1, 2]
+                    m = lst
+                    """
+                ),
+                # read-only, though the set may pickle differently in the
+                # worker
+                exec_req.get("n = len(s)"),
+                # not caught statically, since heapify is a module function;
+                # the mutation stays in the worker
+                exec_req.get("heapq.heapify(lst)"),
+            ]
+        )
+        assert not k.errors
+        assert k.globals["n"] == 3
+        assert k.globals["t"] is k.globals["s"]
+        assert k.globals["m"] is k.globals["lst"]
+        assert k.globals["lst"] == [3, 1, 2]
+
+    @staticmethod
+    async def test_unpicklable_defs_fail_without_rerun(
+        k: Kernel, exec_req: ExecReqProvider, tmp_path: pathlib.Path
+    ) -> None:
+        k.execution_type = "process"
+        path = str(tmp_path / "runs.txt")
+        await k.run(
+            [
+                exec_req.get("import threading"),
+                exec_req.get(f"path = {path!r}"),
+                exec_req.get(
+                    """
+                    open(path, "a").write("run")
+                    lock = threading.Lock()
+                    """
+                ),
+            ]
+        )
+        assert "lock" not in k.globals
+        assert "could not be sent back" in k.stderr.messages[-1]
+        assert (tmp_path / "runs.txt").read_text() == "run"
+
+    @staticmethod
+    async def test_stderr_from_worker(
+        k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k.execution_type = "process"
+        await k.run(
+            [
+                exec_req.get("import sys"),
+                exec_req.get("sys.stderr.write('from worker')"),
+            ]
+        )
+        assert not k.errors
+        assert "from worker" in k.stderr.messages
+
+
 class TestImports:
     async def test_import_triggers_execution(
         self, k: Kernel, exec_req: ExecReqProvider
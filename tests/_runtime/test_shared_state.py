@@ -0,0 +1,168 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.requests import AppMetadata
+from marimo._runtime.runtime import Kernel
+from marimo._runtime.shared_state import SharedApp, SharedStateRegistry
+from tests.conftest import ExecReqProvider
+
+
+async def test_ui_independent_cells_are_shared(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    requests = [
+        exec_req.get("import marimo as mo"),
+        exec_req.get("data = [[0]]"),
+        exec_req.get("s = mo.ui.slider(0, 10)"),
+        exec_req.get("n = len(data) + s.value"),
+    ]
+    await k.run(requests)
+    assert not k.errors
+    # mo and data are shared; the slider and its descendant are not
+    assert k.shared_state.size == 2
+    data = k.globals["data"]
+
+    # Re-running the notebook, as another session would, binds copies of
+    # the shared objects instead of recomputing them
+    await k.run(requests)
+    assert not k.errors
+    assert k.globals["data"] == data
+    assert k.globals["data"] is not data
+    assert k.globals["data"][0] is not data[0]
+    assert k.globals["n"] == 1
+    assert k.shared_state.size == 2
+
+
+async def test_sessions_cannot_mutate_shared_objects(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    requests = [
+        exec_req.get("import numpy as np"),
+        exec_req.get("arr = np.zeros(3)"),
+        exec_req.get("items = [1]"),
+    ]
+    await k.run(requests)
+    assert not k.errors
+    # The session that ran the cells binds views as well
+    assert not k.globals["arr"].flags.writeable
+    k.globals["items"].append(2)
+
+    await k.run(requests)
+    assert not k.globals["arr"].flags.writeable
+    assert k.globals["items"] == [1]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+async def test_pandas_frames_shared_read_only(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    import numpy as np
+
+    k.shared_state = SharedApp()
+    requests = [
+        exec_req.get("import pandas as pd"),
+        exec_req.get("df = pd.DataFrame({'a': [1.0, 2.0]})"),
+    ]
+    await k.run(requests)
+    df = k.globals["df"]
+
+    await k.run(requests)
+    assert not k.errors
+    assert k.shared_state.size == 2
+    # Without copy-on-write, sessions share the frame's buffers read-only
+    assert k.globals["df"] is not df
+    assert np.shares_memory(k.globals["df"]["a"].values, df["a"].values)
+    if not k.globals["pd"].options.mode.copy_on_write:
+        with pytest.raises(ValueError, match="read-only"):
+            k.globals["df"].loc[0, "a"] = 0.0
+    assert df["a"].tolist() == [1.0, 2.0]
+
+
+async def test_deep_copied_objects_are_not_shared(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    await k.run(
+        [
+            exec_req.get("import types"),
+            exec_req.get("model = types.SimpleNamespace(weights=[1])"),
+            exec_req.get("n = 1"),
+        ]
+    )
+    assert not k.errors
+    # Each session would hold its own deep copy of `model`, so its cell
+    # runs per session instead
+    assert k.shared_state.size == 2
+
+
+async def test_failed_cells_are_not_shared(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    await k.run([exec_req.get("x = 0"), exec_req.get("y = 1 / x")])
+    assert "y" not in k.globals
+    assert k.shared_state.size == 1
+
+
+async def test_functions_are_not_shared(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    await k.run(
+        [
+            exec_req.get("def f(): return 1"),
+            exec_req.get("g = lambda: 2"),
+            exec_req.get("class A: ..."),
+        ]
+    )
+    assert not k.errors
+    assert k.shared_state.size == 0
+
+
+async def test_changed_code_replaces_shared_cell(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.shared_state = SharedApp()
+    req = exec_req.get("x = 1")
+    await k.run([req])
+    assert k.shared_state.size == 1
+
+    await k.run([exec_req.get_with_id(req.cell_id, "x = 2")])
+    assert k.globals["x"] == 2
+    # The result of the old code is dropped, not kept alongside
+    assert k.shared_state.size == 1
+
+    await k.run([req])
+    assert k.globals["x"] == 1
+    assert k.shared_state.size == 1
+
+
+def test_apps_keyed_by_query_params() -> None:
+    registry = SharedStateRegistry()
+    a = AppMetadata(query_params={}, cli_args={}, filename="app.py")
+    b = AppMetadata(query_params={"q": ["1"]}, cli_args={}, filename="app.py")
+    assert registry.acquire(a) is registry.acquire(a)
+    assert registry.acquire(a) is not registry.acquire(b)
+
+
+def test_apps_dropped_with_last_session() -> None:
+    registry = SharedStateRegistry()
+    metadata = AppMetadata(query_params={}, cli_args={}, filename="app.py")
+    app = registry.acquire(metadata)
+    assert registry.acquire(metadata) is app
+    assert len(registry) == 1
+
+    registry.release(app)
+    assert len(registry) == 1
+    registry.release(app)
+    assert len(registry) == 0
+    # Releasing again is a no-op
+    registry.release(app)
+    assert registry.acquire(metadata) is not app
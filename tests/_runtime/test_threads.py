@@ -95,8 +95,12 @@ async def test_thread_output_append(
             assert "world" not in m[1]["output"]["data"]
     thread_stream = k.globals["thread_stream"]
     assert len(thread_stream.messages) == 2
-    assert "hello" in thread_stream.messages[0][1]["output"]["data"]
-    assert "world" in thread_stream.messages[1][1]["output"]["data"]
+    # Appends are sent as deltas, with only the new item
+    assert "hello" in thread_stream.messages[0][1]["output_delta"][-1]["data"]
+    (delta,) = thread_stream.messages[1][1]["output_delta"]
+    assert delta["kind"] == "append"
+    assert delta["index"] == 1
+    assert "world" in delta["data"]
 
 
 async def test_thread_print(k: Kernel, exec_req: ExecReqProvider) -> None:
@@ -1,9 +1,13 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import hashlib
+from unittest.mock import patch
+
 from marimo._runtime.context import get_context
 from marimo._runtime.requests import DeleteCellRequest
 from marimo._runtime.runtime import Kernel
+from marimo._runtime.virtual_file import VirtualFileRegistry
 from tests.conftest import ExecReqProvider
 
 
@@ -49,7 +53,16 @@ async def test_virtual_file_deletion(
         assert fname.endswith(".pdf")
 
     await k.delete_cell(DeleteCellRequest(cell_id=er.cell_id))
-    assert not get_context().virtual_file_registry.registry
+    # Kept for reuse, but no longer owned
+    registry = get_context().virtual_file_registry
+    assert [item.owners for item in registry.registry.values()] == [0]
+
+    # Evicted once over budget
+    registry.max_bytes = 0
+    registry.evict()
+    assert not registry.registry
+    assert registry.total_bytes == 0
+    assert registry.evictions == 1
 
 
 async def test_cached_virtual_file_not_deleted(
@@ -84,9 +97,11 @@ async def test_cached_virtual_file_not_deleted(
     await k.run([create_vfile_1])
     assert len(get_context().virtual_file_registry.registry) == 1
 
-    # Create a new vfile, make sure we have two now
+    # Create a new vfile with the same contents, make sure it's shared
     await k.run([create_vfile_2 := exec_req.get("create_vfile(2)")])
-    assert len(get_context().virtual_file_registry.registry) == 2
+    registry = get_context().virtual_file_registry
+    assert len(registry.registry) == 1
+    assert [item.owners for item in registry.registry.values()] == [2]
 
     # Remove the cells that create the vfiles
     await k.delete_cell(DeleteCellRequest(cell_id=create_vfile_1.cell_id))
@@ -123,9 +138,11 @@ async def test_cell_deletion_clears_vfiles(
     )
     assert len(get_context().virtual_file_registry.registry) == 1
 
-    # Delete the vfile cache: virtual file registry should be empty
+    # Delete the vfile cache: virtual file registry should have no owned
+    # files
     await k.delete_cell(DeleteCellRequest(cell_id=vfile_cache.cell_id))
-    assert len(get_context().virtual_file_registry.registry) == 0
+    registry = get_context().virtual_file_registry
+    assert all(item.owners <= 0 for item in registry.registry.values())
 
 
 async def test_vfile_refcount_incremented(
@@ -198,12 +215,13 @@ async def test_vfile_refcount_decremented(
     await k.run([exec_req.get("gc.collect()")])
     assert ctx.virtual_file_registry.refcount(vfile) == 0
 
-    # this should dispose the old vfile (because its refcount is 0) and create
-    # a new one
+    # this should dispose the old vfile (because its refcount is 0) and
+    # reuse it for the new one, which has the same contents
+    hits = ctx.virtual_file_registry.hits
     await k.run([make_vfile])
-    # the previous vfile should not be in the registry
-    assert vfile not in ctx.virtual_file_registry.registry
-    assert len(ctx.virtual_file_registry.registry) == 1
+    assert list(ctx.virtual_file_registry.filenames()) == [vfile]
+    assert ctx.virtual_file_registry.registry[vfile].owners == 1
+    assert ctx.virtual_file_registry.hits == hits + 1
 
 
 async def test_cached_vfile_disposal(
@@ -253,10 +271,47 @@ async def test_cached_vfile_disposal(
     await k.run([exec_req.get("import gc; gc.collect()")])
     assert ctx.virtual_file_registry.refcount(vfile) == 0
 
-    # create another vfile. the old one should be deleted
+    # create another vfile with the same contents; the old one is disposed
+    # and reused
     await k.run([append_vfile])
-    assert len(ctx.virtual_file_registry.registry) == 1
-    assert vfile not in ctx.virtual_file_registry.filenames()
+    assert list(ctx.virtual_file_registry.filenames()) == [vfile]
+    assert ctx.virtual_file_registry.registry[vfile].owners == 1
+
+
+async def test_virtual_files_deduplicated(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import io
+                import marimo as mo
+                a = mo.pdf(io.BytesIO(b"hello world"))
+                """
+            ),
+            exec_req.get('b = mo.pdf(io.BytesIO(b"hello world"))'),
+            exec_req.get('c = mo.pdf(io.BytesIO(b"goodbye world"))'),
+        ]
+    )
+    registry = get_context().virtual_file_registry
+    assert len(registry.registry) == 2
+    assert sorted(item.owners for item in registry.registry.values()) == [
+        1,
+        2,
+    ]
+    assert registry.total_bytes == len(b"hello world") + len(b"goodbye world")
+
+
+def test_content_filename_fits_shared_memory_names() -> None:
+    # Largest thread id on Linux (pid_max), and a long extension
+    registry = VirtualFileRegistry(namespace="4194304")
+    filename = registry.content_filename(".parquet", b"x" * 1_000_000)
+    # macOS allows 31 characters, including the leading slash
+    assert len(filename) <= 30
+    assert filename == registry.content_filename("parquet", b"x" * 1_000_000)
+    assert filename != registry.content_filename("parquet", b"y")
 
 
 async def test_virtual_files_not_supported(
@@ -281,3 +336,33 @@ async def test_virtual_files_not_supported(
     ctx = get_context()
     assert len(ctx.virtual_file_registry.registry) == 0
     ctx.virtual_files_supported = True
+
+
+async def test_content_filename_collision(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import io
+                import marimo as mo
+                a = mo.pdf(io.BytesIO(b"hello world"))
+                """
+            ),
+        ]
+    )
+    registry = get_context().virtual_file_registry
+    (filename,) = registry.filenames()
+    assert registry.content_filename("pdf", b"hello world") == filename
+
+    # Other contents with the same digest get another name
+    digest = hashlib.blake2b(b"hello world", digest_size=10).digest()
+    with patch("marimo._runtime.virtual_file.hashlib") as mock_hashlib:
+        mock_hashlib.blake2b.return_value.digest.return_value = digest
+        assert registry.content_filename("pdf", b"hello world") == filename
+        # same size, different bytes
+        other = registry.content_filename("pdf", b"hello there")
+        assert other != filename
+        assert other.endswith(".pdf")
+        assert registry.content_filename("pdf", b"hello") != filename
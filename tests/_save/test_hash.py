@@ -47,7 +47,7 @@ class TestHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "haIqC9yzlTaNo-ClmY11Kvtiv08oQPz3-SlnOLfhJYM"
+            expected_hash = "GOsLFwBkS_zCqu-DfJiRZKGCCB2mSoiqkkssuzQJppw"
 
             return expected_hash, persistent_cache, MockLoader
 
@@ -399,7 +399,7 @@ class TestDataHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "w_Bjhpz2xMVQC6Y61GgqB8O80u_UyoJ-1xQmJU3j0Gg"
+            expected_hash = "YINrPH8KyNkLHTLes3aUASeWtkvejc_AHKVWEqWcUI8"
             return MockLoader, persistent_cache, expected_hash, np
 
         @app.cell
@@ -643,7 +643,7 @@ class TestDataHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "wtrS6NoH2AOH3DnWm7wooK4Bgw8TmMotgMbiY0bu5as"
+            expected_hash = "nK-d6tbZUtr3A6RMsX5adB9xnm8hF9w-H7Eh47R2sT0"
             return MockLoader, persistent_cache, expected_hash, np, pd
 
         @app.cell
@@ -707,7 +707,7 @@ class TestDataHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "RbeMLx994_-kB9rF2ebi6mFMbCW_S6-Q41MsrgJgwUA"
+            expected_hash = "DwS0CuAxCdCOskiFadeifvZzoxUKv39Yvvi764Y9oo4"
             return MockLoader, persistent_cache, expected_hash, np, pd
 
         @app.cell
@@ -748,7 +748,7 @@ class TestDataHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "rC6YiNsuaZKQ1JqMgSRa0iyEDwi7ZTl6InABjuM0RDY"
+            expected_hash = "sobP7fZEGb0KwDZvgospMxWlS6It7QKL3u-fgFILpRE"
             return MockLoader, persistent_cache, expected_hash, pl
 
         @app.cell
@@ -805,7 +805,7 @@ class TestDataHash:
             from marimo._save.save import persistent_cache
             from tests._save.mocks import MockLoader
 
-            expected_hash = "QzGgcNS-eEP58qkkFphgAOJNKEpoTNcXhJ-L2exXzr4"
+            expected_hash = "UY2m5F9ErhSLCZwTRjA-_MnMqvGPxzYe0_XXCm8qlhY"
             return MockLoader, persistent_cache, expected_hash, pl
 
         @app.cell
@@ -826,3 +826,97 @@ class TestDataHash:
             )
             assert _A == 28
             return (two,)
+
+
+class TestSigning:
+    @staticmethod
+    def test_type_sign_length_prefix() -> None:
+        from marimo._save.hash import type_sign
+
+        # Data can't be extended into the length of another value
+        assert type_sign(b"ab", "str") != type_sign(b"a", "str")
+        assert type_sign(b"ab", "str").startswith(
+            (2).to_bytes(8, "little") + b"ab"
+        )
+        assert type_sign(b"ab", "str") != type_sign(b"ab", "bytes")
+
+    @staticmethod
+    def test_stream_sign_matches_digest() -> None:
+        import hashlib
+
+        from marimo._save.hash import length_prefix, stream_sign, type_sign
+
+        data = bytes(range(256)) * 1024
+        expected = hashlib.sha256(
+            length_prefix(len(data)) + data + b":data"
+        ).digest()
+        assert stream_sign(memoryview(data), "data") == type_sign(
+            expected, "data"
+        )
+
+    @staticmethod
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(),
+        reason="optional dependencies not installed",
+    )
+    def test_data_to_buffer_streams_array() -> None:
+        import numpy as np
+
+        from marimo._save.hash import data_to_buffer, stream_sign
+
+        data = np.arange(100, dtype=np.int64).reshape(10, 10)
+        assert data_to_buffer(data) == stream_sign(
+            memoryview(data.tobytes()), "data"
+        )
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(),
+    reason="optional dependencies not installed",
+)
+class TestContentHashMemo:
+    @staticmethod
+    def test_memoizes_read_only_array() -> None:
+        import numpy as np
+
+        from marimo._save.hash import CONTENT_HASH_MEMO, data_to_buffer
+
+        data = np.arange(100)
+        data.flags.writeable = False
+        expected = data_to_buffer(data)
+        assert CONTENT_HASH_MEMO.get(data, "sha256") == expected
+        assert data_to_buffer(data) == expected
+
+    @staticmethod
+    def test_skips_writeable_array() -> None:
+        import numpy as np
+
+        from marimo._save.hash import CONTENT_HASH_MEMO, data_to_buffer
+
+        data = np.arange(100)
+        before = data_to_buffer(data)
+        assert CONTENT_HASH_MEMO.get(data, "sha256") is None
+        data[0] = 1
+        assert data_to_buffer(data) != before
+
+        # A read-only view of writeable memory may still change.
+        view = data.view()
+        view.flags.writeable = False
+        data_to_buffer(view)
+        assert CONTENT_HASH_MEMO.get(view, "sha256") is None
+
+    @staticmethod
+    def test_evicted_on_collection() -> None:
+        import gc
+
+        import numpy as np
+
+        from marimo._save.hash import CONTENT_HASH_MEMO, data_to_buffer
+
+        data = np.arange(100)
+        data.flags.writeable = False
+        data_to_buffer(data)
+        size = len(CONTENT_HASH_MEMO)
+        del data
+        gc.collect()
+        assert len(CONTENT_HASH_MEMO) == size - 1
@@ -0,0 +1,200 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._save.cache import Cache
+from marimo._save.loaders import MemoryLoader, MmapLoader, PickleLoader
+from marimo._save.loaders.budget import DiskBudget
+from marimo._save.loaders.loader import MAX_PENDING_MISSES, LoaderError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _cache(defs: dict[str, object]) -> Cache:
+    return Cache(defs, "abc", set(), "ContentAddressed", False, {})
+
+
+class TestMmapLoader:
+    @staticmethod
+    def test_round_trip(tmp_path: Path) -> None:
+        loader = MmapLoader("test", str(tmp_path))
+        loader.save_cache(_cache({"x": [1, 2, 3], "y": "hello"}))
+
+        assert loader.cache_hit("abc", "ContentAddressed")
+        cache = loader.load_cache("abc", "ContentAddressed")
+        assert cache.defs == {"x": [1, 2, 3], "y": "hello"}
+
+    @staticmethod
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(),
+        reason="optional dependencies not installed",
+    )
+    def test_arrays_are_mapped(tmp_path: Path) -> None:
+        import numpy as np
+
+        loader = MmapLoader("test", str(tmp_path))
+        data = np.arange(1000, dtype=np.float64)
+        fortran = np.asfortranarray(np.arange(12.0).reshape(3, 4))
+        loader.save_cache(_cache({"data": data, "fortran": fortran}))
+
+        cache = loader.load_cache("abc", "ContentAddressed")
+        restored = cache.defs["data"]
+        np.testing.assert_array_equal(restored, data)
+        np.testing.assert_array_equal(cache.defs["fortran"], fortran)
+        # Backed by the mapped file, not a copy
+        base = restored
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base, memoryview)
+
+        # Copy on write: changes are not persisted
+        restored[0] = -1
+        cache = loader.load_cache("abc", "ContentAddressed")
+        assert cache.defs["data"][0] == 0
+
+    @staticmethod
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(),
+        reason="optional dependencies not installed",
+    )
+    def test_save_does_not_modify_mapped_file(tmp_path: Path) -> None:
+        import numpy as np
+
+        loader = MmapLoader("test", str(tmp_path))
+        data = np.arange(100_000, dtype=np.float64)
+        loader.save_cache(_cache({"data": data}))
+        restored = loader.load_cache("abc", "ContentAddressed").defs["data"]
+
+        # Overwriting the entry with a smaller one replaces the file instead
+        # of truncating the mapped one.
+        loader.save_cache(_cache({"data": np.zeros(1)}))
+        np.testing.assert_array_equal(restored, data)
+        cache = loader.load_cache("abc", "ContentAddressed")
+        np.testing.assert_array_equal(cache.defs["data"], np.zeros(1))
+        assert [p.name for p in loader.save_path.iterdir()] == [
+            loader.build_path("abc", "ContentAddressed").name
+        ]
+
+    @staticmethod
+    def test_invalid_file(tmp_path: Path) -> None:
+        loader = MmapLoader("test", str(tmp_path))
+        loader.build_path("abc", "ContentAddressed").write_bytes(b"garbage")
+        with pytest.raises(LoaderError):
+            loader.load_cache("abc", "ContentAddressed")
+
+
+class TestDiskBudget:
+    @staticmethod
+    def test_evicts_least_recently_used(tmp_path: Path) -> None:
+        loader = PickleLoader("test", str(tmp_path), max_bytes=1)
+        first = Cache({"x": "a" * 100}, "first", set(), "Pure", False, {})
+        second = Cache({"x": "b" * 100}, "second", set(), "Pure", False, {})
+        loader.save_cache(first)
+        assert loader.cache_hit("first", "Pure")
+        loader.save_cache(second)
+
+        # The new entry is kept even though it exceeds the budget
+        assert not loader.cache_hit("first", "Pure")
+        assert loader.cache_hit("second", "Pure")
+        assert loader.evictions == 1
+        assert (tmp_path / "index.json").exists()
+
+    @staticmethod
+    def test_shared_across_caches(tmp_path: Path) -> None:
+        one = PickleLoader("one", str(tmp_path), max_bytes=1)
+        two = PickleLoader("two", str(tmp_path), max_bytes=1)
+        one.save_cache(_cache({"x": 1}))
+        two.save_cache(_cache({"x": 2}))
+        assert not one.cache_hit("abc", "ContentAddressed")
+        assert two.cache_hit("abc", "ContentAddressed")
+
+    @staticmethod
+    def test_unbounded_by_default(tmp_path: Path) -> None:
+        loader = PickleLoader("test", str(tmp_path))
+        for i in range(3):
+            loader.save_cache(Cache({}, str(i), set(), "Pure", False, {}))
+        assert all(loader.cache_hit(str(i), "Pure") for i in range(3))
+        assert loader.evictions == 0
+        assert not (tmp_path / "index.json").exists()
+
+    @staticmethod
+    def test_value_policy(tmp_path: Path) -> None:
+        budget = DiskBudget(tmp_path, max_bytes=250, policy="value")
+        (tmp_path / "test").mkdir()
+
+        def save(key: str, compute_time: float) -> int:
+            (tmp_path / "test" / key).write_bytes(bytes(100))
+            return budget.record_save(tmp_path / "test" / key, compute_time)
+
+        assert save("costly", 10) == 0
+        assert save("cheap", 0.1) == 0
+        # The cheap entry goes first, although it was used more recently
+        assert save("new", 1) == 1
+        assert not (tmp_path / "test" / "cheap").exists()
+        assert (tmp_path / "test" / "costly").exists()
+        assert (tmp_path / "test" / "new").exists()
+
+    @staticmethod
+    def test_hits_do_not_scan_or_write(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        loader = PickleLoader("test", str(tmp_path), max_bytes=1 << 20)
+        loader.save_cache(_cache({"x": 1}))
+        index = (tmp_path / "index.json").read_text()
+
+        scans = []
+        monkeypatch.setattr(
+            DiskBudget,
+            "_scan",
+            lambda self: scans.append(self) or {},  # type: ignore
+        )
+        for _ in range(3):
+            loader.load_cache("abc", "ContentAddressed")
+        assert scans == []
+        # Access times are flushed later, not on every hit
+        assert (tmp_path / "index.json").read_text() == index
+        assert loader.budget is not None
+        loader.budget.flush()
+        assert (tmp_path / "index.json").read_text() != index
+
+
+class TestMemoryLoaderBudget:
+    @staticmethod
+    def test_max_bytes() -> None:
+        loader = MemoryLoader("test", max_size=-1, max_bytes=3000)
+        for i in range(4):
+            loader.save_cache(
+                Cache({"x": "a" * 1000}, str(i), set(), "Pure", False, {})
+            )
+        assert loader.evictions == 2
+        assert not loader.cache_hit("0", "Pure")
+        assert loader.cache_hit("3", "Pure")
+        assert 2000 < loader.total_bytes <= 3000
+
+        loader.max_bytes = -1
+        assert loader.total_bytes == 0
+
+    @staticmethod
+    def test_counters() -> None:
+        loader = MemoryLoader("test", max_size=1)
+        attempt = loader.cache_attempt({"x"}, "a", set(), "Pure")
+        assert not attempt.hit
+        attempt.defs["x"] = 1
+        loader.save_cache(attempt)
+        assert loader.cache_attempt({"x"}, "a", set(), "Pure").hit
+        loader.save_cache(Cache({"x": 2}, "b", set(), "Pure", False, {}))
+        assert (loader.hits, loader.misses, loader.evictions) == (1, 1, 1)
+
+    @staticmethod
+    def test_pending_misses_bounded() -> None:
+        loader = MemoryLoader("test", max_size=1)
+        for i in range(MAX_PENDING_MISSES + 10):
+            loader.cache_attempt({"x"}, str(i), set(), "Pure")
+        assert len(loader._miss_times) == MAX_PENDING_MISSES
+        assert loader.compute_time("0") == 0.0
+        assert loader.compute_time(str(MAX_PENDING_MISSES)) > 0.0
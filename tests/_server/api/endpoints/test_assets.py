@@ -6,7 +6,9 @@ import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock
 
+from marimo._runtime.virtual_file import VirtualFile, VirtualFileRegistry
 from marimo._server.api.deps import AppState
 from marimo._server.api.endpoints.assets import _inject_service_worker
 from marimo._server.api.utils import parse_title
@@ -118,6 +120,59 @@ def test_vfile(client: TestClient) -> None:
     assert response.json() == {"detail": "Invalid virtual file request"}
 
 
+def test_vfile_streaming(client: TestClient) -> None:
+    registry = VirtualFileRegistry()
+    contents = b"".join(b"line %d\n" % i for i in range(1000))
+    virtual_file = VirtualFile("test-vfile.txt", contents)
+    registry.add(virtual_file, MagicMock(virtual_files_supported=True))
+    url = virtual_file.url.removeprefix(".")
+    # The test client accepts compressed responses by default
+    headers = {**token_header(), "Accept-Encoding": "identity"}
+    try:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.content == contents
+        assert response.headers["accept-ranges"] == "bytes"
+        etag = response.headers["etag"]
+
+        # Unchanged
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        # Range
+        response = client.get(url, headers={**headers, "Range": "bytes=10-19"})
+        assert response.status_code == 206, response.text
+        assert response.content == contents[10:20]
+        assert response.headers["content-range"] == (
+            f"bytes 10-19/{len(contents)}"
+        )
+        response = client.get(url, headers={**headers, "Range": "bytes=-5"})
+        assert response.content == contents[-5:]
+        response = client.get(
+            url,
+            headers={**headers, "Range": f"bytes={len(contents)}-"},
+        )
+        assert response.status_code == 416
+        # Malformed ranges are ignored
+        for malformed in ["bytes=abc-5", "bytes=5-abc", "bytes=0-1,5-6"]:
+            response = client.get(url, headers={**headers, "Range": malformed})
+            assert response.status_code == 200, malformed
+            assert response.content == contents
+
+        # Compression
+        response = client.get(
+            url,
+            headers={**headers, "Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 200, response.text
+        assert response.headers["content-encoding"] == "gzip"
+        # Decoded by the client
+        assert response.content == contents
+        assert response.headers["etag"] != etag
+    finally:
+        registry.shutdown()
+
+
 def test_public_file_serving(client: TestClient) -> None:
     # Setup app state with a mock notebook
     app_state = AppState.from_app(cast(Any, client.app))
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from marimo._messaging.cell_output import CellOutput
 from tests._server.mocks import token_header, with_session
 
 if TYPE_CHECKING:
@@ -107,3 +108,30 @@ def test_stdin(client: TestClient) -> None:
     assert response.status_code == 200, response.text
     assert response.headers["content-type"] == "application/json"
     assert "success" in response.json()
+
+
+@with_session(SESSION_ID)
+def test_console_history(client: TestClient) -> None:
+    from marimo._messaging.ops import CellOp
+    from marimo._server.session.console_buffer import ConsoleBuffer
+    from marimo._types.ids import CellId_t
+    from tests._server.conftest import get_session_manager
+
+    session = get_session_manager(client).get_session(SESSION_ID)
+    assert session
+    cell_id = CellId_t("cell-1")
+    session.session_view._consoles[cell_id] = ConsoleBuffer(max_lines=1)
+    for i in range(3):
+        session.session_view.add_operation(
+            CellOp(cell_id=cell_id, console=CellOutput.stdout(f"{i}\n"))
+        )
+
+    response = client.post(
+        "/api/kernel/console_history",
+        headers=HEADERS,
+        json={"cell_id": cell_id, "offset": 1, "limit": 10},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["total"] == 2
+    assert [output["data"] for output in body["outputs"]] == ["1\n"]
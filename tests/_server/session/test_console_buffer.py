@@ -0,0 +1,88 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._server.session.console_buffer import (
+    ConsoleBuffer,
+    ConsoleSpill,
+)
+
+
+def _data(outputs: list[CellOutput]) -> list[str]:
+    return [str(output.data) for output in outputs]
+
+
+def test_max_lines() -> None:
+    console = ConsoleBuffer(max_lines=3)
+    console.extend([CellOutput.stdout(f"{i}\n") for i in range(5)])
+    assert _data(console.outputs) == ["2\n", "3\n", "4\n"]
+    assert console.spilled == 2
+
+    # A single output counts all of its lines
+    console.extend([CellOutput.stdout("a\nb\n")])
+    assert _data(console.outputs) == ["4\n", "a\nb\n"]
+    assert console.spilled == 4
+
+
+def test_max_bytes() -> None:
+    console = ConsoleBuffer(max_bytes=10)
+    console.extend([CellOutput.stdout("12345"), CellOutput.stdout("6789")])
+    assert console.spilled == 0
+    console.extend([CellOutput.stderr("abc")])
+    assert _data(console.outputs) == ["6789", "abc"]
+
+    # The most recent output is kept, even if it exceeds the limit
+    console.extend([CellOutput.stdout("x" * 100)])
+    assert _data(console.outputs) == ["x" * 100]
+
+
+def test_read_spilled() -> None:
+    console = ConsoleBuffer(max_lines=1)
+    console.extend([CellOutput.stdout(f"{i}\n") for i in range(5)])
+    console.extend([CellOutput.stderr("err\n")])
+    assert console.spilled == 5
+
+    assert _data(console.read_spilled(0, 2)) == ["0\n", "1\n"]
+    assert _data(console.read_spilled(3, 10)) == ["3\n", "4\n"]
+    assert console.read_spilled(5, 10) == []
+    assert console.read_spilled(-1, 10) == []
+
+    restored = console.read_spilled(4, 1)[0]
+    assert restored.channel == CellChannel.STDOUT
+    assert restored.mimetype == "text/plain"
+
+
+def test_clear() -> None:
+    console = ConsoleBuffer(max_lines=1)
+    console.extend([CellOutput.stdout(f"{i}\n") for i in range(3)])
+    console.clear()
+    assert len(console) == 0
+    assert console.spilled == 0
+    assert console.read_spilled(0, 10) == []
+
+    console.extend([CellOutput.stdout("new\n")])
+    assert _data(console.outputs) == ["new\n"]
+
+
+def test_shared_spill_file() -> None:
+    spill = ConsoleSpill()
+    one = ConsoleBuffer(max_lines=1, spill=spill)
+    two = ConsoleBuffer(max_lines=1, spill=spill)
+    for i in range(3):
+        one.extend([CellOutput.stdout(f"one {i}\n")])
+        two.extend([CellOutput.stdout(f"two {i}\n")])
+    assert _data(one.read_spilled(0, 10)) == ["one 0\n", "one 1\n"]
+    assert _data(two.read_spilled(0, 10)) == ["two 0\n", "two 1\n"]
+
+    # Clearing one console keeps the outputs of the other
+    one.clear()
+    assert one.read_spilled(0, 10) == []
+    assert _data(two.read_spilled(1, 10)) == ["two 1\n"]
+
+    # The file is emptied once no console refers to it
+    two.clear()
+    assert spill._file is not None
+    assert spill._file.seek(0, 2) == 0
+
+    spill.close()
+    assert spill._file is None
@@ -16,6 +16,8 @@ from marimo._server.session.serialize import (
     _hash_code,
     deserialize_session,
     get_session_cache_file,
+    get_session_log_file,
+    read_session_cache,
     serialize_session_view,
 )
 from marimo._server.session.session_view import SessionView
@@ -267,6 +269,75 @@ async def test_session_cache_writer_no_writes():
         await writer.stop()
 
 
+async def test_session_cache_writer_appends_changes():
+    """Test AsyncWriter appends changed cells, and compacts on stop"""
+    view = SessionView()
+    view.add_operation(
+        CellOp(cell_id="cell1", output=CellOutput.stdout("one"), timestamp=0)
+    )
+    view.add_operation(
+        CellOp(cell_id="cell2", output=CellOutput.stdout("two"), timestamp=0)
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "session.json"
+        log_path = get_session_log_file(path)
+        writer = SessionCacheWriter(view, path, interval=0.05)
+        writer.start()
+        await asyncio.sleep(0.1)
+        assert path.exists()
+        assert not log_path.exists()
+        written = path.read_text()
+
+        # Only the changed cell is written, to the log
+        view.add_operation(
+            CellOp(
+                cell_id="cell2", output=CellOutput.stdout("three"), timestamp=0
+            )
+        )
+        await asyncio.sleep(0.1)
+        assert path.read_text() == written
+        logged = [
+            json.loads(line) for line in log_path.read_text().splitlines()
+        ]
+        assert [cell["id"] for cell in logged] == ["cell2"]
+
+        session = read_session_cache(path)
+        assert [cell["id"] for cell in session["cells"]] == ["cell1", "cell2"]
+        assert session["cells"][1]["outputs"][0]["data"] == {
+            "text/plain": "three"
+        }
+
+        # Stopping compacts the log into the file
+        await writer.stop()
+        assert not log_path.exists()
+        assert read_session_cache(path) == session
+
+
+def test_read_session_cache_truncated_log():
+    """Test reading a session cache whose last log write was interrupted"""
+    view = SessionView()
+    view.cell_operations["cell1"] = CellOp(
+        cell_id="cell1",
+        status="idle",
+        output=CellOutput.stdout("one"),
+        console=[],
+        timestamp=0,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "session.json"
+        path.write_text(json.dumps(serialize_session_view(view)))
+        cell = serialize_session_view(view)["cells"][0]
+        cell["code_hash"] = "abc"
+        get_session_log_file(path).write_text(
+            json.dumps(cell) + "\n" + json.dumps(cell)[:10]
+        )
+
+        session = read_session_cache(path)
+        assert len(session["cells"]) == 1
+        assert session["cells"][0]["code_hash"] == "abc"
+
+
 def test_get_session_cache_file():
     is_windows = sys.platform == "win32"
     # Linux path
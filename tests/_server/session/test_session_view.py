@@ -6,7 +6,11 @@ from unittest.mock import patch
 
 from marimo._ast.cell import RuntimeStateType
 from marimo._data.models import DataTable, DataTableColumn
-from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.cell_output import (
+    CellChannel,
+    CellOutput,
+    OutputDelta,
+)
 from marimo._messaging.ops import (
     CellOp,
     Datasets,
@@ -20,6 +24,7 @@ from marimo._messaging.ops import (
     VariableValues,
     serialize,
 )
+from marimo._output.hypertext import Html
 from marimo._runtime.requests import (
     CreationRequest,
     ExecuteMultipleRequest,
@@ -883,3 +888,64 @@ def test_dataset_filter_by_engine_and_variable() -> None:
     session_view.add_operation(Variables(variables=[]))
     table_names = [t.name for t in session_view.datasets.tables]
     assert table_names == ["table_none"]
+
+
+def test_output_deltas() -> None:
+    from marimo._plugins.stateless.flex import vstack
+
+    session_view = SessionView()
+    session_view.add_raw_operation(
+        serialize(CellOp(cell_id=cell_id, output=initial_output))
+    )
+    session_view.add_raw_operation(
+        serialize(
+            CellOp(
+                cell_id=cell_id,
+                output_delta=[
+                    OutputDelta(kind="truncate", index=0),
+                    OutputDelta(kind="append", index=0, data="<b>a</b>"),
+                    OutputDelta(kind="append", index=1, data="b"),
+                ],
+            )
+        )
+    )
+    session_view.add_operation(
+        CellOp(
+            cell_id=cell_id,
+            output_delta=[OutputDelta(kind="replace", index=1, data="c")],
+        )
+    )
+
+    output = session_view.get_cell_outputs([cell_id])[cell_id]
+    assert output.mimetype == "text/html"
+    assert output.data == vstack([Html("<b>a</b>"), Html("c")]).text
+    cell_op = session_view.cell_operations[cell_id]
+    assert cell_op.output_delta is None
+
+    # A full output replaces the items
+    session_view.add_operation(CellOp(cell_id=cell_id, output=updated_output))
+    assert session_view.get_cell_outputs([cell_id])[cell_id] == updated_output
+
+
+def test_console_is_bounded() -> None:
+    from marimo._server.session.console_buffer import ConsoleBuffer
+
+    session_view = SessionView()
+    session_view._consoles[cell_id] = ConsoleBuffer(max_lines=2)
+    session_view.add_operation(CellOp(cell_id=cell_id, status="running"))
+    for i in range(5):
+        session_view.add_operation(
+            CellOp(cell_id=cell_id, console=CellOutput.stdout(f"{i}\n"))
+        )
+
+    console = session_view.get_cell_console_outputs([cell_id])[cell_id]
+    assert [output.data for output in console] == ["3\n", "4\n"]
+    outputs, total = session_view.get_spilled_console_outputs(cell_id, 0, 2)
+    assert [output.data for output in outputs] == ["0\n", "1\n"]
+    assert total == 3
+
+    # Queued -> running clears the console and its history
+    session_view.add_operation(CellOp(cell_id=cell_id, status="queued"))
+    session_view.add_operation(CellOp(cell_id=cell_id, status="running"))
+    assert session_view.get_cell_console_outputs([cell_id]) == {}
+    assert session_view.get_spilled_console_outputs(cell_id, 0, 2) == ([], 0)
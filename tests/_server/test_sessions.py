@@ -7,12 +7,13 @@ import inspect
 import os
 import queue
 import sys
+import threading
 import time
 from multiprocessing.queues import Queue as MPQueue
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, Callable, TypeVar
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -29,10 +30,13 @@ from marimo._runtime.requests import (
 from marimo._server.file_manager import AppFileManager
 from marimo._server.file_router import AppFileRouter
 from marimo._server.model import ConnectionState, SessionMode
+from marimo._server.session.frame import MessageFrame
 from marimo._server.session.session_view import SessionView
 from marimo._server.sessions import (
     KernelManager,
+    KernelPool,
     QueueManager,
+    Room,
     Session,
     SessionManager,
 )
@@ -1010,3 +1014,188 @@ def __():
     session3.close()
     if kernel_manager.kernel_task:
         kernel_manager.kernel_task.join()
+
+
+def test_kernel_pool_acquire_and_replenish() -> None:
+    created: list[MagicMock] = []
+
+    def create_session() -> MagicMock:
+        session = MagicMock()
+        session.connection_state.return_value = ConnectionState.ORPHANED
+        session.kernel_manager.is_alive.return_value = True
+        created.append(session)
+        return session
+
+    pool = KernelPool(create_session, size=2, ttl_seconds=None)
+    # Empty pool is a miss
+    assert pool.acquire() is None
+    assert pool.misses == 1
+
+    pool.replenish()
+    assert pool.idle == 2
+    assert pool.created == 2
+
+    assert pool.acquire() is created[0]
+    assert pool.hits == 1
+    assert pool.idle == 1
+
+    # Dead kernels are never handed out
+    created[1].kernel_manager.is_alive.return_value = False
+    assert pool.acquire() is None
+    created[1].close.assert_called_once()
+
+    pool.replenish()
+    assert pool.idle == 2
+    pool.close()
+    assert pool.idle == 0
+
+
+def test_kernel_pool_ttl() -> None:
+    def create_session() -> MagicMock:
+        session = MagicMock()
+        session.connection_state.return_value = ConnectionState.ORPHANED
+        session.kernel_manager.is_alive.return_value = True
+        return session
+
+    pool = KernelPool(create_session, size=1, ttl_seconds=0)
+    pool.replenish()
+    time.sleep(0.01)
+    assert pool.acquire() is None
+    assert pool.expired == 1
+
+
+def test_room_fan_out_shares_one_frame() -> None:
+    room = Room()
+    received: list[Any] = []
+    disposables = [room.subscribe(received.append) for _ in range(3)]
+
+    room.fan_out(("cell-op", {"cell_id": "1"}))
+    assert len(received) == 3
+    frame = received[0]
+    assert isinstance(frame, MessageFrame)
+    assert all(message is frame for message in received)
+    # Frames are still (op, data) pairs
+    assert frame == ("cell-op", {"cell_id": "1"})
+    assert frame.text is frame.text
+
+    disposables[0].dispose()
+    received.clear()
+    room.fan_out(("cell-op", {"cell_id": "2"}))
+    assert len(received) == 2
+
+
+def test_room_fan_out_reuses_encoded_frames() -> None:
+    room = Room()
+    received: list[Any] = []
+    room.subscribe(received.append)
+    room.subscribe(received.append)
+
+    buffer = b'{"op": "cell-op", "data": {"cell_id": "1"}}'
+    frame = MessageFrame.from_bytes(buffer)
+    with patch(
+        "marimo._server.session.frame.encode_message"
+    ) as encode_message:
+        room.fan_out(frame)
+        assert all(message is frame for message in received)
+        assert received[0].buffer is buffer
+        assert received[1].text == buffer.decode("utf-8")
+    encode_message.assert_not_called()
+
+
+def test_room_broadcast_serializes_once() -> None:
+    room = Room()
+    consumers: list[Any] = []
+    for i in range(3):
+        consumer = MagicMock()
+        consumer.consumer_id = f"consumer-{i}"
+        consumer.connection_state.return_value = ConnectionState.OPEN
+        room.add_consumer(
+            consumer, MagicMock(), consumer.consumer_id, main=i == 0
+        )
+        consumers.append(consumer)
+
+    operation = UpdateCellCodes(
+        cell_ids=["1"], codes=["x = 1"], code_is_stale=False
+    )
+    room.broadcast(operation, except_consumer="consumer-2")
+    frames = [
+        consumer.write_operation.call_args.args[1]
+        for consumer in consumers[:2]
+    ]
+    assert frames[0] is frames[1]
+    assert frames[0].op == UpdateCellCodes.name
+    consumers[2].write_operation.assert_not_called()
+
+
+async def test_kernel_pools_filled_off_the_event_loop(tmp_path: Path) -> None:
+    notebook_path = tmp_path / "app.py"
+    notebook_path.write_text(
+        """
+import marimo
+app = marimo.App()
+
+@app.cell
+def __():
+    1
+    return ()
+"""
+    )
+    session_manager = SessionManager(
+        file_router=AppFileRouter.from_filename(
+            MarimoPath(str(notebook_path))
+        ),
+        mode=SessionMode.RUN,
+        development_mode=False,
+        quiet=True,
+        include_code=True,
+        lsp_server=MagicMock(),
+        user_config_manager=get_default_config_manager(current_path=None),
+        cli_args={},
+        auth_token=None,
+        redirect_console_to_browser=False,
+        ttl_seconds=None,
+        kernel_pool_size=2,
+    )
+
+    threads: list[threading.Thread] = []
+
+    def prewarm_session(*_args: Any) -> MagicMock:
+        threads.append(threading.current_thread())
+        session = MagicMock()
+        session.connection_state.return_value = ConnectionState.ORPHANED
+        session.kernel_manager.is_alive.return_value = True
+        session.app_file_manager.path = None
+        return session
+
+    session_manager._prewarm_session = prewarm_session  # type: ignore
+
+    # Filled at startup, before the first request
+    await session_manager.start_kernel_pools()
+    assert session_manager.kernel_pool_stats()["idle"] == 2
+
+    file_key = session_manager.file_router.get_unique_file_key()
+    assert file_key is not None
+    session = session_manager.create_session(
+        session_id="s1",
+        session_consumer=MagicMock(),
+        query_params={},
+        file_key=file_key,
+    )
+    session.start_heartbeat.assert_called_once()
+    assert session_manager.kernel_pool_stats()["hits"] == 1
+
+    # Replenished in the background
+    await asyncio.gather(*session_manager._kernel_pool_tasks)
+    assert session_manager.kernel_pool_stats()["idle"] == 2
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+    session_manager.shutdown()
+
+
+def test_kernel_pool_replenish_after_close() -> None:
+    create_session = MagicMock()
+    pool = KernelPool(create_session, size=1, ttl_seconds=None)
+    pool.close()
+    pool.replenish()
+    create_session.assert_not_called()
+    assert pool.idle == 0
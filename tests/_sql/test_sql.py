@@ -288,6 +288,63 @@ def test_applies_limit(mock_replace: MagicMock) -> None:
     assert table._searched_manager.get_num_rows() == 25_000
 
 
+@patch("marimo._sql.sql.replace")
+@pytest.mark.skipif(not HAS_POLARS and HAS_DUCKDB, reason="polars is required")
+def test_pushes_down_limit(mock_replace: MagicMock) -> None:
+    import duckdb
+
+    from marimo._sql.engines import DuckDBEngine
+
+    duckdb.sql("CREATE OR REPLACE TABLE t_limit AS SELECT * FROM range(1000)")
+    with patch.dict(os.environ, {"MARIMO_SQL_DEFAULT_LIMIT": "300"}):
+        execute = MagicMock(side_effect=DuckDBEngine.execute)
+        with patch.object(
+            DuckDBEngine,
+            "execute",
+            lambda self, *args, **kwargs: execute(self, *args, **kwargs),
+        ):
+            # One more row than the limit is fetched
+            assert len(sql("SELECT * FROM t_limit")) == 300
+            assert execute.call_args.kwargs == {"limit": 301}
+            table = mock_replace.call_args[0][0]
+            assert table._component_args["total-rows"] == "too_many"
+
+            # Exactly at the limit
+            assert len(sql("SELECT * FROM t_limit WHERE range < 300")) == 300
+            table = mock_replace.call_args[0][0]
+            assert table._component_args["total-rows"] == 300
+
+            # Not pushed down for statements other than SELECT
+            execute.reset_mock()
+            sql("CREATE OR REPLACE TABLE t_limit_2 AS SELECT 1")
+            assert execute.call_args.kwargs == {}
+
+            # Nor for a SELECT after other statements, which is truncated
+            # after it runs instead
+            execute.reset_mock()
+            result = sql(
+                "CREATE OR REPLACE TABLE t_limit_2 AS SELECT * FROM t_limit; "
+                "SELECT * FROM t_limit_2"
+            )
+            assert execute.call_args.kwargs == {}
+            assert len(result) == 300
+            table = mock_replace.call_args[0][0]
+            assert table._component_args["total-rows"] == "too_many"
+    duckdb.sql("DROP TABLE t_limit")
+    duckdb.sql("DROP TABLE t_limit_2")
+
+
+@pytest.mark.skipif(not HAS_SQLALCHEMY, reason="SQLAlchemy not installed")
+def test_pushes_down_limit_sqlalchemy(sqlite_engine: sa.Engine) -> None:
+    with patch.dict(os.environ, {"MARIMO_SQL_DEFAULT_LIMIT": "2"}):
+        result = sql(
+            "SELECT * FROM test ORDER BY id",
+            engine=sqlite_engine,
+            output=False,
+        )
+    assert len(result) == 2
+
+
 @pytest.mark.skipif(
     DependencyManager.duckdb.has(), reason="must be missing duckdb"
 )
@@ -426,6 +426,30 @@ def test_sqlalchemy_engine_execute(sqlite_engine: sa.Engine) -> None:
     assert len(result) == 4
 
 
+@pytest.mark.skipif(
+    not HAS_SQLALCHEMY or not HAS_POLARS,
+    reason="SQLAlchemy and Polars not installed",
+)
+def test_sqlalchemy_engine_execute_limit_and_batches(
+    sqlite_engine: sa.Engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test SQLAlchemyEngine execute with a limit and in batches."""
+    import marimo._sql.engines
+
+    engine = SQLAlchemyEngine(sqlite_engine)
+    result = engine.execute("SELECT * FROM test ORDER BY id", limit=2)
+    assert result["id"].to_list() == [1, 2]
+
+    monkeypatch.setattr(marimo._sql.engines, "SQL_FETCH_BATCH_SIZE", 3)
+    result = engine.execute("SELECT * FROM test ORDER BY id")
+    assert result.columns == ["id", "name"]
+    assert result["name"].to_list() == ["Alice", "Bob", "Charlie", "Rose"]
+
+    result = engine.execute("SELECT * FROM test WHERE id > 10")
+    assert result.columns == ["id", "name"]
+    assert len(result) == 0
+
+
 @pytest.mark.skipif(not HAS_SQLALCHEMY, reason="SQLAlchemy not installed")
 def test_sqlalchemy_get_database_name(sqlite_engine: sa.Engine) -> None:
     """Test SQLAlchemyEngine get_database_name."""
@@ -108,3 +108,22 @@ def test_queued_distributor() -> None:
     distributor.stop()
     thread.join(timeout=1.0)
     assert not thread.is_alive()
+
+
+@patch("asyncio.get_event_loop")
+def test_decode_bytes(mock_get_event_loop: Any) -> None:
+    mock_get_event_loop.return_value = MagicMock()
+
+    mock_connection = MagicMock()
+    distributor = ConnectionDistributor[str](
+        mock_connection, decode=lambda buf: buf.decode("utf-8")
+    )
+    mock_consumer = MagicMock()
+    distributor.add_consumer(mock_consumer)
+
+    mock_connection.recv_bytes.side_effect = [b"test message"]
+    mock_connection.poll.side_effect = [True, False]
+    distributor._on_change()
+
+    mock_consumer.assert_called_once_with("test message")
+    mock_connection.recv.assert_not_called()
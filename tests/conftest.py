@@ -51,6 +51,7 @@ class _MockStream(ThreadSafeStream):
     input_queue: None = None
     pipe: None = None
     redirect_console: bool = False
+    binary: bool = False
 
     messages: list[tuple[str, dict[Any, Any]]] = dataclasses.field(
         default_factory=list